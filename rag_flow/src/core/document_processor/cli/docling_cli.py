@@ -67,14 +67,9 @@ def cmd_parse_single(args):
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(result.text_content)
             elif args.format == 'json':
-                data = {
-                    'text_content': result.text_content,
-                    'metadata': result.metadata,
-                    'structured_data': result.structured_data,
-                    'structure_info': result.structure_info
-                }
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                # 直接写出序列化后的字节串，orjson可用时由其完成编码
+                with open(output_path, 'wb') as f:
+                    f.write(result.to_json(indent=True))
 
             logger.info(f"结果已保存到: {output_path}")
         else:
@@ -83,13 +78,7 @@ def cmd_parse_single(args):
                 print("\n=== 解析结果 ===")
                 print(result.text_content)
             elif args.format == 'json':
-                data = {
-                    'text_content': result.text_content,
-                    'metadata': result.metadata,
-                    'structured_data': result.structured_data,
-                    'structure_info': result.structure_info
-                }
-                print(json.dumps(data, indent=2, ensure_ascii=False))
+                print(result.to_json(indent=True).decode('utf-8'))
 
         # 显示统计信息
         if args.stats:
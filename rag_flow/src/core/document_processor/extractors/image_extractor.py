@@ -9,6 +9,10 @@
 from typing import Dict, List, Optional, Any, Tuple
 import base64
 import hashlib
+import os
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -23,7 +27,7 @@ except ImportError:
 import io
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
     """图像信息数据类"""
     image_id: str
@@ -38,7 +42,7 @@ class ImageInfo:
     has_transparency: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedImage:
     """处理后的图像数据类"""
     info: ImageInfo
@@ -50,6 +54,46 @@ class ProcessedImage:
     quality_score: float = 0.0
 
 
+def _make_image_info(image_id: str, page_number: Optional[int],
+                     bbox: Optional[Tuple[float, float, float, float]],
+                     width: Optional[int], height: Optional[int],
+                     format: Optional[str], size_bytes: Optional[int]) -> ImageInfo:
+    """
+    批量提取热路径上的ImageInfo快速构建函数
+
+    绕过dataclass生成的__init__直接为slots赋值，公共API仍应使用常规构造函数。
+    """
+    info = ImageInfo.__new__(ImageInfo)
+    info.image_id = image_id
+    info.page_number = page_number
+    info.bbox = bbox
+    info.width = width
+    info.height = height
+    info.format = format
+    info.size_bytes = size_bytes
+    info.dpi = None
+    info.color_mode = None
+    info.has_transparency = False
+    return info
+
+
+def _make_processed_image(info: ImageInfo, metadata: Dict[str, Any]) -> ProcessedImage:
+    """
+    批量提取热路径上的ProcessedImage快速构建函数
+
+    绕过dataclass生成的__init__直接为slots赋值，公共API仍应使用常规构造函数。
+    """
+    processed_image = ProcessedImage.__new__(ProcessedImage)
+    processed_image.info = info
+    processed_image.image_data = None
+    processed_image.base64_data = None
+    processed_image.thumbnail_data = None
+    processed_image.extracted_text = None
+    processed_image.metadata = metadata
+    processed_image.quality_score = 0.0
+    return processed_image
+
+
 class ImageExtractor:
     """
     图像提取器
@@ -69,22 +113,41 @@ class ImageExtractor:
         
         Args:
             config (dict, optional): 配置参数
-                - extract_image_data (bool): 是否提取图像数据，默认True
+                - include_bytes (bool): 是否保留图像二进制数据，默认True
+                - include_base64 (bool): 是否生成Base64编码数据，默认False
+                - extract_image_data (bool): 已弃用，设置后同时控制include_bytes和include_base64
                 - generate_thumbnails (bool): 是否生成缩略图，默认False
                 - thumbnail_size (tuple): 缩略图尺寸，默认(150, 150)
                 - extract_text_from_images (bool): 是否从图像提取文本，默认False
                 - supported_formats (list): 支持的图像格式，默认['png', 'jpg', 'jpeg', 'gif', 'bmp']
+                - enable_phash_dedup (bool): 是否基于感知哈希跳过近似重复图像的处理，默认False
+                - phash_threshold (int): 判定近似重复的汉明距离阈值，默认8
+                - phash_cache_size (int): 感知哈希缓存保留的最近图像数，默认256
+                - max_workers (int): 批量处理的线程数，默认os.cpu_count()
         """
         self.config = config or {}
         self.logger = logger
         
         # 配置参数
-        self.extract_image_data = self.config.get('extract_image_data', True)
+        self.include_bytes = self.config.get('include_bytes', True)
+        self.include_base64 = self.config.get('include_base64', False)
+        if 'extract_image_data' in self.config:
+            # 兼容旧配置：extract_image_data同时控制二进制和Base64数据
+            self.logger.warning("extract_image_data配置已弃用，请使用include_bytes和include_base64")
+            self.include_bytes = self.include_base64 = self.config['extract_image_data']
         self.generate_thumbnails = self.config.get('generate_thumbnails', False)
         self.thumbnail_size = self.config.get('thumbnail_size', (150, 150))
         self.extract_text_from_images = self.config.get('extract_text_from_images', False)
         self.supported_formats = self.config.get('supported_formats', 
                                                 ['png', 'jpg', 'jpeg', 'gif', 'bmp'])
+        self.enable_phash_dedup = self.config.get('enable_phash_dedup', False)
+        self.phash_threshold = self.config.get('phash_threshold', 8)
+        self.phash_cache_size = self.config.get('phash_cache_size', 256)
+        self.max_workers = self.config.get('max_workers') or os.cpu_count()
+        
+        # 感知哈希 -> 已处理图像，用于跳过近似重复图像；按LRU淘汰，每批图像开始时清空
+        self._phash_cache: 'OrderedDict[int, ProcessedImage]' = OrderedDict()
+        self._phash_lock = threading.Lock()
         
         # 尝试导入可选依赖
         self.pil_available = self._check_pil_availability()
@@ -109,30 +172,35 @@ class ImageExtractor:
             image_id = self._generate_image_id(image_data)
             
             # 创建图像信息对象
-            info = ImageInfo(
-                image_id=image_id,
-                page_number=page_number,
-                bbox=image_info.get('bbox'),
-                width=image_info.get('width'),
-                height=image_info.get('height'),
-                format=image_info.get('ext', '').lower(),
-                size_bytes=len(image_data)
+            info = _make_image_info(
+                image_id,
+                page_number,
+                image_info.get('bbox'),
+                image_info.get('width'),
+                image_info.get('height'),
+                image_info.get('ext', '').lower(),
+                len(image_data)
             )
             
             # 分析图像详细信息
             if self.pil_available:
                 self._analyze_image_with_pil(image_data, info)
             
+            # 近似重复检测：命中时复用已处理图像的结果
+            phash = None
+            if self.enable_phash_dedup and self.pil_available:
+                phash = self._compute_phash(image_data)
+                if phash is not None:
+                    duplicate = self._find_similar_image(phash)
+                    if duplicate is not None:
+                        return self._reuse_processed_image(duplicate, info, image_data, image_info)
+            
             # 创建处理结果对象
-            processed_image = ProcessedImage(
-                info=info,
-                metadata=self._generate_image_metadata(info, image_info)
-            )
+            processed_image = _make_processed_image(
+                info, self._generate_image_metadata(info, image_info))
             
             # 提取图像数据
-            if self.extract_image_data:
-                processed_image.image_data = image_data
-                processed_image.base64_data = base64.b64encode(image_data).decode('utf-8')
+            self._attach_image_data(processed_image, image_data)
             
             # 生成缩略图
             if self.generate_thumbnails and self.pil_available:
@@ -145,6 +213,12 @@ class ImageExtractor:
             # 计算质量评分
             processed_image.quality_score = self._calculate_image_quality(processed_image)
             
+            if phash is not None:
+                with self._phash_lock:
+                    self._phash_cache[phash] = processed_image
+                    if len(self._phash_cache) > self.phash_cache_size:
+                        self._phash_cache.popitem(last=False)
+            
             return processed_image
             
         except Exception as e:
@@ -155,6 +229,33 @@ class ImageExtractor:
                 metadata={'error': str(e)}
             )
     
+    def process_images(self, items: List[Tuple[bytes, Dict[str, Any], Optional[int]]]) -> List[ProcessedImage]:
+        """
+        并行批量处理图像
+        
+        PIL解码/缩放和hashlib摘要计算在C扩展中执行时会释放GIL，
+        因此使用线程池即可获得接近线性的多核加速，且无需复制图像数据。
+        
+        Args:
+            items: (图像数据, 图像信息, 页面编号) 元组列表
+            
+        Returns:
+            List[ProcessedImage]: 处理后的图像列表，顺序与输入一致
+        """
+        # 近似重复检测只在同一批（同一文档）图像之间进行
+        self.clear_phash_cache()
+        
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [self.process_image(*item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda item: self.process_image(*item), items))
+    
+    def clear_phash_cache(self):
+        """清空近似重复检测使用的感知哈希缓存"""
+        with self._phash_lock:
+            self._phash_cache.clear()
+    
     def _generate_image_id(self, image_data: bytes) -> str:
         """
         生成图像唯一标识
@@ -172,6 +273,106 @@ class ImageExtractor:
             self.logger.warning(f"图像ID生成失败: {e}")
             return f"img_unknown_{id(image_data)}"
     
+    def _compute_phash(self, image_data: bytes) -> Optional[int]:
+        """
+        计算图像的64位感知哈希（差值哈希dHash）
+        
+        Args:
+            image_data: 图像数据
+            
+        Returns:
+            int: 64位哈希值，失败返回None
+        """
+        try:
+            from PIL import Image
+            
+            with Image.open(io.BytesIO(image_data)) as img:
+                pixels = list(img.convert('L').resize((9, 8), Image.Resampling.LANCZOS).getdata())
+            
+            phash = 0
+            for row in range(8):
+                offset = row * 9
+                for col in range(8):
+                    phash = (phash << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+            return phash
+            
+        except Exception as e:
+            self.logger.warning(f"感知哈希计算失败: {e}")
+            return None
+    
+    def _find_similar_image(self, phash: int) -> Optional[ProcessedImage]:
+        """
+        查找感知哈希相近的已处理图像
+        
+        Args:
+            phash: 感知哈希值
+            
+        Returns:
+            ProcessedImage: 近似重复的已处理图像，未找到返回None
+        """
+        with self._phash_lock:
+            cached = self._phash_cache.get(phash)
+            if cached is not None:
+                self._phash_cache.move_to_end(phash)
+                return cached
+            candidates = list(self._phash_cache.items())
+        
+        # 在锁外线性扫描快照，不阻塞其他线程写入缓存
+        for seen, processed_image in candidates:
+            if (seen ^ phash).bit_count() < self.phash_threshold:
+                return processed_image
+        return None
+    
+    def _reuse_processed_image(self, duplicate: ProcessedImage, info: ImageInfo,
+                               image_data: bytes,
+                               image_info: Dict[str, Any]) -> ProcessedImage:
+        """
+        基于近似重复图像构建处理结果，跳过缩略图和质量评估
+        
+        OCR文本只在两幅图像字节完全相同时复用，感知哈希相近但内容不同的图像
+        （如仅文字不同的截图）仍单独识别。
+        
+        Args:
+            duplicate: 已处理的近似重复图像
+            info: 当前图像信息对象
+            image_data: 当前图像数据
+            image_info: 当前图像原始信息
+            
+        Returns:
+            ProcessedImage: 处理后的图像对象
+        """
+        metadata = self._generate_image_metadata(info, image_info)
+        metadata['duplicate_of'] = duplicate.info.image_id
+        
+        processed_image = ProcessedImage(
+            info=info,
+            thumbnail_data=duplicate.thumbnail_data,
+            metadata=metadata,
+            quality_score=duplicate.quality_score
+        )
+        self._attach_image_data(processed_image, image_data)
+        
+        # 图像ID由内容摘要生成，相同说明字节完全一致
+        if duplicate.info.image_id == info.image_id and duplicate.info.size_bytes == info.size_bytes:
+            processed_image.extracted_text = duplicate.extracted_text
+        elif self.extract_text_from_images and self.ocr_available:
+            processed_image.extracted_text = self._extract_text_from_image(image_data)
+        
+        return processed_image
+    
+    def _attach_image_data(self, processed_image: ProcessedImage, image_data: bytes) -> None:
+        """
+        按配置附加图像二进制数据和Base64编码数据
+        
+        Args:
+            processed_image: 处理后的图像对象（会被修改）
+            image_data: 图像数据
+        """
+        if self.include_bytes:
+            processed_image.image_data = image_data
+        if self.include_base64:
+            processed_image.base64_data = base64.b64encode(image_data).decode('ascii')
+    
     def _check_pil_availability(self) -> bool:
         """
         检查PIL/Pillow是否可用
@@ -421,26 +622,29 @@ class ImageExtractor:
                 return {}
             
             total_images = len(processed_images)
-            total_size = sum(img.info.size_bytes or 0 for img in processed_images)
             
-            # 格式分布
-            format_counts = {}
+            # 单次遍历汇总大小、格式分布、尺寸和质量
+            total_size = 0
+            format_counts = Counter()
+            widths = []
+            heights = []
+            quality_scores = []
             for img in processed_images:
-                fmt = img.info.format or 'unknown'
-                format_counts[fmt] = format_counts.get(fmt, 0) + 1
-            
-            # 尺寸统计
-            widths = [img.info.width for img in processed_images if img.info.width]
-            heights = [img.info.height for img in processed_images if img.info.height]
-            
-            # 质量统计
-            quality_scores = [img.quality_score for img in processed_images]
+                info = img.info
+                if info.size_bytes:
+                    total_size += info.size_bytes
+                format_counts[info.format or 'unknown'] += 1
+                if info.width:
+                    widths.append(info.width)
+                if info.height:
+                    heights.append(info.height)
+                quality_scores.append(img.quality_score)
             
             summary = {
                 'total_images': total_images,
                 'total_size_bytes': total_size,
                 'total_size_mb': round(total_size / (1024 * 1024), 2),
-                'format_distribution': format_counts,
+                'format_distribution': dict(format_counts),
                 'size_statistics': {
                     'avg_width': round(sum(widths) / len(widths), 1) if widths else None,
                     'avg_height': round(sum(heights) / len(heights), 1) if heights else None,
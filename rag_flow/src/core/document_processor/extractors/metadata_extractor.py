@@ -6,12 +6,14 @@
 版本: v1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Iterable
 from pathlib import Path
 from datetime import datetime
 import hashlib
 import mimetypes
+from stat import S_ISDIR, S_ISREG
 from dataclasses import dataclass
+from functools import lru_cache
 
 # 导入统一日志管理器
 try:
@@ -22,6 +24,87 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# str.splitlines()识别的换行符
+_LINE_BREAKS = frozenset('\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029')
+
+# 模块加载时一次性初始化MIME数据库，避免首次调用时的延迟
+mimetypes.init()
+
+
+@lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> Optional[str]:
+    """
+    根据扩展名获取MIME类型（带缓存）
+
+    Args:
+        ext: 小写文件扩展名（含点号）
+
+    Returns:
+        str: MIME类型，无法识别返回None
+    """
+    return mimetypes.guess_type(f"file{ext}")[0] if ext else None
+
+
+# 文本长度达到该值时才使用Numba编译的计数内核，避免小文本承担编译开销
+_NUMBA_MIN_LENGTH = 100_000
+
+# Numba计数内核，首次使用时延迟加载；False表示Numba不可用
+_cjk_kernel = None
+
+
+def _get_cjk_kernel():
+    """
+    延迟加载Numba编译的中文字符计数内核
+
+    Returns:
+        callable: 计数内核，Numba不可用时返回None
+    """
+    global _cjk_kernel
+    if _cjk_kernel is None:
+        try:
+            from numba import njit
+
+            @njit(cache=True, boundscheck=False)
+            def _count_cjk(codes):
+                count = 0
+                for i in range(codes.size):
+                    value = codes[i]
+                    if 0x4E00 <= value <= 0x9FFF:
+                        count += 1
+                return count
+
+            _cjk_kernel = _count_cjk
+        except ImportError:
+            _cjk_kernel = False
+    return _cjk_kernel or None
+
+
+def _count_chinese_chars(text: str) -> int:
+    """
+    统计文本中的中文字符数（CJK统一汉字基本区）
+
+    Args:
+        text: 文本内容
+
+    Returns:
+        int: 中文字符数
+    """
+    if NUMPY_AVAILABLE:
+        # PDF提取的文本可能含孤立代理项，surrogatepass按码位原样编码而不抛出异常
+        codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        if len(text) >= _NUMBA_MIN_LENGTH:
+            kernel = _get_cjk_kernel()
+            if kernel is not None:
+                return int(kernel(codes))
+        return int(np.count_nonzero((codes >= 0x4E00) & (codes <= 0x9FFF)))
+    return sum(1 for char in text if '\u4e00' <= char <= '\u9fff')
+
 
 @dataclass
 class StandardMetadata:
@@ -85,25 +168,27 @@ class MetadataExtractor:
         try:
             file_path = Path(file_path)
             
-            if not file_path.exists():
+            # 单次stat同时检查存在性并读取文件信息
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
                 raise FileNotFoundError(f"文件不存在: {file_path}")
-            
-            stat = file_path.stat()
+            extension = file_path.suffix.lower()
             
             metadata = {
                 'file_name': file_path.name,
                 'file_stem': file_path.stem,
-                'file_extension': file_path.suffix.lower(),
+                'file_extension': extension,
                 'file_size': stat.st_size,
                 'file_size_mb': round(stat.st_size / (1024 * 1024), 2),
                 'created_time': datetime.fromtimestamp(stat.st_ctime),
                 'modified_time': datetime.fromtimestamp(stat.st_mtime),
                 'accessed_time': datetime.fromtimestamp(stat.st_atime),
-                'is_file': file_path.is_file(),
-                'is_directory': file_path.is_dir(),
+                'is_file': S_ISREG(stat.st_mode),
+                'is_directory': S_ISDIR(stat.st_mode),
                 'absolute_path': str(file_path.absolute()),
                 'parent_directory': str(file_path.parent),
-                'mime_type': mimetypes.guess_type(str(file_path))[0]
+                'mime_type': _mime_for_ext(extension) or mimetypes.guess_type(str(file_path))[0]
             }
             
             # 计算文件哈希
@@ -174,51 +259,167 @@ class MetadataExtractor:
                 return {}
             
             # 基本统计
+            words = text_content.split()
             char_count = len(text_content)
-            char_count_no_spaces = len(text_content.replace(' ', ''))
-            word_count = len(text_content.split())
-            line_count = len(text_content.splitlines())
-            paragraph_count = len([p for p in text_content.split('\n\n') if p.strip()])
-            
-            # 语言特征分析
-            chinese_char_count = sum(1 for char in text_content if '\u4e00' <= char <= '\u9fff')
-            english_word_count = sum(1 for word in text_content.split() 
-                                   if word.isascii() and word.isalpha())
-            
-            # 计算语言比例
-            chinese_ratio = chinese_char_count / char_count if char_count > 0 else 0
-            english_ratio = english_word_count / word_count if word_count > 0 else 0
-            
-            # 推测主要语言
-            primary_language = "unknown"
-            if chinese_ratio > 0.3:
-                primary_language = "chinese"
-            elif english_ratio > 0.5:
-                primary_language = "english"
-            elif chinese_ratio > 0.1 and english_ratio > 0.2:
-                primary_language = "mixed"
-            
-            statistics = {
-                'character_count': char_count,
-                'character_count_no_spaces': char_count_no_spaces,
-                'word_count': word_count,
-                'line_count': line_count,
-                'paragraph_count': paragraph_count,
-                'chinese_character_count': chinese_char_count,
-                'english_word_count': english_word_count,
-                'chinese_ratio': round(chinese_ratio, 3),
-                'english_ratio': round(english_ratio, 3),
-                'primary_language': primary_language,
-                'average_word_length': round(char_count_no_spaces / word_count, 2) if word_count > 0 else 0,
-                'average_sentence_length': round(word_count / line_count, 2) if line_count > 0 else 0
+            counts = {
+                'char_count': char_count,
+                'char_count_no_spaces': char_count - text_content.count(' '),
+                'word_count': len(words),
+                'line_count': len(text_content.splitlines()),
+                'paragraph_count': len([p for p in text_content.split('\n\n') if p.strip()]),
+                'chinese_char_count': _count_chinese_chars(text_content),
+                'english_word_count': sum(1 for word in words if word.isascii() and word.isalpha())
             }
             
-            return statistics
+            return self._build_content_statistics(counts)
             
         except Exception as e:
             self.logger.error(f"内容统计提取失败: {e}")
             return {}
     
+    def extract_content_statistics_stream(self, chunks: Iterable[str]) -> Dict[str, Any]:
+        """
+        以流式方式提取内容统计信息
+        
+        逐块计数，只在块之间保留跨边界的单词、换行和段落状态，结果与
+        extract_content_statistics 对拼接后的完整文本的统计一致，
+        适用于调用方本身按块产出文本（如逐页解析）的场景。
+        
+        Args:
+            chunks (Iterable[str]): 按顺序产出的文本块
+            
+        Returns:
+            dict: 内容统计信息
+        """
+        try:
+            counts = dict.fromkeys(
+                ('char_count', 'char_count_no_spaces', 'word_count', 'line_count',
+                 'paragraph_count', 'chinese_char_count', 'english_word_count'), 0)
+            
+            # 跨块边界的状态：未结束的单词片段、上一块末尾的字符、
+            # 未配对的换行符以及当前段落是否含非空白内容
+            word_parts: List[str] = []
+            last_char = ''
+            pending_newline = False
+            paragraph_has_content = False
+            
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                
+                counts['char_count'] += len(chunk)
+                counts['char_count_no_spaces'] += len(chunk) - chunk.count(' ')
+                counts['chinese_char_count'] += _count_chinese_chars(chunk)
+                
+                # 单词：上一块末尾的片段与本块开头的片段属于同一个单词
+                words = chunk.split()
+                if word_parts:
+                    if chunk[0].isspace():
+                        self._count_word(counts, ''.join(word_parts))
+                        word_parts = []
+                    elif len(words) == 1 and not chunk[-1].isspace():
+                        word_parts.append(words[0])
+                        words = []
+                    else:
+                        word_parts.append(words[0])
+                        words[0] = ''.join(word_parts)
+                        word_parts = []
+                if words and not chunk[-1].isspace():
+                    word_parts.append(words.pop())
+                for word in words:
+                    self._count_word(counts, word)
+                
+                # 行数：统计换行符个数，跨块的'\r\n'只计一次
+                line_breaks = len(chunk.splitlines()) - (chunk[-1] not in _LINE_BREAKS)
+                if last_char == '\r' and chunk[0] == '\n':
+                    line_breaks -= 1
+                counts['line_count'] += line_breaks
+                last_char = chunk[-1]
+                
+                # 段落：按'\n\n'从左到右切分，上一块末尾未配对的换行符并入本块开头
+                parts = (('\n' + chunk) if pending_newline else chunk).split('\n\n')
+                pending_newline = parts[-1].endswith('\n')
+                paragraph_has_content = paragraph_has_content or bool(parts[0].strip())
+                if len(parts) > 1:
+                    counts['paragraph_count'] += paragraph_has_content
+                    counts['paragraph_count'] += sum(1 for part in parts[1:-1] if part.strip())
+                    paragraph_has_content = bool(parts[-1].strip())
+            
+            if counts['char_count'] == 0:
+                return {}
+            
+            if word_parts:
+                self._count_word(counts, ''.join(word_parts))
+            if last_char not in _LINE_BREAKS:
+                counts['line_count'] += 1
+            counts['paragraph_count'] += paragraph_has_content
+            
+            return self._build_content_statistics(counts)
+            
+        except Exception as e:
+            self.logger.error(f"流式内容统计提取失败: {e}")
+            return {}
+    
+    @staticmethod
+    def _count_word(counts: Dict[str, int], word: str) -> None:
+        """
+        累加单个完整单词的计数
+        
+        Args:
+            counts: 计数字典（会被修改）
+            word: 单词
+        """
+        counts['word_count'] += 1
+        if word.isascii() and word.isalpha():
+            counts['english_word_count'] += 1
+    
+    def _build_content_statistics(self, counts: Dict[str, int]) -> Dict[str, Any]:
+        """
+        根据基础计数生成内容统计信息
+        
+        Args:
+            counts: 基础计数字典
+            
+        Returns:
+            dict: 内容统计信息
+        """
+        char_count = counts['char_count']
+        char_count_no_spaces = counts['char_count_no_spaces']
+        word_count = counts['word_count']
+        line_count = counts['line_count']
+        chinese_char_count = counts['chinese_char_count']
+        english_word_count = counts['english_word_count']
+        
+        # 计算语言比例
+        chinese_ratio = chinese_char_count / char_count if char_count > 0 else 0
+        english_ratio = english_word_count / word_count if word_count > 0 else 0
+        
+        # 推测主要语言
+        primary_language = "unknown"
+        if chinese_ratio > 0.3:
+            primary_language = "chinese"
+        elif english_ratio > 0.5:
+            primary_language = "english"
+        elif chinese_ratio > 0.1 and english_ratio > 0.2:
+            primary_language = "mixed"
+        
+        statistics = {
+            'character_count': char_count,
+            'character_count_no_spaces': char_count_no_spaces,
+            'word_count': word_count,
+            'line_count': line_count,
+            'paragraph_count': counts['paragraph_count'],
+            'chinese_character_count': chinese_char_count,
+            'english_word_count': english_word_count,
+            'chinese_ratio': round(chinese_ratio, 3),
+            'english_ratio': round(english_ratio, 3),
+            'primary_language': primary_language,
+            'average_word_length': round(char_count_no_spaces / word_count, 2) if word_count > 0 else 0,
+            'average_sentence_length': round(word_count / line_count, 2) if line_count > 0 else 0
+        }
+        
+        return statistics
+    
     def enhance_metadata(self, base_metadata: Dict[str, Any], 
                         file_path: str, 
                         text_content: Optional[str] = None) -> Dict[str, Any]:
@@ -261,8 +462,7 @@ class MetadataExtractor:
             
             # 添加内容统计
             if text_content and self.extract_content_stats:
-                content_stats = self.extract_content_statistics(text_content)
-                enhanced_metadata['content_statistics'] = content_stats
+                enhanced_metadata['content_statistics'] = self.extract_content_statistics(text_content)
             
             # 添加处理时间戳
             enhanced_metadata['processing_timestamp'] = datetime.now().isoformat()
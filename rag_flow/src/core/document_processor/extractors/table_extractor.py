@@ -6,9 +6,12 @@
 版本: v1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 import re
+import sys
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 
 # 导入统一日志管理器
 try:
@@ -19,6 +22,212 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 预编译的正则表达式
+_NUM_RE = re.compile(r'^-?\d+\.?\d*$')
+_PCT_RE = re.compile(r'^-?\d+\.?\d*%$')
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4}')
+_WS_RE = re.compile(r'\s+')
+
+# 长度小于该值的单元格内容会被驻留（sys.intern），以便重复值共享同一对象
+_INTERN_MAX_LENGTH = 64
+
+# 数据类型与单字节编码的映射
+_DATA_TYPE_NAMES = ('empty', 'text', 'number', 'percentage', 'date', 'formula')
+_DATA_TYPE_CODES = {name: code for code, name in enumerate(_DATA_TYPE_NAMES)}
+_EMPTY_CODE = _DATA_TYPE_CODES['empty']
+
+# 单元格数达到该值时才基于类型编码矩阵统计列数据类型（Numba内核或NumPy），
+# 避免小表格承担编译和数组构建开销
+_NUMBA_MIN_CELLS = 10_000
+
+# Numba列统计内核，首次使用时延迟加载；False表示Numba不可用
+_column_type_kernel = None
+
+
+def _get_column_type_kernel():
+    """
+    延迟加载Numba编译的列数据类型统计内核
+
+    内核输入为(rows, cols)的uint8类型编码矩阵，返回每列的主导类型编码
+    （全部行，出现次数相同时取最先出现者）和一致性评分（跳过首行）。
+
+    Returns:
+        callable: 统计内核，Numba或NumPy不可用时返回None
+    """
+    global _column_type_kernel
+    if _column_type_kernel is None:
+        try:
+            if not NUMPY_AVAILABLE:
+                raise ImportError("numpy不可用")
+            from numba import njit
+
+            @njit(cache=True)
+            def _column_types(codes, n_types):
+                rows, cols = codes.shape
+                dominant = np.zeros(cols, dtype=np.int64)
+                consistency = np.ones(cols, dtype=np.float64)
+                counts = np.zeros(n_types, dtype=np.int64)
+                first_seen = np.zeros(n_types, dtype=np.int64)
+                for j in range(cols):
+                    counts[:] = 0
+                    first_seen[:] = rows
+                    for i in range(rows):
+                        code = codes[i, j]
+                        if code == 0:
+                            continue
+                        if i > 0:
+                            counts[code] += 1
+                        if first_seen[code] == rows:
+                            first_seen[code] = i
+                    
+                    # 一致性评分（跳过首行）
+                    body_total = 0
+                    body_max = 0
+                    for t in range(1, n_types):
+                        body_total += counts[t]
+                        if counts[t] > body_max:
+                            body_max = counts[t]
+                    if body_total > 0:
+                        consistency[j] = body_max / body_total
+                    
+                    # 主导类型（包含首行）
+                    if rows > 0 and codes[0, j] != 0:
+                        counts[codes[0, j]] += 1
+                    best = 0
+                    best_count = 0
+                    for t in range(1, n_types):
+                        if counts[t] > best_count or (
+                                counts[t] == best_count and counts[t] > 0
+                                and first_seen[t] < first_seen[best]):
+                            best = t
+                            best_count = counts[t]
+                    dominant[j] = best
+                return dominant, consistency
+
+            _column_type_kernel = _column_types
+        except ImportError:
+            _column_type_kernel = False
+    return _column_type_kernel or None
+
+
+def _column_type_stats_numpy(codes: Any) -> Tuple[List[int], List[float]]:
+    """
+    基于NumPy bincount的列数据类型统计，Numba不可用时使用
+
+    Args:
+        codes: (rows, cols)的uint8类型编码矩阵
+
+    Returns:
+        tuple: 每列主导类型编码列表、每列一致性评分列表（跳过首行）
+    """
+    n_types = len(_DATA_TYPE_NAMES)
+    dominant = []
+    consistency = []
+    for col in codes.T:
+        body_counts = np.bincount(col[1:], minlength=n_types)
+        body_counts[_EMPTY_CODE] = 0
+        body_total = int(body_counts.sum())
+        consistency.append(int(body_counts.max()) / body_total if body_total else 1.0)
+        
+        counts = body_counts
+        if len(col):
+            counts[col[0]] += 1
+            counts[_EMPTY_CODE] = 0
+        best_count = counts.max()
+        if not best_count:
+            dominant.append(_EMPTY_CODE)
+            continue
+        candidates = np.flatnonzero(counts == best_count)
+        if len(candidates) > 1:
+            # 出现次数相同时取最先出现的类型
+            candidates = candidates[np.argsort([np.argmax(col == code) for code in candidates])]
+        dominant.append(int(candidates[0]))
+    return dominant, consistency
+
+
+def _column_type_stats(codes: Any) -> Tuple[List[int], List[float]]:
+    """
+    统计每列的主导类型编码和一致性评分，优先使用Numba内核
+
+    Args:
+        codes: (rows, cols)的uint8类型编码矩阵
+
+    Returns:
+        tuple: 每列主导类型编码列表、每列一致性评分列表（跳过首行）
+    """
+    kernel = _get_column_type_kernel()
+    if kernel is None:
+        return _column_type_stats_numpy(codes)
+    dominant, consistency = kernel(codes, len(_DATA_TYPE_NAMES))
+    return dominant.tolist(), consistency.tolist()
+
+
+def _classify_value(cell_value: str) -> str:
+    """
+    对已去除首尾空白的单元格值进行数据类型分类
+
+    Args:
+        cell_value: 已strip的单元格值
+
+    Returns:
+        str: 数据类型
+    """
+    if not cell_value:
+        return 'empty'
+    
+    # 数字和百分比必须以（可选负号加）数字开头；常见的纯数字形式
+    # 直接用str.isdecimal判断（与正则中的\d等价），其余情况再交给正则
+    body = cell_value[1:] if cell_value[0] == '-' else cell_value
+    if body[:1].isdecimal():
+        is_percentage = body[-1] == '%'
+        integer_part, _, fraction_part = (body[:-1] if is_percentage else body).partition('.')
+        if integer_part.isdecimal() and (not fraction_part or fraction_part.isdecimal()):
+            return 'percentage' if is_percentage else 'number'
+        
+        # 检测数字
+        if _NUM_RE.match(cell_value):
+            return 'number'
+        
+        # 检测百分比
+        if _PCT_RE.match(cell_value):
+            return 'percentage'
+    
+    # 检测日期（所有日期格式至少10个字符）
+    if len(cell_value) >= 10 and _DATE_RE.match(cell_value):
+        return 'date'
+    
+    # 检测公式（Excel格式）
+    if cell_value[0] == '=':
+        return 'formula'
+    
+    return 'text'
+
+
+# 短值（代码、数字、日期等）重复率高，按值缓存分类结果；与驻留阈值一致，
+# 长文本单元格几乎不会再次命中，直接分类以免缓存长期持有大字符串
+_classify_short = lru_cache(maxsize=65536)(_classify_value)
+
+
+def _classify(cell_value: str) -> str:
+    """
+    对已去除首尾空白的单元格值进行数据类型分类，仅缓存短值
+
+    Args:
+        cell_value: 已strip的单元格值
+
+    Returns:
+        str: 数据类型
+    """
+    if len(cell_value) < _INTERN_MAX_LENGTH:
+        return _classify_short(cell_value)
+    return _classify_value(cell_value)
+
 
 @dataclass
 class TableCell:
@@ -31,6 +240,41 @@ class TableCell:
     data_type: str = "text"  # text, number, date, formula
 
 
+@dataclass
+class CellColumns:
+    """
+    列式存储的单元格集合
+    
+    仅引用表格行数据并保存逐单元格的数据类型编码，行列号和表头标记由下标推算，
+    仅在按下标访问或迭代时才生成TableCell对象。
+    """
+    rows: List[List[str]]
+    data_types: bytearray
+    n_cols: int
+    has_header: bool = False
+    
+    def __len__(self) -> int:
+        return len(self.data_types)
+    
+    def __getitem__(self, index: int) -> TableCell:
+        if index < 0:
+            index += len(self.data_types)
+        if not 0 <= index < len(self.data_types):
+            raise IndexError("单元格下标越界")
+        row, column = divmod(index, self.n_cols)
+        return TableCell(
+            value=self.rows[row][column],
+            row=row,
+            column=column,
+            is_header=(row == 0 and self.has_header),
+            data_type=_DATA_TYPE_NAMES[self.data_types[index]]
+        )
+    
+    def __iter__(self) -> Iterator[TableCell]:
+        for index in range(len(self.data_types)):
+            yield self[index]
+
+
 @dataclass
 class TableStructure:
     """表格结构数据类"""
@@ -39,7 +283,20 @@ class TableStructure:
     has_header: bool
     header_row: Optional[List[str]] = None
     data_rows: List[List[str]] = None
-    cells: List[TableCell] = None
+    cells: Optional[CellColumns] = None
+
+
+@dataclass
+class TableScan:
+    """表格单次扫描结果数据类"""
+    has_header: bool
+    cells: CellColumns
+    non_empty_cells: int
+    type_counts: Counter
+    column_dominant_types: List[str]
+    column_consistency: List[float]  # 不含首行
+    column_non_empty: List[int]
+    column_unique: List[set]
 
 
 @dataclass
@@ -74,6 +331,7 @@ class TableExtractor:
                 - clean_empty_rows (bool): 清理空行，默认True
                 - clean_empty_columns (bool): 清理空列，默认True
                 - min_table_size (tuple): 最小表格尺寸(rows, cols)，默认(2, 2)
+                - emit_cells (bool): 是否在表格结构中提供单元格集合，默认False
         """
         self.config = config or {}
         self.logger = logger
@@ -83,6 +341,7 @@ class TableExtractor:
         self.clean_empty_rows = self.config.get('clean_empty_rows', True)
         self.clean_empty_columns = self.config.get('clean_empty_columns', True)
         self.min_table_size = self.config.get('min_table_size', (2, 2))
+        self.emit_cells = self.config.get('emit_cells', False)
     
     def process_table(self, table_data: List[List[str]], 
                      table_metadata: Optional[Dict[str, Any]] = None) -> ProcessedTable:
@@ -107,14 +366,21 @@ class TableExtractor:
             if not self._validate_table_size(cleaned_data):
                 raise ValueError(f"表格尺寸不符合最小要求: {self.min_table_size}")
             
+            # 检测表头
+            has_header = (self.auto_detect_header and len(cleaned_data) > 1
+                          and self._detect_header_row(cleaned_data))
+            
+            # 单次遍历完成单元格分类与统计
+            scan = self._scan_table(cleaned_data, has_header)
+            
             # 分析表格结构
-            structure = self._analyze_table_structure(cleaned_data)
+            structure = self._analyze_table_structure(cleaned_data, scan)
             
             # 生成表格元数据
-            metadata = self._generate_table_metadata(cleaned_data, table_metadata or {})
+            metadata = self._generate_table_metadata(cleaned_data, table_metadata or {}, scan)
             
             # 计算质量评分
-            quality_score = self._calculate_quality_score(cleaned_data, structure)
+            quality_score = self._calculate_quality_score(cleaned_data, structure, scan)
             
             # 格式化为文本
             formatted_text = self._format_table_as_text(cleaned_data, structure)
@@ -142,23 +408,27 @@ class TableExtractor:
             list: 清洗后的表格数据
         """
         try:
-            cleaned_data = []
-            
             # 标准化行长度
-            max_cols = max(len(row) for row in table_data) if table_data else 0
+            max_cols = max(map(len, table_data), default=0)
+            
+            # 清理单元格内容并补齐行长度：map(str, row)在入口处统一转换类型
+            # （对str对象直接返回自身），之后直接压缩空白，不再逐单元格调用方法；
+            # 短字符串被驻留，分类型列中的重复值共享同一对象
+            sub = _WS_RE.sub
+            intern = sys.intern
+            cleaned_data = [
+                [intern(cell) if len(cell) < _INTERN_MAX_LENGTH else cell
+                 for cell in (sub(' ', raw.strip()) for raw in map(str, row))]
+                + [''] * (max_cols - len(row))
+                for row in table_data
+            ]
             
-            for row in table_data:
-                # 补齐行长度
-                cleaned_row = row + [''] * (max_cols - len(row))
-                
-                # 清理单元格内容
-                cleaned_row = [self._clean_cell_content(cell) for cell in cleaned_row]
-                
-                cleaned_data.append(cleaned_row)
+            if NUMPY_AVAILABLE and cleaned_data and (self.clean_empty_rows or self.clean_empty_columns):
+                return self._remove_empty_lines_vectorized(cleaned_data)
             
             # 移除空行
             if self.clean_empty_rows:
-                cleaned_data = [row for row in cleaned_data if any(cell.strip() for cell in row)]
+                cleaned_data = [row for row in cleaned_data if any(map(str.strip, row))]
             
             # 移除空列
             if self.clean_empty_columns:
@@ -180,21 +450,32 @@ class TableExtractor:
         Returns:
             str: 清理后的内容
         """
-        try:
-            if not isinstance(cell_content, str):
-                cell_content = str(cell_content)
-            
-            # 移除多余的空白字符
-            cleaned = re.sub(r'\s+', ' ', cell_content.strip())
-            
-            # 移除特殊字符（可选）
-            # cleaned = re.sub(r'[^\w\s\-.,()%$]', '', cleaned)
-            
-            return cleaned
+        # 移除多余的空白字符（与_clean_table_data中的批量清理逻辑一致）
+        return _WS_RE.sub(' ', str(cell_content).strip())
+    
+    def _remove_empty_lines_vectorized(self, table_data: List[List[str]]) -> List[List[str]]:
+        """
+        基于NumPy布尔掩码一次性移除空行和空列
+        
+        Args:
+            table_data: 已补齐行长度并清理过单元格的表格数据
             
-        except Exception as e:
-            self.logger.warning(f"单元格内容清理失败: {e}")
-            return str(cell_content)
+        Returns:
+            list: 移除空行/空列后的表格数据
+        """
+        table = np.array(table_data, dtype=object)
+        # 单元格已去除首尾空白，非空即不等于空字符串
+        non_empty = table != ''
+        
+        if self.clean_empty_rows:
+            row_mask = non_empty.any(axis=1)
+            table = table[row_mask]
+            non_empty = non_empty[row_mask]
+        
+        if self.clean_empty_columns:
+            table = table[:, non_empty.any(axis=0)]
+        
+        return table.tolist()
     
     def _remove_empty_columns(self, table_data: List[List[str]]) -> List[List[str]]:
         """
@@ -210,26 +491,23 @@ class TableExtractor:
             if not table_data:
                 return table_data
             
-            cols_to_keep = []
             max_cols = len(table_data[0])
             
-            for col_idx in range(max_cols):
-                # 检查该列是否有非空内容
-                has_content = any(
-                    col_idx < len(row) and row[col_idx].strip() 
-                    for row in table_data
-                )
-                if has_content:
-                    cols_to_keep.append(col_idx)
-            
-            # 重构表格数据
-            cleaned_data = []
+            # 单次遍历标记有内容的列，所有列都确认非空后提前结束
+            keep = [False] * max_cols
+            remaining = max_cols
             for row in table_data:
-                cleaned_row = [row[col_idx] if col_idx < len(row) else '' 
-                             for col_idx in cols_to_keep]
-                cleaned_data.append(cleaned_row)
+                for col_idx, cell in enumerate(row[:max_cols]):
+                    if not keep[col_idx] and cell.strip():
+                        keep[col_idx] = True
+                        remaining -= 1
+                if not remaining:
+                    return table_data
             
-            return cleaned_data
+            # 重构表格数据
+            cols_to_keep = [col_idx for col_idx, has_content in enumerate(keep) if has_content]
+            return [[row[col_idx] if col_idx < len(row) else '' for col_idx in cols_to_keep]
+                    for row in table_data]
             
         except Exception as e:
             self.logger.error(f"空列移除失败: {e}")
@@ -260,12 +538,85 @@ class TableExtractor:
             self.logger.error(f"表格尺寸验证失败: {e}")
             return False
     
-    def _analyze_table_structure(self, table_data: List[List[str]]) -> TableStructure:
+    def _scan_table(self, table_data: List[List[str]], has_header: bool) -> TableScan:
+        """
+        单次遍历表格完成数据类型分类，并基于类型编码汇总表格和列统计
+        
+        Args:
+            table_data: 表格数据
+            has_header: 是否存在表头
+            
+        Returns:
+            TableScan: 扫描结果
+        """
+        num_cols = len(table_data[0]) if table_data else 0
+        num_rows = len(table_data)
+        
+        # _clean_table_data保证各行等长；清洗失败时按首行列数对齐，以便按列步长切片
+        if any(len(row) != num_cols for row in table_data):
+            table_data = [list(row[:num_cols]) + [''] * (num_cols - len(row)) for row in table_data]
+        
+        # 每个单元格只strip一次，直接交给带缓存的分类函数，按行优先顺序记录类型编码
+        data_types = bytearray(
+            _DATA_TYPE_CODES[_classify(cell_value.strip())]
+            for row in table_data for cell_value in row
+        )
+        code_counts = Counter(data_types)
+        type_counts = Counter({_DATA_TYPE_NAMES[code]: count for code, count in code_counts.items()})
+        non_empty_cells = len(data_types) - code_counts[_EMPTY_CODE]
+        
+        # 一次转置得到所有列，列类型编码通过bytearray步长切片获得
+        columns = list(zip(*table_data))
+        column_codes = [data_types[col_idx::num_cols] for col_idx in range(num_cols)]
+        column_non_empty = [num_rows - codes.count(_EMPTY_CODE) for codes in column_codes]
+        column_unique = [{value for value in set(col_values) if value.strip()} for col_values in columns]
+        
+        # 大表格基于类型编码矩阵统计列数据类型（Numba内核或NumPy）
+        if NUMPY_AVAILABLE and num_rows * num_cols >= _NUMBA_MIN_CELLS:
+            codes = np.frombuffer(data_types, dtype=np.uint8).reshape(num_rows, num_cols)
+            dominant_codes, column_consistency = _column_type_stats(codes)
+            column_dominant_types = [_DATA_TYPE_NAMES[code] for code in dominant_codes]
+        else:
+            column_dominant_types = [
+                self._get_dominant_data_type(self._count_types(codes)) for codes in column_codes]
+            column_consistency = []
+            for codes in column_codes:
+                body_counts = self._count_types(codes[1:])  # 跳过表头
+                column_consistency.append(
+                    body_counts.most_common(1)[0][1] / body_counts.total() if body_counts else 1.0)
+        
+        return TableScan(
+            has_header=has_header,
+            cells=CellColumns(table_data, data_types, max(num_cols, 1), has_header),
+            non_empty_cells=non_empty_cells,
+            type_counts=type_counts,
+            column_dominant_types=column_dominant_types,
+            column_consistency=column_consistency,
+            column_non_empty=column_non_empty,
+            column_unique=column_unique
+        )
+    
+    @staticmethod
+    def _count_types(codes: bytearray) -> Counter:
+        """
+        统计类型编码中的非空数据类型（保持首次出现顺序）
+        
+        Args:
+            codes: 类型编码序列
+            
+        Returns:
+            Counter: 数据类型计数
+        """
+        return Counter({_DATA_TYPE_NAMES[code]: count
+                        for code, count in Counter(codes).items() if code != _EMPTY_CODE})
+    
+    def _analyze_table_structure(self, table_data: List[List[str]], scan: TableScan) -> TableStructure:
         """
         分析表格结构
         
         Args:
             table_data: 表格数据
+            scan: 表格扫描结果
             
         Returns:
             TableStructure: 表格结构对象
@@ -274,38 +625,19 @@ class TableExtractor:
             rows = len(table_data)
             columns = len(table_data[0]) if table_data else 0
             
-            # 检测表头
-            has_header = False
-            header_row = None
-            
-            if self.auto_detect_header and rows > 1:
-                has_header = self._detect_header_row(table_data)
-                if has_header:
-                    header_row = table_data[0]
+            has_header = scan.has_header
+            header_row = table_data[0] if has_header else None
             
             # 分离数据行
             data_rows = table_data[1:] if has_header else table_data
             
-            # 创建单元格对象
-            cells = []
-            for row_idx, row in enumerate(table_data):
-                for col_idx, cell_value in enumerate(row):
-                    cell = TableCell(
-                        value=cell_value,
-                        row=row_idx,
-                        column=col_idx,
-                        is_header=(row_idx == 0 and has_header),
-                        data_type=self._detect_data_type(cell_value)
-                    )
-                    cells.append(cell)
-            
             return TableStructure(
                 rows=rows,
                 columns=columns,
                 has_header=has_header,
                 header_row=header_row,
                 data_rows=data_rows,
-                cells=cells
+                cells=scan.cells if self.emit_cells else None
             )
             
         except Exception as e:
@@ -328,16 +660,32 @@ class TableExtractor:
             
             first_row = table_data[0]
             second_row = table_data[1]
+            if not first_row or not second_row:
+                return False
             
-            # 检查第一行是否主要包含文本，第二行是否包含更多数字
-            first_row_text_ratio = sum(1 for cell in first_row 
-                                     if self._detect_data_type(cell) == 'text') / len(first_row)
-            
-            second_row_number_ratio = sum(1 for cell in second_row 
-                                        if self._detect_data_type(cell) in ['number', 'date']) / len(second_row)
+            # 如果第一行文本比例高且第二行数字比例高，可能存在表头；
+            # 两项检查均在结果确定后立即返回
+            detect_data_type = self._detect_data_type
+            
+            # 检查第一行是否主要包含文本
+            first_len = len(first_row)
+            non_text_count = 0
+            for cell in first_row:
+                if detect_data_type(cell) != 'text':
+                    non_text_count += 1
+                    if (first_len - non_text_count) / first_len <= 0.6:
+                        return False
+            
+            # 检查第二行是否包含更多数字
+            second_len = len(second_row)
+            number_count = 0
+            for cell in second_row:
+                if detect_data_type(cell) in ('number', 'date'):
+                    number_count += 1
+                    if number_count / second_len > 0.3:
+                        return True
             
-            # 如果第一行文本比例高且第二行数字比例高，可能存在表头
-            return first_row_text_ratio > 0.6 and second_row_number_ratio > 0.3
+            return False
             
         except Exception as e:
             self.logger.warning(f"表头检测失败: {e}")
@@ -354,47 +702,25 @@ class TableExtractor:
             str: 数据类型
         """
         try:
-            if not cell_value or not cell_value.strip():
+            if not cell_value:
                 return 'empty'
             
-            cell_value = cell_value.strip()
-            
-            # 检测数字
-            if re.match(r'^-?\d+\.?\d*$', cell_value):
-                return 'number'
-            
-            # 检测百分比
-            if re.match(r'^-?\d+\.?\d*%$', cell_value):
-                return 'percentage'
-            
-            # 检测日期
-            date_patterns = [
-                r'\d{4}-\d{2}-\d{2}',
-                r'\d{2}/\d{2}/\d{4}',
-                r'\d{2}-\d{2}-\d{4}'
-            ]
-            for pattern in date_patterns:
-                if re.match(pattern, cell_value):
-                    return 'date'
-            
-            # 检测公式（Excel格式）
-            if cell_value.startswith('='):
-                return 'formula'
-            
-            return 'text'
+            return _classify(cell_value.strip())
             
         except Exception as e:
             self.logger.warning(f"数据类型检测失败: {e}")
             return 'text'
     
     def _generate_table_metadata(self, table_data: List[List[str]], 
-                                base_metadata: Dict[str, Any]) -> Dict[str, Any]:
+                                base_metadata: Dict[str, Any],
+                                scan: TableScan) -> Dict[str, Any]:
         """
         生成表格元数据
         
         Args:
             table_data: 表格数据
             base_metadata: 基础元数据
+            scan: 表格扫描结果
             
         Returns:
             dict: 表格元数据
@@ -405,9 +731,9 @@ class TableExtractor:
             # 基本统计
             metadata.update({
                 'total_cells': len(table_data) * len(table_data[0]) if table_data else 0,
-                'non_empty_cells': sum(1 for row in table_data for cell in row if cell.strip()),
-                'data_types': self._analyze_data_types(table_data),
-                'column_stats': self._analyze_columns(table_data)
+                'non_empty_cells': scan.non_empty_cells,
+                'data_types': self._analyze_data_types(scan),
+                'column_stats': self._analyze_columns(table_data, scan)
             })
             
             return metadata
@@ -416,36 +742,25 @@ class TableExtractor:
             self.logger.error(f"表格元数据生成失败: {e}")
             return base_metadata
     
-    def _analyze_data_types(self, table_data: List[List[str]]) -> Dict[str, int]:
+    def _analyze_data_types(self, scan: TableScan) -> Dict[str, int]:
         """
         分析数据类型分布
         
         Args:
-            table_data: 表格数据
+            scan: 表格扫描结果
             
         Returns:
             dict: 数据类型统计
         """
-        try:
-            type_counts = {}
-            
-            for row in table_data:
-                for cell in row:
-                    data_type = self._detect_data_type(cell)
-                    type_counts[data_type] = type_counts.get(data_type, 0) + 1
-            
-            return type_counts
-            
-        except Exception as e:
-            self.logger.error(f"数据类型分析失败: {e}")
-            return {}
+        return dict(scan.type_counts)
     
-    def _analyze_columns(self, table_data: List[List[str]]) -> List[Dict[str, Any]]:
+    def _analyze_columns(self, table_data: List[List[str]], scan: TableScan) -> List[Dict[str, Any]]:
         """
         分析列统计信息
         
         Args:
             table_data: 表格数据
+            scan: 表格扫描结果
             
         Returns:
             list: 列统计信息
@@ -455,21 +770,16 @@ class TableExtractor:
                 return []
             
             column_stats = []
-            num_cols = len(table_data[0])
+            total_values = len(table_data)
             
-            for col_idx in range(num_cols):
-                col_values = [row[col_idx] if col_idx < len(row) else '' 
-                            for row in table_data]
-                
-                non_empty_values = [v for v in col_values if v.strip()]
-                
+            for col_idx, non_empty in enumerate(scan.column_non_empty):
                 stats = {
                     'column_index': col_idx,
-                    'total_values': len(col_values),
-                    'non_empty_values': len(non_empty_values),
-                    'empty_ratio': 1 - (len(non_empty_values) / len(col_values)) if col_values else 1,
-                    'dominant_type': self._get_dominant_data_type(non_empty_values),
-                    'unique_values': len(set(non_empty_values))
+                    'total_values': total_values,
+                    'non_empty_values': non_empty,
+                    'empty_ratio': 1 - (non_empty / total_values),
+                    'dominant_type': scan.column_dominant_types[col_idx],
+                    'unique_values': len(scan.column_unique[col_idx])
                 }
                 
                 column_stats.append(stats)
@@ -480,39 +790,36 @@ class TableExtractor:
             self.logger.error(f"列分析失败: {e}")
             return []
     
-    def _get_dominant_data_type(self, values: List[str]) -> str:
+    def _get_dominant_data_type(self, type_counts: Counter) -> str:
         """
         获取主导数据类型
         
         Args:
-            values: 值列表
+            type_counts: 数据类型计数
             
         Returns:
             str: 主导数据类型
         """
         try:
-            if not values:
+            if not type_counts:
                 return 'empty'
             
-            type_counts = {}
-            for value in values:
-                data_type = self._detect_data_type(value)
-                type_counts[data_type] = type_counts.get(data_type, 0) + 1
-            
-            return max(type_counts, key=type_counts.get)
+            return type_counts.most_common(1)[0][0]
             
         except Exception as e:
             self.logger.warning(f"主导数据类型获取失败: {e}")
             return 'text'
     
     def _calculate_quality_score(self, table_data: List[List[str]], 
-                               structure: TableStructure) -> float:
+                               structure: TableStructure,
+                               scan: TableScan) -> float:
         """
         计算表格质量评分
         
         Args:
             table_data: 表格数据
             structure: 表格结构
+            scan: 表格扫描结果
             
         Returns:
             float: 质量评分（0-1）
@@ -522,8 +829,7 @@ class TableExtractor:
             
             # 完整性评分（30%）
             total_cells = structure.rows * structure.columns
-            non_empty_cells = sum(1 for row in table_data for cell in row if cell.strip())
-            completeness_score = non_empty_cells / total_cells if total_cells > 0 else 0
+            completeness_score = scan.non_empty_cells / total_cells if total_cells > 0 else 0
             score += completeness_score * 0.3
             
             # 结构性评分（25%）
@@ -531,7 +837,7 @@ class TableExtractor:
             score += structure_score * 0.25
             
             # 一致性评分（25%）
-            consistency_score = self._calculate_consistency_score(table_data)
+            consistency_score = self._calculate_consistency_score(table_data, scan)
             score += consistency_score * 0.25
             
             # 尺寸评分（20%）
@@ -544,12 +850,13 @@ class TableExtractor:
             self.logger.error(f"质量评分计算失败: {e}")
             return 0.0
     
-    def _calculate_consistency_score(self, table_data: List[List[str]]) -> float:
+    def _calculate_consistency_score(self, table_data: List[List[str]], scan: TableScan) -> float:
         """
         计算数据一致性评分
         
         Args:
             table_data: 表格数据
+            scan: 表格扫描结果
             
         Returns:
             float: 一致性评分
@@ -558,28 +865,8 @@ class TableExtractor:
             if not table_data or len(table_data) < 2:
                 return 1.0
             
-            column_consistency_scores = []
-            num_cols = len(table_data[0])
-            
-            for col_idx in range(num_cols):
-                col_values = [row[col_idx] if col_idx < len(row) else '' 
-                            for row in table_data[1:]]  # 跳过表头
-                
-                non_empty_values = [v for v in col_values if v.strip()]
-                
-                if not non_empty_values:
-                    column_consistency_scores.append(1.0)
-                    continue
-                
-                # 计算该列的数据类型一致性
-                type_counts = {}
-                for value in non_empty_values:
-                    data_type = self._detect_data_type(value)
-                    type_counts[data_type] = type_counts.get(data_type, 0) + 1
-                
-                dominant_type_count = max(type_counts.values())
-                consistency = dominant_type_count / len(non_empty_values)
-                column_consistency_scores.append(consistency)
+            # 各列数据类型一致性（跳过表头）已在扫描阶段计算
+            column_consistency_scores = scan.column_consistency
             
             return sum(column_consistency_scores) / len(column_consistency_scores) if column_consistency_scores else 1.0
             
@@ -603,21 +890,16 @@ class TableExtractor:
             if not table_data:
                 return ""
             
-            lines = []
+            join_cells = " | ".join
+            data_rows = structure.data_rows or table_data
             
             # 添加表头
             if structure.has_header and structure.header_row:
-                header_line = " | ".join(structure.header_row)
-                lines.append(header_line)
-                lines.append("-" * len(header_line))
+                header_line = join_cells(structure.header_row)
+                return "\n".join((header_line, "-" * len(header_line), *map(join_cells, data_rows)))
             
             # 添加数据行
-            data_rows = structure.data_rows or table_data
-            for row in data_rows:
-                row_line = " | ".join(row)
-                lines.append(row_line)
-            
-            return "\n".join(lines)
+            return "\n".join(map(join_cells, data_rows))
             
         except Exception as e:
             self.logger.error(f"表格文本格式化失败: {e}")
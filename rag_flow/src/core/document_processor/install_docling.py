@@ -40,6 +40,31 @@ def install_package(package_name: str) -> bool:
         return False
 
 
+def install_packages(package_names: List[str]) -> Dict[str, bool]:
+    """批量安装包，失败时逐个安装以定位出错的包"""
+    if not package_names:
+        return {}
+    
+    try:
+        print(f"正在安装 {' '.join(package_names)}...")
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", *package_names],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        print(f"✓ {', '.join(package_names)} 安装成功")
+        return {package_name: True for package_name in package_names}
+    except subprocess.CalledProcessError as e:
+        print(f"✗ 批量安装失败: {e}")
+        if len(package_names) == 1:
+            print(f"错误输出: {e.stderr}")
+            return {package_names[0]: False}
+    
+    print("逐个安装以定位失败的包...")
+    return {package_name: install_package(package_name) for package_name in package_names}
+
+
 def check_and_install_dependencies() -> Dict[str, bool]:
     """检查并安装依赖"""
     
@@ -57,6 +82,7 @@ def check_and_install_dependencies() -> Dict[str, bool]:
     }
     
     results = {}
+    to_install = []
     
     print("检查Docling依赖...")
     print("=" * 50)
@@ -80,12 +106,14 @@ def check_and_install_dependencies() -> Dict[str, bool]:
                 install_choice = input(f"  是否安装 {package_name}? (y/n): ").lower().strip()
             
             if install_choice == 'y':
-                success = install_package(package_name)
-                results[package_name] = success
+                to_install.append(package_name)
             else:
                 print(f"  跳过安装 {package_name}")
                 results[package_name] = False
     
+    # 所有待安装的包通过一次pip调用安装
+    results.update(install_packages(to_install))
+    
     return results
 
 
@@ -6,11 +6,18 @@
 版本: v1.0.0
 """
 
-from .pdf_parser import PDFParser
-from .word_parser import WordParser
-from .excel_parser import ExcelParser
-from .powerpoint_parser import PowerPointParser
+import importlib
+
 from .document_processor import DocumentProcessor
+from .parse_options import ParseOptions
+
+# 各解析器依赖的第三方库较重，在首次访问时才导入对应模块
+_LAZY_IMPORTS = {
+    'PDFParser': '.pdf_parser',
+    'WordParser': '.word_parser',
+    'ExcelParser': '.excel_parser',
+    'PowerPointParser': '.powerpoint_parser',
+}
 
 __all__ = [
     'PDFParser',
@@ -18,4 +25,15 @@ __all__ = [
     'ExcelParser', 
     'PowerPointParser',
     'DocumentProcessor',
+    'ParseOptions',
 ]
+
+
+def __getattr__(name):
+    """按需导入解析器类"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -6,11 +6,22 @@
 版本: v1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from io import BytesIO
+from collections import OrderedDict
+from types import MappingProxyType
+import copy
+import csv
+import importlib.util
 import json
+import os
+import sys
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # 导入统一日志管理器
 try:
@@ -67,25 +78,763 @@ try:
     except ImportError:
         PYPDFIUM_BACKEND_AVAILABLE = False
 
+    try:
+        from docling.datamodel.settings import settings as docling_settings
+        DOCLING_SETTINGS_AVAILABLE = True
+    except ImportError:
+        DOCLING_SETTINGS_AVAILABLE = False
+
+    try:
+        from docling.datamodel.accelerator_options import AcceleratorOptions, AcceleratorDevice
+        ACCELERATOR_OPTIONS_AVAILABLE = True
+    except ImportError:
+        try:
+            # 旧版本Docling在pipeline_options中定义加速器选项
+            from docling.datamodel.pipeline_options import AcceleratorOptions, AcceleratorDevice
+            ACCELERATOR_OPTIONS_AVAILABLE = True
+        except ImportError:
+            ACCELERATOR_OPTIONS_AVAILABLE = False
+
+    try:
+        from docling_core.types.doc import (
+            TextItem,
+            TitleItem,
+            SectionHeaderItem,
+            ListItem,
+            CodeItem,
+            FormulaItem,
+            TableItem,
+            PictureItem,
+            ImageRef,
+            DoclingDocument
+        )
+        DOCLING_CORE_TYPES_AVAILABLE = True
+    except ImportError:
+        DOCLING_CORE_TYPES_AVAILABLE = False
+
 except ImportError:
     DOCLING_AVAILABLE = False
     WORD_FORMAT_AVAILABLE = False
     ADVANCED_OPTIONS_AVAILABLE = False
     VLM_PIPELINE_AVAILABLE = False
     PYPDFIUM_BACKEND_AVAILABLE = False
+    DOCLING_SETTINGS_AVAILABLE = False
+    ACCELERATOR_OPTIONS_AVAILABLE = False
+    DOCLING_CORE_TYPES_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from langdetect import detect as langdetect_detect
+    LANGDETECT_AVAILABLE = True
+except ImportError:
+    LANGDETECT_AVAILABLE = False
 
 from ..extractors.metadata_extractor import MetadataExtractor
 
 
-@dataclass
+# 文档尚未遍历的标记（遍历失败时结果为None，需与之区分）
+_NOT_WALKED = object()
+
+
 class DoclingParseResult:
-    """Docling解析结果数据类"""
-    text_content: str
-    metadata: Dict[str, Any]
-    structured_data: Dict[str, Any]  # 包含表格、图像等结构化数据
-    structure_info: Dict[str, Any]
-    original_format: str
-    docling_document: Optional[Any] = None  # 原始Docling文档对象
+    """
+    Docling解析结果
+
+    structured_data、structure_info以及metadata中的元素统计在首次访问时才遍历文档计算，
+    只使用text_content的调用方无需承担文档遍历的开销。构造时显式传入的值会直接使用。
+
+    序列化（pickle）时默认不包含原始Docling文档对象，需要保留时设置keep_document=True。
+    使用__slots__，批量持有大量结果时不为每个实例分配__dict__。
+    """
+
+    __slots__ = ('text_content', 'original_format', 'docling_document', 'keep_document',
+                 '_parser', '_base_metadata', '_metadata', '_structured_data', '_structure_info', '_walk')
+
+    def __init__(self, text_content: str,
+                 metadata: Optional[Dict[str, Any]] = None,
+                 structured_data: Optional[Dict[str, Any]] = None,  # 包含表格、图像等结构化数据
+                 structure_info: Optional[Dict[str, Any]] = None,
+                 original_format: str = '',
+                 docling_document: Optional[Any] = None,  # 原始Docling文档对象
+                 parser: Optional['DoclingParser'] = None,
+                 keep_document: bool = False):
+        """
+        初始化解析结果
+
+        Args:
+            text_content (str): Markdown文本内容
+            metadata (dict, optional): 元数据；提供parser时仅需包含文件基础信息
+            structured_data (dict, optional): 结构化数据，未提供时延迟计算
+            structure_info (dict, optional): 结构信息，未提供时延迟计算
+            original_format (str): 原始文件格式
+            docling_document: 原始Docling文档对象
+            parser (DoclingParser, optional): 用于延迟计算的解析器
+            keep_document (bool): 序列化时是否保留原始Docling文档对象，默认False
+        """
+        self.text_content = text_content
+        self.original_format = original_format
+        self.docling_document = docling_document
+        self.keep_document = keep_document
+        self._parser = parser
+        self._base_metadata = metadata if metadata is not None else {}
+
+        # 显式传入的值直接使用，未提供时在首次访问时计算
+        self._metadata = self._base_metadata if parser is None else None
+        self._structured_data = structured_data
+        self._structure_info = structure_info
+        self._walk = _NOT_WALKED
+
+    def _get_walk(self) -> Optional[Tuple]:
+        """单次文档遍历结果，供各延迟属性共用"""
+        if self._walk is _NOT_WALKED:
+            self._walk = self._parser._safe_walk_document(self.docling_document)
+        return self._walk
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """元数据（含元素统计）"""
+        if self._metadata is None:
+            if 'error' in self._base_metadata:
+                self._metadata = self._base_metadata
+            else:
+                # 已完成完整遍历时复用其统计，否则只做计数，不提取结构化数据
+                walk = None if self._walk is _NOT_WALKED else self._walk
+                metadata = dict(self._base_metadata)
+                metadata.update(self._parser._count_document_elements(self.docling_document, walk))
+                self._metadata = metadata
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]):
+        self._metadata = value
+
+    @property
+    def structured_data(self) -> Dict[str, Any]:
+        """结构化数据（表格、图像、标题等）"""
+        if self._structured_data is None:
+            if self._parser is None:
+                self._structured_data = {}
+            else:
+                self._structured_data = self._parser._extract_structured_data(
+                    self.docling_document, self._get_walk())
+        return self._structured_data
+
+    @structured_data.setter
+    def structured_data(self, value: Dict[str, Any]):
+        self._structured_data = value
+
+    def to_structured_data(self) -> Dict[str, Any]:
+        """
+        构建统一解析结果使用的结构化数据
+
+        Returns:
+            dict: 结构化数据（Docling已经提供统一格式，直接返回）
+        """
+        return self.structured_data
+
+    @property
+    def structure_info(self) -> Dict[str, Any]:
+        """文档结构信息"""
+        if self._structure_info is None:
+            if self._parser is None:
+                self._structure_info = {}
+            else:
+                self._structure_info = self._parser._analyze_structure(self.docling_document, self._get_walk())
+        return self._structure_info
+
+    @structure_info.setter
+    def structure_info(self, value: Dict[str, Any]):
+        self._structure_info = value
+
+    def detach(self, keep_document: bool = False) -> 'DoclingParseResult':
+        """
+        计算所有延迟属性并解除对解析器的引用，便于跨进程传递
+
+        Args:
+            keep_document (bool): 是否保留原始Docling文档对象，默认False
+
+        Returns:
+            DoclingParseResult: 当前结果对象
+        """
+        self.materialize()
+        self._parser = None
+        self._walk = _NOT_WALKED
+        self.keep_document = keep_document
+        if not keep_document:
+            self.docling_document = None
+        return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """序列化前计算延迟属性，并排除解析器引用、遍历缓存和（默认）原始文档对象"""
+        self.materialize()
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['_parser'] = None
+        del state['_walk']
+        if not self.keep_document:
+            state['docling_document'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._walk = _NOT_WALKED
+
+    def to_dict(self, include_document: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        转换为可序列化的字典
+
+        Args:
+            include_document (bool, optional): 是否包含原始文档（通过export_to_dict导出），
+                默认跟随keep_document
+
+        Returns:
+            dict: 解析结果字典
+        """
+        if include_document is None:
+            include_document = self.keep_document
+
+        data = {
+            'text_content': self.text_content,
+            'metadata': self.metadata,
+            'structured_data': self.structured_data,
+            'structure_info': self.structure_info,
+            'original_format': self.original_format,
+            'docling_document': None
+        }
+        if include_document and self.docling_document is not None:
+            data['docling_document'] = self.docling_document.export_to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DoclingParseResult':
+        """
+        从to_dict生成的字典恢复解析结果
+
+        Args:
+            data (dict): 解析结果字典
+
+        Returns:
+            DoclingParseResult: 解析结果
+        """
+        docling_document = data.get('docling_document')
+        if isinstance(docling_document, dict) and DOCLING_CORE_TYPES_AVAILABLE:
+            docling_document = DoclingDocument.model_validate(docling_document)
+
+        return cls(
+            text_content=data['text_content'],
+            metadata=data.get('metadata', {}),
+            structured_data=data.get('structured_data', {}),
+            structure_info=data.get('structure_info', {}),
+            original_format=data.get('original_format', ''),
+            docling_document=docling_document,
+            keep_document=docling_document is not None
+        )
+
+    def to_json(self, include_document: Optional[bool] = None, indent: bool = False) -> bytes:
+        """
+        序列化为JSON字节串，orjson可用时优先使用
+
+        Args:
+            include_document (bool, optional): 是否包含原始文档，默认跟随keep_document
+            indent (bool): 是否以2空格缩进输出，默认False
+
+        Returns:
+            bytes: UTF-8编码的JSON
+        """
+        return _dumps_json(self.to_dict(include_document), indent)
+
+    def materialize(self) -> 'DoclingParseResult':
+        """
+        立即计算所有延迟属性
+
+        Returns:
+            DoclingParseResult: 当前结果对象
+        """
+        # 先完成完整遍历，元数据统计随后直接复用
+        self.structured_data
+        self.structure_info
+        self.metadata
+        return self
+
+    def __repr__(self) -> str:
+        return (f"DoclingParseResult(original_format={self.original_format!r}, "
+                f"text_length={len(self.text_content)})")
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON序列化回退：pydantic模型导出为字典，其余对象转为字符串"""
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump(mode='json')
+    return str(obj)
+
+
+def _dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    序列化为UTF-8编码的JSON字节串，orjson可用时优先使用
+
+    Args:
+        data: 待序列化的数据
+        indent (bool): 是否以2空格缩进输出，默认False
+
+    Returns:
+        bytes: UTF-8编码的JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    return json.dumps(data, default=_json_default, ensure_ascii=False,
+                      indent=2 if indent else None).encode('utf-8')
+
+
+def _write_text(output_path: Union[str, Path], text: str):
+    """
+    将文本一次编码为UTF-8后以二进制方式写出，跳过文本层的分段编码
+
+    Args:
+        output_path (str | Path): 输出文件路径
+        text (str): 文本内容
+    """
+    data = text.encode('utf-8')
+    with open(output_path, 'wb') as f:
+        f.write(data)
+
+
+# 并行保存导出图形的线程数上限
+_FIGURE_SAVE_WORKERS = 8
+
+
+# 语言检测：抽样字符数，以及各文字系统的Unicode区间和占字母的最低比例
+_LANGUAGE_SAMPLE_CHARS = 2000
+_SCRIPT_RANGES = (
+    ('ja', ((0x3040, 0x30ff),), 0.1),
+    ('ko', ((0xac00, 0xd7af), (0x1100, 0x11ff)), 0.3),
+    ('zh', ((0x4e00, 0x9fff), (0x3400, 0x4dbf)), 0.3),
+)
+
+
+def _detect_language(text: str) -> Optional[str]:
+    """
+    检测文本的主要语言
+
+    安装了langdetect时使用其结果；否则仅按文字系统识别中文、日文和韩文。
+
+    Args:
+        text (str): 待检测文本
+
+    Returns:
+        str: 语言代码（如'zh'、'en'），无法判断时为None
+    """
+    sample = text[:_LANGUAGE_SAMPLE_CHARS]
+    if not sample.strip():
+        return None
+
+    if LANGDETECT_AVAILABLE:
+        try:
+            return langdetect_detect(sample).split('-')[0]
+        except Exception:
+            return None
+
+    letters = [ord(char) for char in sample if char.isalpha()]
+    if not letters:
+        return None
+    # 日文含汉字，先按假名判定
+    for language, ranges, min_ratio in _SCRIPT_RANGES:
+        matched = sum(1 for code in letters if any(low <= code <= high for low, high in ranges))
+        if matched > min_ratio * len(letters):
+            return language
+    return None
+
+
+# 支持的文件格式映射（扩展名 -> Docling输入格式）
+if DOCLING_AVAILABLE:
+    _SUPPORTED_FORMATS = MappingProxyType({
+        '.pdf': InputFormat.PDF,
+        '.docx': InputFormat.DOCX,
+        '.doc': InputFormat.DOCX,  # 通过docx处理
+        '.html': InputFormat.HTML,
+        '.htm': InputFormat.HTML,
+        '.xlsx': InputFormat.XLSX,
+        '.xls': InputFormat.XLSX,  # 通过xlsx处理
+        '.csv': InputFormat.CSV,
+        '.md': InputFormat.MD,
+        '.markdown': InputFormat.MD,
+        '.txt': InputFormat.MD,  # 作为markdown处理
+        '.png': InputFormat.IMAGE,
+        '.jpg': InputFormat.IMAGE,
+        '.jpeg': InputFormat.IMAGE,
+        '.gif': InputFormat.IMAGE,
+        '.bmp': InputFormat.IMAGE,
+        '.tiff': InputFormat.IMAGE,
+        '.tif': InputFormat.IMAGE,
+        '.pptx': InputFormat.PPTX,
+        '.ppt': InputFormat.PPTX,  # 通过pptx处理
+    })
+else:
+    _SUPPORTED_FORMATS = MappingProxyType({})
+_SUPPORTED_SUFFIXES = frozenset(_SUPPORTED_FORMATS)
+
+# 从Docling文档元数据中提取的字段
+_DOCUMENT_META_FIELDS = ('title', 'authors', 'language', 'creation_date', 'subject', 'keywords')
+
+# 文本型PDF判定：抽样页数、每页最少字符数、每张图片对应的最少字符数
+_TEXT_HEAVY_SAMPLE_PAGES = 3
+_TEXT_HEAVY_MIN_CHARS_PER_PAGE = 500
+_TEXT_HEAVY_MIN_CHARS_PER_IMAGE = 2000
+
+# 元素统计键（保持输出顺序）
+_ELEMENT_COUNT_KEYS = (
+    'total_elements',
+    'text_elements',
+    'table_elements',
+    'image_elements',
+    'heading_elements',
+    'list_elements',
+    'code_elements',
+    'formula_elements',
+)
+
+# 元素类别 -> 结构化数据键
+_STRUCTURED_DATA_KEYS = {
+    'table': 'tables',
+    'image': 'images',
+    'heading': 'headings',
+    'list': 'lists',
+    'code': 'code_blocks',
+    'formula': 'formulas',
+}
+
+# 元素类别及其类型名称关键字，按匹配优先级排列
+_ITEM_TYPE_KEYWORDS = (
+    ('table', ('Table',)),
+    ('image', ('Picture', 'Image')),
+    ('heading', ('Heading', 'Title')),
+    ('list', ('List',)),
+    ('code', ('Code',)),
+    ('formula', ('Formula', 'Equation')),
+)
+
+
+# 元素类别及其docling_core类型，子类（标题、列表、代码、公式均继承TextItem）需排在TextItem之前
+if DOCLING_CORE_TYPES_AVAILABLE:
+    _ITEM_TYPE_CLASSES = (
+        ('heading', (SectionHeaderItem, TitleItem)),
+        ('list', (ListItem,)),
+        ('code', (CodeItem,)),
+        ('formula', (FormulaItem,)),
+        ('table', (TableItem,)),
+        ('image', (PictureItem,)),
+    )
+else:
+    _ITEM_TYPE_CLASSES = ()
+
+
+@lru_cache(maxsize=256)
+def _classify_item_type(item_type: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    根据元素类型名称分类，结果按类型名称缓存
+
+    Args:
+        item_type (str): 元素类型名称
+
+    Returns:
+        tuple: (元素统计键, 元素类别)，无法归类时对应项为None
+    """
+    kind = None
+    for candidate, keywords in _ITEM_TYPE_KEYWORDS:
+        if any(keyword in item_type for keyword in keywords):
+            kind = candidate
+            break
+
+    if 'Text' in item_type:
+        count_key = 'text_elements'
+    elif kind:
+        count_key = f'{kind}_elements'
+    else:
+        count_key = None
+
+    return count_key, kind
+
+
+@lru_cache(maxsize=256)
+def _classify_item_class(item_cls: type) -> Tuple[Optional[str], Optional[str]]:
+    """
+    根据元素类型分类，结果按类型缓存
+
+    docling_core可用时按类继承关系判断，否则回退到类型名称匹配。
+
+    Args:
+        item_cls (type): 元素类型
+
+    Returns:
+        tuple: (元素统计键, 元素类别)，无法归类时对应项为None
+    """
+    if not DOCLING_CORE_TYPES_AVAILABLE:
+        return _classify_item_type(item_cls.__name__)
+
+    for kind, classes in _ITEM_TYPE_CLASSES:
+        if issubclass(item_cls, classes):
+            return f'{kind}_elements', kind
+    if issubclass(item_cls, TextItem):
+        return 'text_elements', None
+    return None, None
+
+
+# 元素类型 -> (驻留的类型名称, 元素统计键, 元素类别)
+_ITEM_TYPE_INFO_CACHE: Dict[type, Tuple[str, Optional[str], Optional[str]]] = {}
+
+
+def _item_type_info(item_cls: type) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    获取元素类型的名称与分类，按类型缓存
+
+    类型名称经sys.intern驻留，同类元素共享同一字符串对象作为字典键。
+
+    Args:
+        item_cls (type): 元素类型
+
+    Returns:
+        tuple: (类型名称, 元素统计键, 元素类别)
+    """
+    info = _ITEM_TYPE_INFO_CACHE.get(item_cls)
+    if info is None:
+        info = (sys.intern(item_cls.__name__),) + _classify_item_class(item_cls)
+        _ITEM_TYPE_INFO_CACHE[item_cls] = info
+    return info
+
+
+@dataclass(frozen=True)
+class ConverterOptions:
+    """
+    影响DocumentConverter构建的配置子集
+
+    冻结数据类，可哈希，用作转换器缓存的键。
+    """
+    enable_ocr: bool = True
+    ocr_engine: str = 'easyocr'
+    enable_table_structure: bool = True
+    table_mode: str = 'fast'
+    enable_cell_matching: bool = True
+    enable_picture_description: bool = False
+    picture_description_model: Optional[str] = None
+    picture_description_prompt: Optional[str] = None
+    enable_picture_classification: bool = False
+    generate_picture_images: bool = True
+    images_scale: int = 2
+    enable_formula_enrichment: bool = False
+    enable_code_enrichment: bool = False
+    artifacts_path: Optional[str] = None
+    enable_remote_services: bool = False
+    use_vlm_pipeline: bool = False
+    vlm_model: Optional[str] = None
+    custom_backend: Optional[str] = None
+    num_threads: Optional[int] = None
+    accelerator_device: str = 'auto'
+    allowed_formats: Tuple[Any, ...] = ()
+
+
+def _create_converter(options: ConverterOptions,
+                      document_timeout: Optional[float] = None) -> 'DocumentConverter':
+    """
+    根据配置构建Docling文档转换器
+
+    Args:
+        options (ConverterOptions): 转换器配置
+        document_timeout (float, optional): 单个文档处理超时时间（秒），由Docling管道自行中止
+
+    Returns:
+        DocumentConverter: 新建的转换器实例
+    """
+    # 配置PDF管道选项
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = options.enable_ocr
+    pipeline_options.do_table_structure = options.enable_table_structure
+    pipeline_options.do_picture_description = options.enable_picture_description
+    pipeline_options.do_formula_enrichment = options.enable_formula_enrichment
+    pipeline_options.do_code_enrichment = options.enable_code_enrichment
+    pipeline_options.generate_picture_images = options.generate_picture_images
+    pipeline_options.images_scale = options.images_scale
+    pipeline_options.enable_remote_services = options.enable_remote_services
+
+    # 配置图片分类
+    if ADVANCED_OPTIONS_AVAILABLE and options.enable_picture_classification:
+        pipeline_options.do_picture_classification = options.enable_picture_classification
+
+    # 配置表格模式
+    if ADVANCED_OPTIONS_AVAILABLE and hasattr(pipeline_options, 'table_structure_options'):
+        if options.table_mode == 'accurate':
+            try:
+                pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
+            except:
+                logger.warning("无法设置表格模式为accurate，使用默认模式")
+
+        pipeline_options.table_structure_options.do_cell_matching = options.enable_cell_matching
+
+    # 配置OCR引擎
+    if ADVANCED_OPTIONS_AVAILABLE and options.enable_ocr:
+        if options.ocr_engine == 'tesseract':
+            try:
+                pipeline_options.ocr_options = TesseractOcrOptions()
+            except:
+                logger.warning("无法设置Tesseract OCR，使用默认OCR")
+        elif options.ocr_engine == 'easyocr':
+            try:
+                pipeline_options.ocr_options = EasyOcrOptions()
+            except:
+                logger.warning("无法设置EasyOCR，使用默认OCR")
+
+    # 配置图片描述
+    if ADVANCED_OPTIONS_AVAILABLE and options.enable_picture_description:
+        if options.picture_description_model and options.picture_description_prompt:
+            try:
+                pipeline_options.picture_description_options = PictureDescriptionVlmOptions(
+                    repo_id=options.picture_description_model,
+                    prompt=options.picture_description_prompt
+                )
+            except:
+                logger.warning("无法设置自定义图片描述模型，使用默认设置")
+
+    if options.artifacts_path:
+        pipeline_options.artifacts_path = options.artifacts_path
+
+    # 配置文档处理超时（由Docling管道自行中止）
+    if document_timeout:
+        if hasattr(pipeline_options, 'document_timeout'):
+            pipeline_options.document_timeout = document_timeout
+        else:
+            logger.warning("当前Docling版本不支持document_timeout，conversion_timeout不生效")
+
+    # 配置加速器（线程数与设备）
+    if ACCELERATOR_OPTIONS_AVAILABLE:
+        try:
+            accelerator_kwargs = {'device': AcceleratorDevice(options.accelerator_device.lower())}
+            if options.num_threads:
+                accelerator_kwargs['num_threads'] = options.num_threads
+            pipeline_options.accelerator_options = AcceleratorOptions(**accelerator_kwargs)
+        except Exception:
+            logger.warning(f"无法设置加速器设备{options.accelerator_device}，使用默认设置")
+
+    # 配置格式选项
+    format_options = {
+        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+    }
+
+    # 配置Word格式选项
+    if WORD_FORMAT_AVAILABLE:
+        try:
+            format_options[InputFormat.DOCX] = WordFormatOption()
+        except:
+            logger.warning("无法配置Word格式选项")
+
+    # 配置VLM管道
+    if VLM_PIPELINE_AVAILABLE and options.use_vlm_pipeline:
+        try:
+            vlm_options = None
+            if options.vlm_model:
+                vlm_options = VlmPipelineOptions(
+                    vlm_options=getattr(vlm_model_specs, options.vlm_model, None)
+                )
+
+            format_options[InputFormat.PDF] = PdfFormatOption(
+                pipeline_cls=VlmPipeline,
+                pipeline_options=vlm_options or pipeline_options
+            )
+        except:
+            logger.warning("无法配置VLM管道，使用标准管道")
+
+    # 配置自定义后端
+    if PYPDFIUM_BACKEND_AVAILABLE and options.custom_backend == 'pypdfium':
+        try:
+            format_options[InputFormat.PDF] = PdfFormatOption(
+                pipeline_options=pipeline_options,
+                backend=PyPdfiumDocumentBackend
+            )
+        except:
+            logger.warning("无法配置自定义后端，使用默认后端")
+
+    # 初始化转换器
+    return DocumentConverter(
+        format_options=format_options,
+        allowed_formats=list(options.allowed_formats)
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_converter(options: ConverterOptions) -> 'DocumentConverter':
+    """
+    获取缓存的Docling文档转换器
+
+    模型加载是转换器初始化的主要开销，相同配置的解析器共享同一转换器实例。
+
+    Args:
+        options (ConverterOptions): 转换器配置
+
+    Returns:
+        DocumentConverter: 缓存的转换器实例
+    """
+    return _create_converter(options)
+
+
+# 预设配置（模块级共享只读映射）
+_PRESETS = MappingProxyType({
+    'basic': MappingProxyType({
+        'enable_ocr': True,
+        'enable_table_structure': True,
+        'enable_picture_description': False,
+        'enable_formula_enrichment': False,
+        'enable_code_enrichment': False
+    }),
+    'ocr_only': MappingProxyType({
+        'enable_ocr': True,
+        'enable_table_structure': False,
+        'enable_picture_description': False,
+        'enable_formula_enrichment': False,
+        'enable_code_enrichment': False
+    }),
+    'table_focus': MappingProxyType({
+        'enable_ocr': True,
+        'enable_table_structure': True,
+        'table_mode': 'accurate',
+        'enable_cell_matching': True,
+        'enable_picture_description': False,
+        'enable_formula_enrichment': False,
+        'enable_code_enrichment': False
+    }),
+    'image_focus': MappingProxyType({
+        'enable_ocr': True,
+        'enable_table_structure': True,
+        'enable_picture_description': True,
+        'enable_picture_classification': True,
+        'generate_picture_images': True,
+        'images_scale': 2,
+        'enable_formula_enrichment': False,
+        'enable_code_enrichment': False
+    }),
+    'academic': MappingProxyType({
+        'enable_ocr': True,
+        'enable_table_structure': True,
+        'table_mode': 'accurate',
+        'enable_picture_description': True,
+        'enable_formula_enrichment': True,
+        'enable_code_enrichment': True,
+        'generate_picture_images': True,
+        'images_scale': 2
+    }),
+    'vlm': MappingProxyType({
+        'use_vlm_pipeline': True,
+        'enable_ocr': True,
+        'enable_table_structure': True,
+        'enable_picture_description': True,
+        'generate_picture_images': True,
+        'images_scale': 2
+    })
+})
 
 
 class DoclingParser:
@@ -129,7 +878,28 @@ class DoclingParser:
                 - use_vlm_pipeline (bool): 是否使用VLM管道，默认False
                 - vlm_model (str): VLM模型名称，默认None
                 - custom_backend (str): 自定义后端，默认None
+                - backend_strategy (str): PDF后端策略，支持'auto', 'dlparse', 'pypdfium'，默认'auto'
+                  （auto在未启用表格结构识别时对文本型PDF使用pypdfium后端）
+                - conversion_timeout (float): 单个文档转换超时时间（秒），默认None（不限制）；
+                  由Docling管道的document_timeout中止处理，设置后转换器不与其他解析器共享
                 - allowed_formats (list): 允许的文件格式列表，默认None（支持所有格式）
+                - stream_images (bool): 是否将生成的图片写入临时PNG文件并从文档对象中释放，默认False；
+                  启用后临时图片由解析器持有，在close()或解析器被回收时删除，
+                  解析结果中的图片路径只在解析器关闭前有效
+                - image_temp_dir (str): 图片临时目录的上级目录，默认None（系统临时目录）
+                - compact_reading_order (bool): 是否以紧凑形式记录阅读顺序，默认False；
+                  默认每个元素一条{'type', 'level', 'text_preview'}字典，启用后为
+                  (类型序号, 层级, 文本预览, 数量)元组，连续的非文本元素合并且条目数受reading_order_limit限制
+                - reading_order_limit (int): 紧凑阅读顺序的条目上限，默认2000（None表示不限制）
+                - num_threads (int): 模型推理线程数，默认None（使用Docling默认值，遵循OMP_NUM_THREADS）
+                - accelerator_device (str): 加速设备，支持'auto', 'cpu', 'cuda', 'mps'，默认'auto'
+                - doc_batch_size (int): Docling文档批大小，默认None（使用Docling默认值2）
+                - page_batch_size (int): 页面批大小，默认None（使用Docling默认值）
+                - page_batch_concurrency (int): 页面批并发数，默认None（使用Docling默认值2）
+                - elements_batch_size (int): 元素批大小，默认None（使用Docling默认值）
+                  （以上四项写入Docling全局设置，对进程内所有转换器生效，只在显式配置时写入）
+                - batch_workers (int): batch_convert使用的工作进程数，默认1（在当前进程串行转换）
+                - parse_cache_size (int): 便捷方法共享的解析结果缓存条目数，默认16（0表示不缓存）
         """
         if not DOCLING_AVAILABLE:
             raise ImportError(
@@ -156,6 +926,9 @@ class DoclingParser:
         self.enable_picture_classification = self.config.get('enable_picture_classification', False)
         self.generate_picture_images = self.config.get('generate_picture_images', True)
         self.images_scale = self.config.get('images_scale', 2)
+        self.stream_images = self.config.get('stream_images', False)
+        self.image_temp_dir = self.config.get('image_temp_dir', None)
+        self._image_dir: Optional[tempfile.TemporaryDirectory] = None
 
         # 内容识别配置
         self.enable_formula_enrichment = self.config.get('enable_formula_enrichment', False)
@@ -171,151 +944,254 @@ class DoclingParser:
         self.use_vlm_pipeline = self.config.get('use_vlm_pipeline', False)
         self.vlm_model = self.config.get('vlm_model', None)
         self.custom_backend = self.config.get('custom_backend', None)
+        self.backend_strategy = self.config.get('backend_strategy', 'auto')
+        self.conversion_timeout = self.config.get('conversion_timeout', None)
         self.allowed_formats = self.config.get('allowed_formats', None)
-
-        # 支持的文件格式映射（必须在_init_converter之前设置）
-        self.supported_formats = {
-            '.pdf': InputFormat.PDF,
-            '.docx': InputFormat.DOCX,
-            '.doc': InputFormat.DOCX,  # 通过docx处理
-            '.html': InputFormat.HTML,
-            '.htm': InputFormat.HTML,
-            '.xlsx': InputFormat.XLSX,
-            '.xls': InputFormat.XLSX,  # 通过xlsx处理
-            '.csv': InputFormat.CSV,
-            '.md': InputFormat.MD,
-            '.markdown': InputFormat.MD,
-            '.txt': InputFormat.MD,  # 作为markdown处理
-            '.png': InputFormat.IMAGE,
-            '.jpg': InputFormat.IMAGE,
-            '.jpeg': InputFormat.IMAGE,
-            '.gif': InputFormat.IMAGE,
-            '.bmp': InputFormat.IMAGE,
-            '.tiff': InputFormat.IMAGE,
-            '.tif': InputFormat.IMAGE,
-            '.pptx': InputFormat.PPTX,
-            '.ppt': InputFormat.PPTX,  # 通过pptx处理
+        self.compact_reading_order = self.config.get('compact_reading_order', False)
+        self.reading_order_limit = self.config.get('reading_order_limit', 2000)
+
+        # 性能配置
+        self.num_threads = self.config.get('num_threads', None)
+        self.accelerator_device = self.config.get('accelerator_device', 'auto')
+        self.doc_batch_size = self.config.get('doc_batch_size', None)
+        self.page_batch_size = self.config.get('page_batch_size', None)
+        self.page_batch_concurrency = self.config.get('page_batch_concurrency', None)
+        self.elements_batch_size = self.config.get('elements_batch_size', None)
+        self.batch_workers = self.config.get('batch_workers', 1)
+
+        # 解析结果缓存，键为(路径, 修改时间, 文件大小)，按LRU淘汰
+        self.parse_cache_size = self.config.get('parse_cache_size', 16)
+        self._parse_cache: 'OrderedDict[Tuple[str, int, int], Tuple[DoclingParseResult, bool]]' = OrderedDict()
+
+        # 统计信息中报告的功能开关，只依赖初始化配置
+        self._features_used = {
+            'ocr': self.enable_ocr,
+            'table_structure': self.enable_table_structure,
+            'picture_description': self.enable_picture_description,
+            'formula_enrichment': self.enable_formula_enrichment,
+            'code_enrichment': self.enable_code_enrichment
         }
 
+        # 支持的文件格式映射（必须在_init_converter之前设置，模块级共享只读映射）
+        self.supported_formats = _SUPPORTED_FORMATS
+        self._supported_suffixes = _SUPPORTED_SUFFIXES
+
         # 初始化Docling转换器（必须在supported_formats设置之后）
         self._init_converter()
     
+    def _converter_options(self) -> ConverterOptions:
+        """构建影响转换器的配置子集"""
+        allowed_formats = self.allowed_formats
+        if allowed_formats is None:
+            allowed_formats = self.supported_formats.values()
+
+        return ConverterOptions(
+            enable_ocr=self.enable_ocr,
+            ocr_engine=self.ocr_engine,
+            enable_table_structure=self.enable_table_structure,
+            table_mode=self.table_mode,
+            enable_cell_matching=self.enable_cell_matching,
+            enable_picture_description=self.enable_picture_description,
+            picture_description_model=self.picture_description_model,
+            picture_description_prompt=self.picture_description_prompt,
+            enable_picture_classification=self.enable_picture_classification,
+            generate_picture_images=self.generate_picture_images,
+            images_scale=self.images_scale,
+            enable_formula_enrichment=self.enable_formula_enrichment,
+            enable_code_enrichment=self.enable_code_enrichment,
+            artifacts_path=self.artifacts_path,
+            enable_remote_services=self.enable_remote_services,
+            use_vlm_pipeline=self.use_vlm_pipeline,
+            vlm_model=self.vlm_model,
+            custom_backend='pypdfium' if self.backend_strategy == 'pypdfium' else self.custom_backend,
+            num_threads=self.num_threads,
+            accelerator_device=self.accelerator_device,
+            allowed_formats=tuple(allowed_formats)
+        )
+
+    def _apply_batch_settings(self):
+        """
+        将显式配置的批处理并发参数写入Docling全局性能设置
+
+        docling_settings.perf是进程级设置，写入后对进程内所有转换器生效，
+        未配置的参数保持Docling自身的默认值。
+        """
+        if not DOCLING_SETTINGS_AVAILABLE:
+            return
+
+        batch_settings = {
+            'doc_batch_size': self.doc_batch_size,
+            'page_batch_size': self.page_batch_size,
+            'page_batch_concurrency': self.page_batch_concurrency,
+            'elements_batch_size': self.elements_batch_size,
+        }
+        for name, value in batch_settings.items():
+            if value is not None and hasattr(docling_settings.perf, name):
+                setattr(docling_settings.perf, name, value)
+
     def _init_converter(self):
         """初始化Docling文档转换器"""
         try:
-            # 配置PDF管道选项
-            pipeline_options = PdfPipelineOptions()
-            pipeline_options.do_ocr = self.enable_ocr
-            pipeline_options.do_table_structure = self.enable_table_structure
-            pipeline_options.do_picture_description = self.enable_picture_description
-            pipeline_options.do_formula_enrichment = self.enable_formula_enrichment
-            pipeline_options.do_code_enrichment = self.enable_code_enrichment
-            pipeline_options.generate_picture_images = self.generate_picture_images
-            pipeline_options.images_scale = self.images_scale
-            pipeline_options.enable_remote_services = self.enable_remote_services
-
-            # 配置图片分类
-            if ADVANCED_OPTIONS_AVAILABLE and self.enable_picture_classification:
-                pipeline_options.do_picture_classification = self.enable_picture_classification
-
-            # 配置表格模式
-            if ADVANCED_OPTIONS_AVAILABLE and hasattr(pipeline_options, 'table_structure_options'):
-                if self.table_mode == 'accurate':
-                    try:
-                        pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
-                    except:
-                        self.logger.warning("无法设置表格模式为accurate，使用默认模式")
+            self._apply_batch_settings()
+            options = self._converter_options()
 
-                pipeline_options.table_structure_options.do_cell_matching = self.enable_cell_matching
+            self.converter = self._make_converter(options)
 
-            # 配置OCR引擎
-            if ADVANCED_OPTIONS_AVAILABLE and self.enable_ocr:
-                if self.ocr_engine == 'tesseract':
-                    try:
-                        pipeline_options.ocr_options = TesseractOcrOptions()
-                    except:
-                        self.logger.warning("无法设置Tesseract OCR，使用默认OCR")
-                elif self.ocr_engine == 'easyocr':
-                    try:
-                        pipeline_options.ocr_options = EasyOcrOptions()
-                    except:
-                        self.logger.warning("无法设置EasyOCR，使用默认OCR")
+            # pypdfium后端转换器在首次需要时创建
+            self._fast_converter = None
 
-            # 配置图片描述
-            if ADVANCED_OPTIONS_AVAILABLE and self.enable_picture_description:
-                if self.picture_description_model and self.picture_description_prompt:
-                    try:
-                        pipeline_options.picture_description_options = PictureDescriptionVlmOptions(
-                            repo_id=self.picture_description_model,
-                            prompt=self.picture_description_prompt
-                        )
-                    except:
-                        self.logger.warning("无法设置自定义图片描述模型，使用默认设置")
-
-            if self.artifacts_path:
-                pipeline_options.artifacts_path = self.artifacts_path
-
-            # 配置格式选项
-            format_options = {
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-            }
-
-            # 配置Word格式选项
-            if WORD_FORMAT_AVAILABLE:
-                try:
-                    format_options[InputFormat.DOCX] = WordFormatOption()
-                except:
-                    self.logger.warning("无法配置Word格式选项")
-
-            # 配置VLM管道
-            if VLM_PIPELINE_AVAILABLE and self.use_vlm_pipeline:
-                try:
-                    vlm_options = None
-                    if self.vlm_model:
-                        vlm_options = VlmPipelineOptions(
-                            vlm_options=getattr(vlm_model_specs, self.vlm_model, None)
-                        )
-
-                    format_options[InputFormat.PDF] = PdfFormatOption(
-                        pipeline_cls=VlmPipeline,
-                        pipeline_options=vlm_options or pipeline_options
-                    )
-                except:
-                    self.logger.warning("无法配置VLM管道，使用标准管道")
-
-            # 配置自定义后端
-            if PYPDFIUM_BACKEND_AVAILABLE and self.custom_backend == 'pypdfium':
-                try:
-                    format_options[InputFormat.PDF] = PdfFormatOption(
-                        pipeline_options=pipeline_options,
-                        backend=PyPdfiumDocumentBackend
-                    )
-                except:
-                    self.logger.warning("无法配置自定义后端，使用默认后端")
-
-            # 确定允许的格式
-            allowed_formats = self.allowed_formats
-            if allowed_formats is None:
-                allowed_formats = list(self.supported_formats.values())
-
-            # 初始化转换器
-            self.converter = DocumentConverter(
-                format_options=format_options,
-                allowed_formats=allowed_formats
-            )
+            # 转换配置变化后旧的解析结果不再有效
+            self._parse_cache.clear()
 
             self.logger.info("Docling转换器初始化成功")
 
         except Exception as e:
             self.logger.error(f"Docling转换器初始化失败: {e}")
             raise
-    
-    def parse(self, file_path: str) -> DoclingParseResult:
+
+    def _validate_suffix(self, suffix: str) -> str:
+        """
+        校验文件扩展名是否支持
+
+        Args:
+            suffix (str): 文件扩展名
+
+        Returns:
+            str: 小写的文件扩展名
+
+        Raises:
+            ValueError: 文件格式不支持
+        """
+        # 扩展名通常已是小写，命中时无需转换
+        if suffix in self._supported_suffixes:
+            return suffix
+
+        suffix = suffix.lower()
+        if suffix not in self._supported_suffixes:
+            raise ValueError(f"不支持的文件格式: {suffix}")
+        return suffix
+
+    def _get_fast_converter(self) -> 'DocumentConverter':
+        """获取使用pypdfium后端的转换器"""
+        if self._fast_converter is None:
+            options = self._converter_options()
+            if options.custom_backend == 'pypdfium' or not PYPDFIUM_BACKEND_AVAILABLE:
+                self._fast_converter = self.converter
+            else:
+                self._fast_converter = self._make_converter(replace(options, custom_backend='pypdfium'))
+        return self._fast_converter
+
+    def _make_converter(self, options: ConverterOptions) -> 'DocumentConverter':
+        """
+        获取转换器：可共享时使用缓存实例，否则为当前解析器单独创建
+
+        Args:
+            options (ConverterOptions): 转换器配置
+
+        Returns:
+            DocumentConverter: 文档转换器
+        """
+        # 自定义图片描述模型可能携带不可复用的状态；超时是单个解析器的管道配置，
+        # 放入缓存键会为每个不同的超时值保留一个加载了模型的转换器，二者均不进入缓存
+        if (self.picture_description_model and self.picture_description_prompt) or self.conversion_timeout:
+            return _create_converter(options, document_timeout=self.conversion_timeout)
+        return _build_converter(options)
+
+    def _select_converter(self, file_path: Optional[Path], file_extension: str,
+                          fast: bool = False) -> 'DocumentConverter':
+        """
+        根据后端策略选择转换器
+
+        Args:
+            file_path (Path, optional): 文件路径，文档流时为None
+            file_extension (str): 文件扩展名
+            fast (bool): 是否强制使用pypdfium后端
+
+        Returns:
+            DocumentConverter: 选中的转换器
+        """
+        if file_extension != '.pdf' or self.backend_strategy == 'dlparse':
+            return self.converter
+
+        if fast:
+            return self._get_fast_converter()
+
+        if (self.backend_strategy == 'auto' and not self.enable_table_structure
+                and file_path is not None and self._is_text_heavy_pdf(file_path)):
+            self.logger.info(f"检测到文本型PDF，使用pypdfium后端: {file_path}")
+            return self._get_fast_converter()
+
+        return self.converter
+
+    def _is_text_heavy_pdf(self, file_path: Path) -> bool:
+        """
+        抽样前几页判断PDF是否以文本为主
+
+        Args:
+            file_path (Path): PDF文件路径
+
+        Returns:
+            bool: 是否为文本型PDF
+        """
+        try:
+            import pymupdf
+        except ImportError:
+            return False
+
+        try:
+            with pymupdf.open(str(file_path)) as doc:
+                sample_pages = min(doc.page_count, _TEXT_HEAVY_SAMPLE_PAGES)
+                if sample_pages == 0:
+                    return False
+
+                text_chars = 0
+                image_count = 0
+                for page_index in range(sample_pages):
+                    page = doc[page_index]
+                    text_chars += len(page.get_text())
+                    image_count += len(page.get_images())
+
+            return (text_chars >= _TEXT_HEAVY_MIN_CHARS_PER_PAGE * sample_pages
+                    and text_chars >= _TEXT_HEAVY_MIN_CHARS_PER_IMAGE * image_count)
+
+        except Exception as e:
+            self.logger.debug(f"PDF文本量检测失败: {e}")
+            return False
+
+    def _convert(self, converter: 'DocumentConverter', source: Any,
+                 page_range: Optional[Tuple[int, int]] = None) -> Any:
+        """
+        执行文档转换，超时由转换器管道的document_timeout控制
+
+        Args:
+            converter (DocumentConverter): 文档转换器
+            source: 文件路径或文档流
+            page_range (tuple, optional): 转换的页码范围(起始页, 结束页)，从1开始且包含两端
+
+        Returns:
+            ConversionResult: Docling转换结果
+        """
+        convert_kwargs = {'source': source}
+        if page_range is not None:
+            # 页数上限由调用方按范围控制，Docling的max_num_pages针对整个文档校验
+            convert_kwargs['page_range'] = page_range
+        elif self.max_num_pages is not None:
+            convert_kwargs['max_num_pages'] = self.max_num_pages
+        if self.max_file_size is not None:
+            convert_kwargs['max_file_size'] = self.max_file_size
+
+        return converter.convert(**convert_kwargs)
+
+    def parse(self, file_path: str, eager: bool = False, fast: bool = False,
+              stream_images: Optional[bool] = None) -> DoclingParseResult:
         """
         解析文档
         
         Args:
             file_path (str): 文档文件路径
+            eager (bool): 是否立即提取结构化数据和结构信息，默认False（首次访问时计算）
+            fast (bool): PDF是否强制使用pypdfium后端，默认False
+            stream_images (bool, optional): 是否将图片写入临时文件，默认跟随stream_images配置
             
         Returns:
             DoclingParseResult: 解析结果
@@ -328,24 +1204,20 @@ class DoclingParser:
         """
         try:
             file_path = Path(file_path)
-            if not file_path.exists():
+            # 单次stat同时完成存在性检查和文件大小读取
+            try:
+                file_size = file_path.stat().st_size
+            except FileNotFoundError:
                 raise FileNotFoundError(f"文档文件不存在: {file_path}")
             
             # 检查文件格式支持
-            file_extension = file_path.suffix.lower()
-            if file_extension not in self.supported_formats:
-                raise ValueError(f"不支持的文件格式: {file_extension}")
+            file_extension = self._validate_suffix(file_path.suffix)
             
             self.logger.info(f"开始使用Docling解析文档: {file_path}")
             
             # 执行转换
-            convert_kwargs = {'source': str(file_path)}
-            if self.max_num_pages is not None:
-                convert_kwargs['max_num_pages'] = self.max_num_pages
-            if self.max_file_size is not None:
-                convert_kwargs['max_file_size'] = self.max_file_size
-
-            conversion_result = self.converter.convert(**convert_kwargs)
+            converter = self._select_converter(file_path, file_extension, fast)
+            conversion_result = self._convert(converter, str(file_path))
             
             # 检查转换状态
             if conversion_result.status.name != "SUCCESS":
@@ -354,26 +1226,8 @@ class DoclingParser:
             # 获取Docling文档对象
             docling_document = conversion_result.document
             
-            # 提取文本内容（转换为Markdown）
-            text_content = docling_document.export_to_markdown()
-            
-            # 提取元数据
-            metadata = self._extract_metadata(docling_document, file_path)
-            
-            # 提取结构化数据
-            structured_data = self._extract_structured_data(docling_document)
-            
-            # 分析文档结构
-            structure_info = self._analyze_structure(docling_document)
-            
-            result = DoclingParseResult(
-                text_content=text_content,
-                metadata=metadata,
-                structured_data=structured_data,
-                structure_info=structure_info,
-                original_format=file_extension,
-                docling_document=docling_document
-            )
+            result = self._build_result(docling_document, file_path, file_extension, file_size, eager,
+                                        stream_images=stream_images)
             
             self.logger.info(f"Docling文档解析完成: {file_path}")
             return result
@@ -385,22 +1239,152 @@ class DoclingParser:
             self.logger.error(f"文档解析失败: {e}")
             raise
     
-    def parse_stream(self, stream: BytesIO, filename: str) -> DoclingParseResult:
+    def _parse_cached(self, file_path: str, with_images: bool = True) -> DoclingParseResult:
+        """
+        解析文档，文件未变化时复用缓存的解析结果
+
+        缓存中的结果已调用detach()释放原始Docling文档对象，并被多次调用共享，
+        调用方需要修改时应先复制。
+
+        Args:
+            file_path (str): 文档文件路径
+            with_images (bool): 调用方是否使用图片，不使用时不把图片写入临时文件
+
+        Returns:
+            DoclingParseResult: 解析结果（只读）
+        """
+        stream_images = None if with_images else False
+        # 图片未写入临时文件时只能从原始文档对象读取，此时不经过缓存，避免缓存持有整个文档
+        if not self.parse_cache_size or (with_images and not self.stream_images):
+            return self.parse(file_path, stream_images=stream_images)
+
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"文档文件不存在: {file_path}")
+
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        entry = self._parse_cache.get(key)
+        # 缓存条目未写出图片而调用方需要图片时重新解析并替换该条目
+        if entry is not None and (entry[1] or not with_images):
+            self._parse_cache.move_to_end(key)
+            self.logger.debug(f"命中解析缓存: {file_path}")
+            return entry[0]
+
+        result = self.parse(file_path, stream_images=stream_images).detach()
+        self._parse_cache[key] = (result, with_images)
+        self._parse_cache.move_to_end(key)
+        if len(self._parse_cache) > self.parse_cache_size:
+            self._parse_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _copy_result(result: DoclingParseResult, **changes) -> DoclingParseResult:
+        """
+        复制缓存中的解析结果，使调用方的修改不影响缓存
+
+        Args:
+            result (DoclingParseResult): 已detach的解析结果
+            **changes: 需要替换的字段
+
+        Returns:
+            DoclingParseResult: 独立的解析结果
+        """
+        fields = {
+            'text_content': result.text_content,
+            'metadata': result.metadata,
+            'structured_data': result.structured_data,
+            'structure_info': result.structure_info,
+            'original_format': result.original_format,
+        }
+        fields.update(changes)
+        for name in ('metadata', 'structured_data', 'structure_info'):
+            fields[name] = copy.deepcopy(fields[name])
+        return DoclingParseResult(**fields)
+
+    def clear_parse_cache(self):
+        """清空解析结果缓存"""
+        self._parse_cache.clear()
+
+    def parse_pages(self, file_path: str, page_batch: int = 4,
+                    eager: bool = False) -> Iterator[DoclingParseResult]:
+        """
+        按页码窗口逐段解析PDF，每次只在内存中保留一个窗口的转换结果
+
+        非PDF文件或无法获取页数时退化为一次完整解析。
+
+        Args:
+            file_path (str): 文档文件路径
+            page_batch (int): 每段包含的页数，默认4
+            eager (bool): 是否立即提取结构化数据和结构信息，默认False
+
+        Yields:
+            DoclingParseResult: 每个页码窗口的解析结果，metadata['page_range']标明页码范围
+        """
+        file_path = Path(file_path)
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"文档文件不存在: {file_path}")
+        file_extension = self._validate_suffix(file_path.suffix)
+
+        page_count = self._get_pdf_page_count(file_path) if file_extension == '.pdf' else 0
+        if not page_count:
+            yield self.parse(str(file_path), eager=eager)
+            return
+
+        if self.max_num_pages is not None:
+            page_count = min(page_count, self.max_num_pages)
+        page_batch = max(1, page_batch)
+
+        self.logger.info(f"开始分段解析文档: {file_path}，共{page_count}页，每段{page_batch}页")
+        converter = self._select_converter(file_path, file_extension)
+
+        for start in range(1, page_count + 1, page_batch):
+            page_range = (start, min(start + page_batch - 1, page_count))
+            conversion_result = self._convert(converter, str(file_path), page_range)
+
+            if conversion_result.status.name != "SUCCESS":
+                raise ConversionError(f"文档转换失败（第{page_range[0]}-{page_range[1]}页）: {conversion_result.status}")
+
+            yield self._build_result(conversion_result.document, file_path, file_extension,
+                                     file_size, eager, page_range)
+
+    def _get_pdf_page_count(self, file_path: Path) -> int:
+        """
+        获取PDF页数
+
+        Args:
+            file_path (Path): PDF文件路径
+
+        Returns:
+            int: 页数，无法读取时为0
+        """
+        try:
+            import pymupdf
+            with pymupdf.open(str(file_path)) as doc:
+                return doc.page_count
+        except Exception as e:
+            self.logger.debug(f"PDF页数读取失败: {e}")
+            return 0
+
+    def parse_stream(self, stream: BytesIO, filename: str, eager: bool = False,
+                     fast: bool = False) -> DoclingParseResult:
         """
         解析文档流
         
         Args:
             stream (BytesIO): 文档数据流
             filename (str): 文件名（用于确定格式）
+            eager (bool): 是否立即提取结构化数据和结构信息，默认False（首次访问时计算）
+            fast (bool): PDF是否强制使用pypdfium后端，默认False
             
         Returns:
             DoclingParseResult: 解析结果
         """
         try:
             # 检查文件格式支持
-            file_extension = Path(filename).suffix.lower()
-            if file_extension not in self.supported_formats:
-                raise ValueError(f"不支持的文件格式: {file_extension}")
+            file_extension = self._validate_suffix(Path(filename).suffix)
             
             self.logger.info(f"开始使用Docling解析文档流: {filename}")
             
@@ -408,13 +1392,8 @@ class DoclingParser:
             document_stream = DocumentStream(name=filename, stream=stream)
             
             # 执行转换
-            convert_kwargs = {'source': document_stream}
-            if self.max_num_pages is not None:
-                convert_kwargs['max_num_pages'] = self.max_num_pages
-            if self.max_file_size is not None:
-                convert_kwargs['max_file_size'] = self.max_file_size
-
-            conversion_result = self.converter.convert(**convert_kwargs)
+            converter = self._select_converter(None, file_extension, fast)
+            conversion_result = self._convert(converter, document_stream)
             
             # 检查转换状态
             if conversion_result.status.name != "SUCCESS":
@@ -423,26 +1402,8 @@ class DoclingParser:
             # 获取Docling文档对象
             docling_document = conversion_result.document
             
-            # 提取文本内容（转换为Markdown）
-            text_content = docling_document.export_to_markdown()
-            
-            # 提取元数据
-            metadata = self._extract_metadata(docling_document, Path(filename))
-            
-            # 提取结构化数据
-            structured_data = self._extract_structured_data(docling_document)
-            
-            # 分析文档结构
-            structure_info = self._analyze_structure(docling_document)
-            
-            result = DoclingParseResult(
-                text_content=text_content,
-                metadata=metadata,
-                structured_data=structured_data,
-                structure_info=structure_info,
-                original_format=file_extension,
-                docling_document=docling_document
-            )
+            file_size = stream.getbuffer().nbytes if hasattr(stream, 'getbuffer') else 0
+            result = self._build_result(docling_document, Path(filename), file_extension, file_size, eager)
             
             self.logger.info(f"Docling文档流解析完成: {filename}")
             return result
@@ -454,32 +1415,164 @@ class DoclingParser:
             self.logger.error(f"文档流解析失败: {e}")
             raise
 
-    def _extract_metadata(self, docling_document: Any, file_path: Path) -> Dict[str, Any]:
+    def _build_result(self, docling_document: Any, file_path: Path, file_extension: str,
+                      file_size: int, eager: bool = False,
+                      page_range: Optional[Tuple[int, int]] = None,
+                      stream_images: Optional[bool] = None) -> DoclingParseResult:
+        """
+        构建解析结果
+
+        Args:
+            docling_document: Docling文档对象
+            file_path: 文件路径
+            file_extension (str): 文件扩展名
+            file_size (int): 文件大小（字节）
+            eager (bool): 是否立即完成文档遍历
+            page_range (tuple, optional): 结果对应的页码范围
+            stream_images (bool, optional): 是否将图片写入临时文件，默认跟随stream_images配置
+
+        Returns:
+            DoclingParseResult: 解析结果
+        """
+        # 提取文本内容（转换为Markdown）
+        text_content = docling_document.export_to_markdown()
+
+        # 将图片移出内存，文档中改为引用临时文件
+        if stream_images is None:
+            stream_images = self.stream_images
+        if stream_images and self.generate_picture_images:
+            self._spill_picture_images(docling_document)
+
+        # 元素统计、结构化数据和结构分析延迟到首次访问时计算
+        metadata = self._extract_metadata(docling_document, file_path, count_elements=False,
+                                          file_size=file_size)
+        if page_range is not None:
+            metadata['page_range'] = list(page_range)
+
+        result = DoclingParseResult(
+            text_content=text_content,
+            metadata=metadata,
+            original_format=file_extension,
+            docling_document=docling_document,
+            parser=self
+        )
+
+        if eager:
+            result.materialize()
+        return result
+
+    def _spill_picture_images(self, docling_document: Any) -> int:
+        """
+        将文档中已生成的图片写入临时PNG文件，并把图片引用替换为文件路径
+
+        图片在需要时由Docling按路径重新加载，解析结果不再常驻图片数据。
+        临时文件位于解析器持有的临时目录中，在close()或解析器被回收时删除。
+
+        Args:
+            docling_document: Docling文档对象
+
+        Returns:
+            int: 写入的图片数量
+        """
+        pictures = getattr(docling_document, 'pictures', None)
+        if not DOCLING_CORE_TYPES_AVAILABLE or not isinstance(pictures, list):
+            return 0
+
+        spilled = 0
+        for picture in pictures:
+            try:
+                image_ref = getattr(picture, 'image', None)
+                if image_ref is None or isinstance(image_ref.uri, Path):
+                    continue
+                pil_image = image_ref.pil_image
+                if pil_image is None:
+                    continue
+
+                with tempfile.NamedTemporaryFile(prefix='picture_', suffix='.png',
+                                                 dir=self._get_image_dir(), delete=False) as image_file:
+                    pil_image.save(image_file, format='PNG')
+
+                picture.image = ImageRef(
+                    mimetype='image/png',
+                    dpi=image_ref.dpi,
+                    size=image_ref.size,
+                    uri=Path(image_file.name)
+                )
+                spilled += 1
+
+            except Exception as e:
+                self.logger.warning(f"图片写入临时文件失败: {e}")
+
+        if spilled:
+            self.logger.debug(f"已将{spilled}张图片写入临时文件")
+        return spilled
+
+    def _get_image_dir(self) -> str:
+        """
+        获取解析器持有的图片临时目录，首次使用时创建
+
+        Returns:
+            str: 临时目录路径
+        """
+        if self._image_dir is None:
+            self._image_dir = tempfile.TemporaryDirectory(prefix='docling_images_', dir=self.image_temp_dir)
+        return self._image_dir.name
+
+    def close(self):
+        """清空解析结果缓存并删除解析过程中写入的临时图片"""
+        self._parse_cache.clear()
+        if self._image_dir is not None:
+            self._image_dir.cleanup()
+            self._image_dir = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _extract_metadata(self, docling_document: Any, file_path: Path,
+                          walk: Optional[Tuple] = None, count_elements: bool = True,
+                          file_size: Optional[int] = None) -> Dict[str, Any]:
         """
         提取文档元数据
 
         Args:
             docling_document: Docling文档对象
             file_path: 文件路径
+            walk (tuple, optional): _walk_document的遍历结果，未提供时重新遍历
+            count_elements (bool): 是否包含元素统计，默认True
+            file_size (int, optional): 已知的文件大小，未提供时读取文件信息
 
         Returns:
             dict: 元数据信息
         """
         try:
+            if file_size is None:
+                try:
+                    file_size = file_path.stat().st_size
+                except OSError:
+                    file_size = 0
+
             metadata = {
                 'file_name': file_path.name,
                 'file_path': str(file_path),
                 'file_extension': file_path.suffix.lower(),
-                'file_size': file_path.stat().st_size if file_path.exists() else 0,
+                'file_size': file_size,
                 'parser_type': 'docling',
                 'docling_version': getattr(docling_document, 'version', 'unknown'),
             }
 
             # 尝试提取Docling文档的元数据
-            if hasattr(docling_document, 'meta') and docling_document.meta:
-                doc_meta = docling_document.meta
-                if hasattr(doc_meta, 'export_json_dict'):
-                    metadata.update(doc_meta.export_json_dict())
+            doc_meta = getattr(docling_document, 'meta', None)
+            if doc_meta:
+                picked = {}
+                for name in _DOCUMENT_META_FIELDS:
+                    value = getattr(doc_meta, name, None)
+                    if value is not None:
+                        picked[name] = value
+                if picked:
+                    metadata.update(picked)
                 else:
                     metadata['docling_meta'] = str(doc_meta)
 
@@ -495,8 +1588,9 @@ class DoclingParser:
                         })
 
             # 统计文档元素
-            element_counts = self._count_document_elements(docling_document)
-            metadata.update(element_counts)
+            if count_elements:
+                element_counts = self._count_document_elements(docling_document, walk)
+                metadata.update(element_counts)
 
             return metadata
 
@@ -510,68 +1604,123 @@ class DoclingParser:
                 'error': str(e)
             }
 
-    def _extract_structured_data(self, docling_document: Any) -> Dict[str, Any]:
+    def _safe_walk_document(self, docling_document: Any) -> Optional[Tuple]:
+        """遍历文档元素，失败时返回None，由各提取方法自行记录错误"""
+        try:
+            return self._walk_document(docling_document)
+        except Exception as e:
+            self.logger.warning(f"文档元素遍历失败: {e}")
+            return None
+
+    def _walk_document(self, docling_document: Any) -> Tuple[Dict[str, int], Dict[str, List[Dict[str, Any]]],
+                                                            List[Any], int, Dict[str, int]]:
+        """
+        单次遍历文档元素，同时完成元素统计、结构化数据提取和阅读顺序记录
+
+        阅读顺序默认为每个元素一条{'type', 'level', 'text_preview'}字典。启用compact_reading_order时
+        条目为(类型序号, 层级, 文本预览, 数量)元组，类型序号对应类型分布的键顺序：
+        仅文本和标题元素生成文本预览；其他元素预览为None，同类型同层级的连续元素合并为一条，
+        数量为合并的元素个数。超过reading_order_limit后只继续累计类型分布。
+
+        Args:
+            docling_document: Docling文档对象
+
+        Returns:
+            tuple: (元素统计, 结构化数据, 阅读顺序, 最大层级, 类型分布)
+        """
+        counts = dict.fromkeys(_ELEMENT_COUNT_KEYS, 0)
+        structured_data = {key: [] for key in _STRUCTURED_DATA_KEYS.values()}
+        reading_order = []
+        max_level = 0
+        type_counts = {}
+
+        iterate_items = getattr(docling_document, 'iterate_items', None)
+        if iterate_items is None:
+            return counts, structured_data, reading_order, max_level, type_counts
+
+        extractors = {
+            'table': self._extract_table_data,
+            'image': self._extract_image_data,
+            'list': self._extract_list_data,
+            'code': self._extract_code_data,
+            'formula': self._extract_formula_data,
+        }
+        get_preview = self._get_item_text_preview
+        get_type_info = _ITEM_TYPE_INFO_CACHE.get
+        type_index = {}
+        compact = self.compact_reading_order
+        reading_order_limit = self.reading_order_limit
+        reading_order_full = False
+
+        for item, level in iterate_items():
+            item_cls = type(item)
+            item_type, count_key, kind = get_type_info(item_cls) or _item_type_info(item_cls)
+
+            counts['total_elements'] += 1
+            if count_key:
+                counts[count_key] += 1
+
+            if kind == 'heading':
+                element_data = self._extract_heading_data(item, level)
+            elif kind:
+                element_data = extractors[kind](item)
+            else:
+                element_data = None
+            if element_data:
+                structured_data[_STRUCTURED_DATA_KEYS[kind]].append(element_data)
+
+            if level > max_level:
+                max_level = level
+
+            index = type_index.get(item_type)
+            if index is None:
+                index = type_index[item_type] = len(type_index)
+                type_counts[item_type] = 0
+            type_counts[item_type] += 1
+
+            if not compact:
+                reading_order.append({
+                    'type': item_type,
+                    'level': level,
+                    'text_preview': get_preview(item)
+                })
+                continue
+
+            if reading_order_full:
+                continue
+
+            if count_key == 'text_elements' or kind == 'heading':
+                entry = (index, level, get_preview(item), 1)
+            else:
+                last = reading_order[-1] if reading_order else None
+                if last is not None and last[2] is None and last[0] == index and last[1] == level:
+                    reading_order[-1] = (index, level, None, last[3] + 1)
+                    continue
+                entry = (index, level, None, 1)
+
+            if reading_order_limit is None or len(reading_order) < reading_order_limit:
+                reading_order.append(entry)
+            else:
+                reading_order_full = True
+
+        return counts, structured_data, reading_order, max_level, type_counts
+
+    def _extract_structured_data(self, docling_document: Any,
+                                 walk: Optional[Tuple] = None) -> Dict[str, Any]:
         """
         提取结构化数据
 
         Args:
             docling_document: Docling文档对象
+            walk (tuple, optional): _walk_document的遍历结果，未提供时重新遍历
 
         Returns:
             dict: 结构化数据
         """
         try:
-            structured_data = {
-                'tables': [],
-                'images': [],
-                'headings': [],
-                'lists': [],
-                'code_blocks': [],
-                'formulas': []
-            }
-
-            # 遍历文档元素
-            if hasattr(docling_document, 'iterate_items'):
-                for item, level in docling_document.iterate_items():
-                    item_type = type(item).__name__
-
-                    # 处理表格
-                    if 'Table' in item_type:
-                        table_data = self._extract_table_data(item)
-                        if table_data:
-                            structured_data['tables'].append(table_data)
-
-                    # 处理图片
-                    elif 'Picture' in item_type or 'Image' in item_type:
-                        image_data = self._extract_image_data(item)
-                        if image_data:
-                            structured_data['images'].append(image_data)
-
-                    # 处理标题
-                    elif 'Heading' in item_type or 'Title' in item_type:
-                        heading_data = self._extract_heading_data(item, level)
-                        if heading_data:
-                            structured_data['headings'].append(heading_data)
-
-                    # 处理列表
-                    elif 'List' in item_type:
-                        list_data = self._extract_list_data(item)
-                        if list_data:
-                            structured_data['lists'].append(list_data)
-
-                    # 处理代码块
-                    elif 'Code' in item_type:
-                        code_data = self._extract_code_data(item)
-                        if code_data:
-                            structured_data['code_blocks'].append(code_data)
-
-                    # 处理公式
-                    elif 'Formula' in item_type or 'Equation' in item_type:
-                        formula_data = self._extract_formula_data(item)
-                        if formula_data:
-                            structured_data['formulas'].append(formula_data)
-
-            return structured_data
+            if walk is None:
+                walk = self._walk_document(docling_document)
+            return walk[1]
 
         except Exception as e:
             self.logger.error(f"结构化数据提取失败: {e}")
@@ -585,12 +1734,14 @@ class DoclingParser:
                 'error': str(e)
             }
 
-    def _analyze_structure(self, docling_document: Any) -> Dict[str, Any]:
+    def _analyze_structure(self, docling_document: Any,
+                           walk: Optional[Tuple] = None) -> Dict[str, Any]:
         """
         分析文档结构
 
         Args:
             docling_document: Docling文档对象
+            walk (tuple, optional): _walk_document的遍历结果，未提供时重新遍历
 
         Returns:
             dict: 结构分析信息
@@ -609,27 +1760,19 @@ class DoclingParser:
             if hasattr(docling_document, 'meta') and docling_document.meta:
                 structure['document_type'] = getattr(docling_document.meta, 'document_type', 'unknown')
 
-            # 分析层次结构
-            max_level = 0
-            element_counts = {}
-
-            if hasattr(docling_document, 'iterate_items'):
-                for item, level in docling_document.iterate_items():
-                    item_type = type(item).__name__
-                    max_level = max(max_level, level)
-
-                    # 统计元素类型
-                    element_counts[item_type] = element_counts.get(item_type, 0) + 1
-
-                    # 记录阅读顺序
-                    structure['reading_order'].append({
-                        'type': item_type,
-                        'level': level,
-                        'text_preview': self._get_item_text_preview(item)
-                    })
+            if walk is None:
+                walk = self._walk_document(docling_document)
+            _, _, reading_order, max_level, element_counts = walk
 
             structure['hierarchy_levels'] = max_level
             structure['element_distribution'] = element_counts
+            structure['reading_order'] = reading_order
+            if self.compact_reading_order:
+                # 紧凑条目为(类型序号, 层级, 文本预览, 数量)，类型序号对应reading_order_types
+                structure['reading_order_types'] = list(element_counts)
+                structure['reading_order_truncated'] = (
+                    sum(entry[3] for entry in reading_order) < sum(element_counts.values())
+                )
 
             # 检查是否有目录
             if 'Heading' in element_counts or 'Title' in element_counts:
@@ -648,240 +1791,195 @@ class DoclingParser:
                 'error': str(e)
             }
 
-    def _count_document_elements(self, docling_document: Any) -> Dict[str, int]:
+    def _count_document_elements(self, docling_document: Any,
+                                 walk: Optional[Tuple] = None) -> Dict[str, int]:
         """统计文档元素数量"""
         try:
-            counts = {
-                'total_elements': 0,
-                'text_elements': 0,
-                'table_elements': 0,
-                'image_elements': 0,
-                'heading_elements': 0,
-                'list_elements': 0,
-                'code_elements': 0,
-                'formula_elements': 0
-            }
-
-            if hasattr(docling_document, 'iterate_items'):
-                for item, level in docling_document.iterate_items():
-                    item_type = type(item).__name__
-                    counts['total_elements'] += 1
-
-                    if 'Text' in item_type:
-                        counts['text_elements'] += 1
-                    elif 'Table' in item_type:
-                        counts['table_elements'] += 1
-                    elif 'Picture' in item_type or 'Image' in item_type:
-                        counts['image_elements'] += 1
-                    elif 'Heading' in item_type or 'Title' in item_type:
-                        counts['heading_elements'] += 1
-                    elif 'List' in item_type:
-                        counts['list_elements'] += 1
-                    elif 'Code' in item_type:
-                        counts['code_elements'] += 1
-                    elif 'Formula' in item_type or 'Equation' in item_type:
-                        counts['formula_elements'] += 1
-
-            return counts
+            if walk is None:
+                return self._tally_elements(docling_document)
+            return walk[0]
 
         except Exception as e:
             self.logger.error(f"元素统计失败: {e}")
-            return {
-                'total_elements': 0,
-                'text_elements': 0,
-                'table_elements': 0,
-                'image_elements': 0,
-                'heading_elements': 0,
-                'list_elements': 0,
-                'code_elements': 0,
-                'formula_elements': 0
-            }
+            return dict.fromkeys(_ELEMENT_COUNT_KEYS, 0)
 
-    def _extract_table_data(self, table_item: Any) -> Optional[Dict[str, Any]]:
-        """提取表格数据"""
-        try:
-            table_data = {
-                'type': 'table',
-                'data': [],
-                'rows': 0,
-                'columns': 0,
-                'caption': '',
-                'bbox': None
-            }
+    def _tally_elements(self, docling_document: Any) -> Dict[str, int]:
+        """
+        仅统计元素数量，不提取结构化数据和阅读顺序
 
-            # 尝试导出为DataFrame
-            if hasattr(table_item, 'export_to_dataframe'):
-                import pandas as pd
-                df = table_item.export_to_dataframe()
-                table_data['data'] = df.values.tolist()
-                table_data['rows'] = len(df)
-                table_data['columns'] = len(df.columns)
-                table_data['headers'] = df.columns.tolist()
+        Args:
+            docling_document: Docling文档对象
 
-            # 获取表格文本
-            if hasattr(table_item, 'text'):
-                table_data['text'] = table_item.text
+        Returns:
+            dict: 元素统计
+        """
+        counts = dict.fromkeys(_ELEMENT_COUNT_KEYS, 0)
+        iterate_items = getattr(docling_document, 'iterate_items', None)
+        if iterate_items is None:
+            return counts
 
-            # 获取边界框
-            if hasattr(table_item, 'bbox'):
-                table_data['bbox'] = table_item.bbox
+        get_type_info = _ITEM_TYPE_INFO_CACHE.get
+        total = 0
+        for item, _ in iterate_items():
+            item_cls = type(item)
+            count_key = (get_type_info(item_cls) or _item_type_info(item_cls))[1]
+            total += 1
+            if count_key:
+                counts[count_key] += 1
+        counts['total_elements'] = total
+        return counts
 
-            return table_data
+    def _extract_table_data(self, table_item: Any) -> Optional[Dict[str, Any]]:
+        """提取表格数据"""
+        table_data = {
+            'type': 'table',
+            'data': [],
+            'rows': 0,
+            'columns': 0,
+            'caption': '',
+            'bbox': getattr(table_item, 'bbox', None)
+        }
 
+        # 优先直接读取单元格网格，无法读取时才导出为DataFrame
+        try:
+            grid = getattr(getattr(table_item, 'data', None), 'grid', None)
+            if grid is not None:
+                headers, rows = self._split_table_grid(grid)
+            elif hasattr(table_item, 'export_to_dataframe'):
+                df = table_item.export_to_dataframe()
+                headers, rows = df.columns.tolist(), df.values.tolist()
+            else:
+                headers, rows = None, None
         except Exception as e:
             self.logger.warning(f"表格数据提取失败: {e}")
             return None
 
-    def _extract_image_data(self, image_item: Any) -> Optional[Dict[str, Any]]:
-        """提取图片数据"""
-        try:
-            image_data = {
-                'type': 'image',
-                'caption': '',
-                'description': '',
-                'bbox': None,
-                'size': None
-            }
+        if rows is not None:
+            table_data['data'] = rows
+            table_data['rows'] = len(rows)
+            table_data['columns'] = len(headers)
+            table_data['headers'] = headers
 
-            # 获取图片描述
-            if hasattr(image_item, 'text'):
-                image_data['description'] = image_item.text
+        # 获取表格文本
+        text = getattr(table_item, 'text', None)
+        if text is not None:
+            table_data['text'] = text
 
-            # 获取边界框
-            if hasattr(image_item, 'bbox'):
-                image_data['bbox'] = image_item.bbox
+        return table_data
 
-            # 获取图片尺寸
-            if hasattr(image_item, 'size'):
-                image_data['size'] = {
-                    'width': image_item.size.width,
-                    'height': image_item.size.height
-                }
+    @staticmethod
+    def _split_table_grid(grid: List[List[Any]]) -> Tuple[List[Any], List[List[str]]]:
+        """
+        将表格单元格网格拆分为表头和数据行
 
-            return image_data
+        与Docling的export_to_dataframe保持一致：开头连续的含列标题单元格的行作为表头，
+        多行表头按列以'.'连接；没有表头时使用列序号。
 
-        except Exception as e:
-            self.logger.warning(f"图片数据提取失败: {e}")
-            return None
+        Args:
+            grid (list): 单元格网格
 
-    def _extract_heading_data(self, heading_item: Any, level: int) -> Optional[Dict[str, Any]]:
-        """提取标题数据"""
-        try:
-            heading_data = {
-                'type': 'heading',
-                'text': '',
-                'level': level,
-                'bbox': None
-            }
+        Returns:
+            tuple: (表头列表, 数据行列表)
+        """
+        num_headers = 0
+        for row in grid:
+            if not any(cell.column_header for cell in row):
+                break
+            num_headers += 1
 
-            # 获取标题文本
-            if hasattr(heading_item, 'text'):
-                heading_data['text'] = heading_item.text
+        rows = [[cell.text for cell in row] for row in grid[num_headers:]]
 
-            # 获取边界框
-            if hasattr(heading_item, 'bbox'):
-                heading_data['bbox'] = heading_item.bbox
+        if num_headers:
+            headers = [''] * len(grid[0])
+            for row in grid[:num_headers]:
+                for j, cell in enumerate(row):
+                    headers[j] = f"{headers[j]}.{cell.text}" if headers[j] else cell.text
+        else:
+            headers = list(range(len(rows[0]))) if rows else []
 
-            return heading_data
+        return headers, rows
 
-        except Exception as e:
-            self.logger.warning(f"标题数据提取失败: {e}")
-            return None
+    def _extract_image_data(self, image_item: Any) -> Optional[Dict[str, Any]]:
+        """提取图片数据"""
+        image_data = {
+            'type': 'image',
+            'caption': '',
+            'description': getattr(image_item, 'text', ''),
+            'bbox': getattr(image_item, 'bbox', None),
+            'size': None
+        }
 
-    def _extract_list_data(self, list_item: Any) -> Optional[Dict[str, Any]]:
-        """提取列表数据"""
-        try:
-            list_data = {
-                'type': 'list',
-                'items': [],
-                'list_type': 'unordered',
-                'bbox': None
+        # 获取图片尺寸
+        size = getattr(image_item, 'size', None)
+        if size is not None:
+            image_data['size'] = {
+                'width': getattr(size, 'width', None),
+                'height': getattr(size, 'height', None)
             }
 
-            # 获取列表文本
-            if hasattr(list_item, 'text'):
-                list_data['text'] = list_item.text
-                # 简单解析列表项
-                lines = list_item.text.split('\n')
-                list_data['items'] = [line.strip() for line in lines if line.strip()]
-
-            # 获取边界框
-            if hasattr(list_item, 'bbox'):
-                list_data['bbox'] = list_item.bbox
-
-            return list_data
-
-        except Exception as e:
-            self.logger.warning(f"列表数据提取失败: {e}")
-            return None
+        # 获取图片文件路径（图片已写入临时文件时）
+        image_uri = getattr(getattr(image_item, 'image', None), 'uri', None)
+        if isinstance(image_uri, Path):
+            image_data['image_path'] = str(image_uri)
 
-    def _extract_code_data(self, code_item: Any) -> Optional[Dict[str, Any]]:
-        """提取代码数据"""
-        try:
-            code_data = {
-                'type': 'code',
-                'code': '',
-                'language': 'unknown',
-                'bbox': None
-            }
+        return image_data
 
-            # 获取代码文本
-            if hasattr(code_item, 'text'):
-                code_data['code'] = code_item.text
+    def _extract_heading_data(self, heading_item: Any, level: int) -> Optional[Dict[str, Any]]:
+        """提取标题数据"""
+        return {
+            'type': 'heading',
+            'text': getattr(heading_item, 'text', ''),
+            'level': level,
+            'bbox': getattr(heading_item, 'bbox', None)
+        }
 
-            # 获取编程语言
-            if hasattr(code_item, 'language'):
-                code_data['language'] = code_item.language
+    def _extract_list_data(self, list_item: Any) -> Optional[Dict[str, Any]]:
+        """提取列表数据"""
+        list_data = {
+            'type': 'list',
+            'items': [],
+            'list_type': 'unordered',
+            'bbox': getattr(list_item, 'bbox', None)
+        }
 
-            # 获取边界框
-            if hasattr(code_item, 'bbox'):
-                code_data['bbox'] = code_item.bbox
+        # 获取列表文本并简单解析列表项
+        text = getattr(list_item, 'text', None)
+        if isinstance(text, str):
+            list_data['text'] = text
+            list_data['items'] = [line for line in map(str.strip, text.split('\n')) if line]
 
-            return code_data
+        return list_data
 
-        except Exception as e:
-            self.logger.warning(f"代码数据提取失败: {e}")
-            return None
+    def _extract_code_data(self, code_item: Any) -> Optional[Dict[str, Any]]:
+        """提取代码数据"""
+        return {
+            'type': 'code',
+            'code': getattr(code_item, 'text', ''),
+            'language': getattr(code_item, 'language', 'unknown'),
+            'bbox': getattr(code_item, 'bbox', None)
+        }
 
     def _extract_formula_data(self, formula_item: Any) -> Optional[Dict[str, Any]]:
         """提取公式数据"""
-        try:
-            formula_data = {
-                'type': 'formula',
-                'latex': '',
-                'text': '',
-                'bbox': None
-            }
-
-            # 获取LaTeX格式
-            if hasattr(formula_item, 'latex'):
-                formula_data['latex'] = formula_item.latex
-
-            # 获取文本格式
-            if hasattr(formula_item, 'text'):
-                formula_data['text'] = formula_item.text
-
-            # 获取边界框
-            if hasattr(formula_item, 'bbox'):
-                formula_data['bbox'] = formula_item.bbox
-
-            return formula_data
-
-        except Exception as e:
-            self.logger.warning(f"公式数据提取失败: {e}")
-            return None
+        return {
+            'type': 'formula',
+            'latex': getattr(formula_item, 'latex', ''),
+            'text': getattr(formula_item, 'text', ''),
+            'bbox': getattr(formula_item, 'bbox', None)
+        }
 
     def _get_item_text_preview(self, item: Any, max_length: int = 100) -> str:
         """获取元素文本预览"""
-        try:
-            if hasattr(item, 'text') and item.text:
-                text = str(item.text).strip()
-                if len(text) > max_length:
-                    return text[:max_length] + "..."
-                return text
-            return ""
-        except Exception:
+        text = getattr(item, 'text', None)
+        if not text:
             return ""
+        # 文本通常已是str，仅在必要时转换
+        if not isinstance(text, str):
+            text = str(text)
+        text = text.strip()
+        if len(text) > max_length:
+            return text[:max_length] + "..."
+        return text
 
     def get_supported_formats(self) -> List[str]:
         """
@@ -902,8 +2000,10 @@ class DoclingParser:
         Returns:
             bool: 是否支持该格式
         """
-        file_extension = Path(file_path).suffix.lower()
-        return file_extension in self.supported_formats
+        # splitext避免为每次检查构造Path对象
+        file_extension = os.path.splitext(file_path)[1]
+        return (file_extension in self._supported_suffixes
+                or file_extension.lower() in self._supported_suffixes)
 
     def extract_text_only(self, file_path: str) -> str:
         """
@@ -916,7 +2016,7 @@ class DoclingParser:
             str: 提取的文本内容
         """
         try:
-            result = self.parse(file_path)
+            result = self._parse_cached(file_path, with_images=False)
             return result.text_content
         except Exception as e:
             self.logger.error(f"文本提取失败: {e}")
@@ -933,8 +2033,8 @@ class DoclingParser:
             dict: 提取的元数据
         """
         try:
-            result = self.parse(file_path)
-            return result.metadata
+            result = self._parse_cached(file_path, with_images=False)
+            return copy.deepcopy(result.metadata)
         except Exception as e:
             self.logger.error(f"元数据提取失败: {e}")
             return {}
@@ -951,14 +2051,13 @@ class DoclingParser:
             str: Markdown内容
         """
         try:
-            result = self.parse(file_path)
+            result = self._parse_cached(file_path, with_images=False)
             markdown_content = result.text_content
 
             if output_path:
                 output_path = Path(output_path)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
+                _write_text(output_path, markdown_content)
                 self.logger.info(f"Markdown文件已保存到: {output_path}")
 
             return markdown_content
@@ -967,40 +2066,225 @@ class DoclingParser:
             self.logger.error(f"Markdown转换失败: {e}")
             raise
 
-    def batch_convert(self, file_paths: List[str], output_dir: Optional[str] = None) -> List[DoclingParseResult]:
+    def batch_convert(self, file_paths: List[str], output_dir: Optional[str] = None,
+                      batch_size: Optional[int] = None,
+                      n_workers: Optional[int] = None) -> List[DoclingParseResult]:
         """
         批量转换文档
 
+        同一批次内使用相同转换器的文档通过一次convert_all调用提交，共享Docling管道和模型状态。
+        单文档超时由管道的document_timeout控制。
+
+        Args:
+            file_paths (list): 文件路径列表
+            output_dir (str, optional): 输出目录
+            batch_size (int, optional): 每批提交给Docling的文件数，用于限制内存峰值，默认None（一次提交全部）
+            n_workers (int, optional): 工作进程数，默认使用batch_workers配置
+
+        Returns:
+            list: 解析结果列表，按输入顺序排列，处理失败的文件被跳过
+        """
+        if n_workers is None:
+            n_workers = self.batch_workers
+        if n_workers > 1 and len(file_paths) > 1:
+            return self._batch_convert_parallel(file_paths, output_dir, batch_size, n_workers)
+
+        # 输出路径按字符串拼接，避免逐文件构造Path
+        output_dir_str = None
+        if output_dir:
+            output_dir_str = os.fspath(output_dir)
+            os.makedirs(output_dir_str, exist_ok=True)
+
+        # 提交前完成存在性和格式检查，不合格的文件直接跳过
+        entries = []
+        for file_path in file_paths:
+            try:
+                path = Path(file_path)
+                try:
+                    file_size = path.stat().st_size
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"文档文件不存在: {path}")
+                entries.append((path, self._validate_suffix(path.suffix), file_size))
+            except Exception as e:
+                self.logger.error(f"文件{file_path}处理失败: {e}")
+
+        if not entries:
+            return []
+
+        batch_size = max(1, batch_size or len(entries))
+        indexed_results = []
+
+        for start in range(0, len(entries), batch_size):
+            batch = list(enumerate(entries[start:start + batch_size], start))
+            for index, (path, file_extension, file_size), conversion_result in self._convert_batch(batch):
+                try:
+                    if conversion_result.status.name != "SUCCESS":
+                        raise ConversionError(f"文档转换失败: {conversion_result.status}")
+
+                    result = self._build_result(conversion_result.document, path,
+                                                file_extension, file_size)
+                    indexed_results.append((index, result))
+
+                    # 如果指定了输出目录，保存Markdown文件
+                    if output_dir_str is not None:
+                        self._write_markdown(result, os.path.join(output_dir_str, f"{path.stem}.md"))
+
+                except Exception as e:
+                    self.logger.error(f"文件{path}处理失败: {e}")
+                    continue
+
+        indexed_results.sort(key=lambda item: item[0])
+        return [result for _, result in indexed_results]
+
+    def _batch_convert_parallel(self, file_paths: List[str], output_dir: Optional[str],
+                                batch_size: Optional[int], n_workers: int) -> List[DoclingParseResult]:
+        """
+        使用进程池并行批量转换，Markdown文件由主进程的写入线程保存
+
         Args:
             file_paths (list): 文件路径列表
             output_dir (str, optional): 输出目录
+            batch_size (int, optional): 每个任务包含的文件数，默认按进程数均分
+            n_workers (int): 工作进程数
 
         Returns:
-            list: 解析结果列表
+            list: 解析结果列表，按输入顺序排列，处理失败的文件被跳过
         """
+        if not batch_size:
+            batch_size = -(-len(file_paths) // n_workers)
+        chunks = [file_paths[i:i + batch_size] for i in range(0, len(file_paths), batch_size)]
+        n_workers = min(n_workers, len(chunks))
+
+        # 输出路径按字符串拼接，避免逐文件构造Path
+        output_dir_str = None
+        if output_dir:
+            output_dir_str = os.fspath(output_dir)
+            os.makedirs(output_dir_str, exist_ok=True)
+
+        self.logger.info(f"开始并行批量转换{len(file_paths)}个文档，进程数: {n_workers}，批大小: {batch_size}")
+
         results = []
+        writes = []
+        try:
+            with ThreadPoolExecutor(max_workers=1) as writer, \
+                    ProcessPoolExecutor(max_workers=n_workers,
+                                        initializer=_init_parse_worker,
+                                        initargs=(self.config,)) as executor:
+                for chunk_results in executor.map(_batch_convert_worker, chunks):
+                    for result in chunk_results:
+                        results.append(result)
+                        if output_dir_str is not None:
+                            stem = os.path.splitext(result.metadata['file_name'])[0]
+                            output_file = os.path.join(output_dir_str, f"{stem}.md")
+                            writes.append(writer.submit(self._write_markdown, result, output_file))
+        except Exception as e:
+            self.logger.error(f"并行批量转换失败: {e}")
+            raise
 
-        for file_path in file_paths:
+        for write in writes:
             try:
-                result = self.parse(file_path)
-                results.append(result)
+                write.result()
+            except Exception as e:
+                self.logger.error(f"Markdown文件保存失败: {e}")
+
+        return results
+
+    def _write_markdown(self, result: DoclingParseResult, output_file: Union[str, Path]):
+        """
+        将解析结果的Markdown内容写入文件
 
-                # 如果指定了输出目录，保存Markdown文件
-                if output_dir:
-                    output_dir_path = Path(output_dir)
-                    output_dir_path.mkdir(parents=True, exist_ok=True)
+        Args:
+            result (DoclingParseResult): 解析结果
+            output_file (str | Path): 输出文件路径
+        """
+        _write_text(output_file, result.text_content)
 
-                    input_path = Path(file_path)
-                    output_file = output_dir_path / f"{input_path.stem}.md"
+        self.logger.info(f"已保存: {output_file}")
 
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(result.text_content)
+    def _convert_batch(self, batch: List[Tuple[int, Tuple[Path, str, int]]]) -> Iterator[Tuple]:
+        """
+        按转换器分组，通过convert_all批量转换一批文档
 
-                    self.logger.info(f"已保存: {output_file}")
+        Args:
+            batch (list): (序号, (文件路径, 扩展名, 文件大小))列表
 
+        Yields:
+            tuple: (序号, (文件路径, 扩展名, 文件大小), ConversionResult)
+        """
+        groups: Dict[int, Tuple[Any, List]] = {}
+        for index, entry in batch:
+            path, file_extension, _ = entry
+            try:
+                converter = self._select_converter(path, file_extension)
             except Exception as e:
-                self.logger.error(f"文件{file_path}处理失败: {e}")
+                self.logger.error(f"文件{path}处理失败: {e}")
                 continue
+            groups.setdefault(id(converter), (converter, []))[1].append((index, entry))
+
+        convert_kwargs = {'raises_on_error': False}
+        if self.max_num_pages is not None:
+            convert_kwargs['max_num_pages'] = self.max_num_pages
+        if self.max_file_size is not None:
+            convert_kwargs['max_file_size'] = self.max_file_size
+
+        for converter, group in groups.values():
+            self.logger.info(f"开始批量转换{len(group)}个文档")
+            try:
+                # convert_all按输入顺序逐个产出结果
+                conversion_results = converter.convert_all(
+                    [str(entry[0]) for _, entry in group], **convert_kwargs)
+                for (index, entry), conversion_result in zip(group, conversion_results):
+                    yield index, entry, conversion_result
+            except Exception as e:
+                self.logger.error(f"批量转换失败: {e}")
+
+    def parse_many(self, file_paths: List[str], workers: Optional[int] = None,
+                   return_document: bool = False) -> List[DoclingParseResult]:
+        """
+        使用进程池并行解析多个文档
+
+        每个工作进程按当前配置构建自己的解析器（经转换器缓存复用模型），
+        文档按Docling的doc_batch_size分批提交。
+
+        Args:
+            file_paths (list): 文件路径列表
+            workers (int, optional): 工作进程数，默认CPU核数的一半
+            return_document (bool): 是否返回原始Docling文档对象，默认False
+                （文档对象体积大且不一定可序列化）
+
+        Returns:
+            list: 解析结果列表，按输入顺序排列，解析失败的文件被跳过
+        """
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) // 2)
+
+        # 单进程或单文件时直接在当前进程解析，避免进程启动开销
+        if workers <= 1 or len(file_paths) <= 1:
+            results = []
+            for file_path in file_paths:
+                try:
+                    results.append(self.parse(file_path, eager=True).detach(keep_document=return_document))
+                except Exception as e:
+                    self.logger.error(f"文件{file_path}处理失败: {e}")
+            return results
+
+        batch_size = _doc_batch_size()
+        batches = [file_paths[i:i + batch_size] for i in range(0, len(file_paths), batch_size)]
+        workers = min(workers, len(batches))
+
+        self.logger.info(f"开始并行解析{len(file_paths)}个文档，进程数: {workers}，批大小: {batch_size}")
+
+        results = []
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_parse_worker,
+                                     initargs=(self.config,)) as executor:
+                for batch_results in executor.map(_parse_batch_worker, batches,
+                                                  [return_document] * len(batches)):
+                    results.extend(result for result in batch_results if result is not None)
+        except Exception as e:
+            self.logger.error(f"并行解析失败: {e}")
+            raise
 
         return results
 
@@ -1016,13 +2300,17 @@ class DoclingParser:
             list: 导出的图形信息列表
         """
         try:
-            result = self.parse(file_path)
+            result = self._parse_cached(file_path)
             figures = []
 
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # 从结构化数据中提取图片
+            # 从结构化数据中提取图片，收集保存任务
+            pictures = getattr(result.docling_document, 'pictures', None)
+            if not isinstance(pictures, list):
+                pictures = []
+            save_tasks = []
             for i, image_data in enumerate(result.structured_data.get('images', [])):
                 figure_info = {
                     'index': i,
@@ -1032,28 +2320,53 @@ class DoclingParser:
                     'size': image_data.get('size'),
                     'file_path': None
                 }
-
-                # 如果有图片数据，尝试保存
-                if hasattr(result.docling_document, 'pictures') and result.docling_document.pictures:
-                    try:
-                        if i < len(result.docling_document.pictures):
-                            picture = result.docling_document.pictures[i]
-                            if hasattr(picture, 'image') and picture.image:
-                                figure_path = output_path / f"figure_{i}.png"
-                                picture.image.save(str(figure_path))
-                                figure_info['file_path'] = str(figure_path)
-                                self.logger.info(f"图形已保存: {figure_path}")
-                    except Exception as e:
-                        self.logger.warning(f"保存图形{i}失败: {e}")
-
                 figures.append(figure_info)
 
+                figure_path = output_path / f"figure_{i}.png"
+                # 图片已写入临时文件时直接复制，否则保存图片数据
+                if image_data.get('image_path'):
+                    save_tasks.append((figure_info, image_data['image_path'], figure_path))
+                elif i < len(pictures):
+                    image = getattr(pictures[i], 'image', None)
+                    if image:
+                        save_tasks.append((figure_info, image, figure_path))
+
+            # 各图片的复制和编码相互独立，在线程池中并行执行
+            if save_tasks:
+                with ThreadPoolExecutor(max_workers=min(_FIGURE_SAVE_WORKERS, len(save_tasks))) as executor:
+                    saved = list(executor.map(self._save_figure, save_tasks))
+                for (figure_info, _, figure_path), ok in zip(save_tasks, saved):
+                    if ok:
+                        figure_info['file_path'] = str(figure_path)
+
             return figures
 
         except Exception as e:
             self.logger.error(f"图形导出失败: {e}")
             return []
 
+    def _save_figure(self, task: Tuple[Dict[str, Any], Any, Path]) -> bool:
+        """
+        保存单个图形，失败时记录警告而不影响其他图形
+
+        Args:
+            task (tuple): (图形信息, 临时文件路径或图片对象, 输出路径)
+
+        Returns:
+            bool: 是否保存成功
+        """
+        figure_info, source, figure_path = task
+        try:
+            if isinstance(source, str):
+                shutil.copyfile(source, figure_path)
+            else:
+                source.save(str(figure_path))
+            self.logger.info(f"图形已保存: {figure_path}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"保存图形{figure_info['index']}失败: {e}")
+            return False
+
     def export_tables(self, file_path: str, output_dir: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         导出文档中的表格
@@ -1066,7 +2379,7 @@ class DoclingParser:
             list: 导出的表格信息列表
         """
         try:
-            result = self.parse(file_path)
+            result = self._parse_cached(file_path, with_images=False)
             tables = []
 
             if output_dir:
@@ -1090,10 +2403,8 @@ class DoclingParser:
                 # 如果指定了输出目录，保存表格为CSV
                 if output_dir and table_data.get('data'):
                     try:
-                        import pandas as pd
-                        df = pd.DataFrame(table_data['data'], columns=table_data.get('headers', []))
                         table_path = output_path / f"table_{i}.csv"
-                        df.to_csv(table_path, index=False, encoding='utf-8')
+                        self._write_table_csv(table_path, table_data['data'], table_data.get('headers', []))
                         table_info['file_path'] = str(table_path)
                         self.logger.info(f"表格已保存: {table_path}")
                     except Exception as e:
@@ -1107,6 +2418,28 @@ class DoclingParser:
             self.logger.error(f"表格导出失败: {e}")
             return []
 
+    @staticmethod
+    def _write_table_csv(table_path: Path, data: Any, headers: List[Any]):
+        """
+        将表格数据写出为CSV文件
+
+        Args:
+            table_path (Path): 输出文件路径
+            data: 表格数据，行列表；按列组织的字典交由pandas处理
+            headers (list): 表头
+        """
+        if isinstance(data, dict):
+            import pandas as pd
+            df = pd.DataFrame(data, columns=headers or None)
+            df.to_csv(table_path, index=False, encoding='utf-8')
+            return
+
+        with open(table_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            if headers:
+                writer.writerow(headers)
+            writer.writerows(data)
+
     def get_document_statistics(self, file_path: str) -> Dict[str, Any]:
         """
         获取文档统计信息
@@ -1118,36 +2451,24 @@ class DoclingParser:
             dict: 文档统计信息
         """
         try:
-            result = self.parse(file_path)
+            result = self._parse_cached(file_path, with_images=False)
+
+            metadata = result.metadata
+            content_stats = {'total_text_length': len(result.text_content)}
+            content_stats.update((key, metadata.get(key, 0)) for key in _ELEMENT_COUNT_KEYS)
 
             stats = {
                 'file_info': {
-                    'name': result.metadata.get('file_name', ''),
-                    'size': result.metadata.get('file_size', 0),
+                    'name': metadata.get('file_name', ''),
+                    'size': metadata.get('file_size', 0),
                     'format': result.original_format,
-                    'pages': result.metadata.get('page_count', 0)
-                },
-                'content_stats': {
-                    'total_text_length': len(result.text_content),
-                    'total_elements': result.metadata.get('total_elements', 0),
-                    'text_elements': result.metadata.get('text_elements', 0),
-                    'table_elements': result.metadata.get('table_elements', 0),
-                    'image_elements': result.metadata.get('image_elements', 0),
-                    'heading_elements': result.metadata.get('heading_elements', 0),
-                    'list_elements': result.metadata.get('list_elements', 0),
-                    'code_elements': result.metadata.get('code_elements', 0),
-                    'formula_elements': result.metadata.get('formula_elements', 0)
+                    'pages': metadata.get('page_count', 0)
                 },
-                'structure_info': result.structure_info,
+                'content_stats': content_stats,
+                'structure_info': copy.deepcopy(result.structure_info),
                 'processing_info': {
                     'parser_type': 'docling',
-                    'features_used': {
-                        'ocr': self.enable_ocr,
-                        'table_structure': self.enable_table_structure,
-                        'picture_description': self.enable_picture_description,
-                        'formula_enrichment': self.enable_formula_enrichment,
-                        'code_enrichment': self.enable_code_enrichment
-                    }
+                    'features_used': dict(self._features_used)
                 }
             }
 
@@ -1172,7 +2493,13 @@ class DoclingParser:
         """
         try:
             # 首先进行标准解析
-            result = self.parse(file_path)
+            result = self._parse_cached(file_path, with_images=False)
+
+            # 文档已是目标语言时无需翻译
+            source_language = _detect_language(result.text_content)
+            if source_language and source_language == target_language.split('-')[0].lower():
+                self.logger.info(f"文档已是目标语言{target_language}，跳过翻译")
+                return self._copy_result(result)
 
             # 如果启用了远程服务，可以尝试集成翻译
             if self.enable_remote_services:
@@ -1187,19 +2514,14 @@ class DoclingParser:
                 )
 
                 # 创建包含翻译内容的新结果
-                translated_result = DoclingParseResult(
+                return self._copy_result(
+                    result,
                     text_content=translated_content,
-                    metadata={**result.metadata, 'translated_to': target_language},
-                    structured_data=result.structured_data,
-                    structure_info=result.structure_info,
-                    original_format=result.original_format,
-                    docling_document=result.docling_document
+                    metadata={**result.metadata, 'translated_to': target_language}
                 )
-
-                return translated_result
             else:
                 self.logger.warning("翻译功能需要启用远程服务")
-                return result
+                return self._copy_result(result)
 
         except Exception as e:
             self.logger.error(f"翻译转换失败: {e}")
@@ -1233,9 +2555,15 @@ class DoclingParser:
             bool: 是否成功启用GPU加速
         """
         try:
-            if ADVANCED_OPTIONS_AVAILABLE:
-                # 重新初始化转换器以启用GPU
+            if ACCELERATOR_OPTIONS_AVAILABLE:
+                # 已使用GPU转换器时无需重建
+                if self.accelerator_device == 'cuda':
+                    return True
+
+                # 转换器按配置缓存且模型在首次转换时加载，切换设备只需取得对应的转换器；
+                # 缓存的转换器可能被其他解析器共享，不能原地修改其管道选项
                 self.config['use_gpu'] = True
+                self.accelerator_device = 'cuda'
                 self._init_converter()
                 self.logger.info("GPU加速已启用")
                 return True
@@ -1265,6 +2593,7 @@ class DoclingParser:
                 'vlm_pipeline_available': VLM_PIPELINE_AVAILABLE,
                 'word_format_available': WORD_FORMAT_AVAILABLE,
                 'pypdfium_backend_available': PYPDFIUM_BACKEND_AVAILABLE,
+                'accelerator_options_available': ACCELERATOR_OPTIONS_AVAILABLE,
                 'picture_description_enabled': self.enable_picture_description,
                 'formula_enrichment_enabled': self.enable_formula_enrichment,
                 'code_enrichment_enabled': self.enable_code_enrichment,
@@ -1276,7 +2605,13 @@ class DoclingParser:
                 'images_scale': self.images_scale,
                 'use_vlm_pipeline': self.use_vlm_pipeline,
                 'vlm_model': self.vlm_model,
-                'custom_backend': self.custom_backend
+                'custom_backend': self.custom_backend,
+                'backend_strategy': self.backend_strategy,
+                'conversion_timeout': self.conversion_timeout,
+                'num_threads': self.num_threads,
+                'accelerator_device': self.accelerator_device,
+                'page_batch_concurrency': self.page_batch_concurrency,
+                'batch_workers': self.batch_workers
             }
         }
 
@@ -1296,22 +2631,11 @@ class DoclingParser:
             'vlm_pipeline': VLM_PIPELINE_AVAILABLE,
             'word_format': WORD_FORMAT_AVAILABLE,
             'pypdfium_backend': PYPDFIUM_BACKEND_AVAILABLE,
-            'pandas': False,
-            'pillow': False
+            # 仅查找模块规格，不实际导入
+            'pandas': importlib.util.find_spec('pandas') is not None,
+            'pillow': importlib.util.find_spec('PIL') is not None
         }
 
-        try:
-            import pandas
-            dependencies['pandas'] = True
-        except ImportError:
-            pass
-
-        try:
-            from PIL import Image
-            dependencies['pillow'] = True
-        except ImportError:
-            pass
-
         return dependencies
 
     @classmethod
@@ -1332,64 +2656,69 @@ class DoclingParser:
         Returns:
             DoclingParser: 配置好的解析器实例
         """
-        presets = {
-            'basic': {
-                'enable_ocr': True,
-                'enable_table_structure': True,
-                'enable_picture_description': False,
-                'enable_formula_enrichment': False,
-                'enable_code_enrichment': False
-            },
-            'ocr_only': {
-                'enable_ocr': True,
-                'enable_table_structure': False,
-                'enable_picture_description': False,
-                'enable_formula_enrichment': False,
-                'enable_code_enrichment': False
-            },
-            'table_focus': {
-                'enable_ocr': True,
-                'enable_table_structure': True,
-                'table_mode': 'accurate',
-                'enable_cell_matching': True,
-                'enable_picture_description': False,
-                'enable_formula_enrichment': False,
-                'enable_code_enrichment': False
-            },
-            'image_focus': {
-                'enable_ocr': True,
-                'enable_table_structure': True,
-                'enable_picture_description': True,
-                'enable_picture_classification': True,
-                'generate_picture_images': True,
-                'images_scale': 2,
-                'enable_formula_enrichment': False,
-                'enable_code_enrichment': False
-            },
-            'academic': {
-                'enable_ocr': True,
-                'enable_table_structure': True,
-                'table_mode': 'accurate',
-                'enable_picture_description': True,
-                'enable_formula_enrichment': True,
-                'enable_code_enrichment': True,
-                'generate_picture_images': True,
-                'images_scale': 2
-            },
-            'vlm': {
-                'use_vlm_pipeline': True,
-                'enable_ocr': True,
-                'enable_table_structure': True,
-                'enable_picture_description': True,
-                'generate_picture_images': True,
-                'images_scale': 2
-            }
-        }
+        base = _PRESETS.get(preset)
+        if base is None:
+            raise ValueError(f"未知的预设: {preset}. 支持的预设: {list(_PRESETS.keys())}")
 
-        if preset not in presets:
-            raise ValueError(f"未知的预设: {preset}. 支持的预设: {list(presets.keys())}")
-
-        config = presets[preset].copy()
-        config.update(kwargs)
+        config = {**base, **kwargs}
 
         return cls(config=config)
+
+
+def _doc_batch_size() -> int:
+    """获取Docling文档批大小设置"""
+    if not DOCLING_SETTINGS_AVAILABLE:
+        return 2
+    return max(1, int(getattr(docling_settings.perf, 'doc_batch_size', 2)))
+
+
+# 工作进程内的解析器实例
+_worker_parser: Optional[DoclingParser] = None
+
+
+def _init_parse_worker(config: Dict[str, Any]):
+    """
+    初始化并行解析工作进程
+
+    Args:
+        config (dict): 解析器配置
+    """
+    global _worker_parser
+    # 工作进程退出时其临时目录随之删除，图片保留在文档对象中而不写入临时文件
+    _worker_parser = DoclingParser({**config, 'stream_images': False})
+
+
+def _batch_convert_worker(file_paths: List[str]) -> List[DoclingParseResult]:
+    """
+    在工作进程中通过batch_convert转换一批文档
+
+    Args:
+        file_paths (list): 文件路径列表
+
+    Returns:
+        list: 解析结果列表，失败的文件被跳过
+    """
+    results = _worker_parser.batch_convert(file_paths, n_workers=1)
+    return [result.detach() for result in results]
+
+
+def _parse_batch_worker(file_paths: List[str], return_document: bool) -> List[Optional[DoclingParseResult]]:
+    """
+    在工作进程中解析一批文档
+
+    Args:
+        file_paths (list): 文件路径列表
+        return_document (bool): 是否保留原始Docling文档对象
+
+    Returns:
+        list: 解析结果列表，失败的文件对应None
+    """
+    results = []
+    for file_path in file_paths:
+        try:
+            result = _worker_parser.parse(file_path, eager=True)
+            results.append(result.detach(keep_document=return_document))
+        except Exception as e:
+            _worker_parser.logger.error(f"文件{file_path}处理失败: {e}")
+            results.append(None)
+    return results
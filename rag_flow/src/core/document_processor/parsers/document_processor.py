@@ -6,10 +6,18 @@
 版本: v1.0.0
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any, Union
 from pathlib import Path
+import importlib
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 # 导入统一日志管理器
 try:
@@ -33,11 +41,16 @@ try:
 except ImportError:
     CONFIG_MANAGER_AVAILABLE = False
 
-from .pdf_parser import PDFParser, PDFParseResult
-from .word_parser import WordParser, WordParseResult
-from .excel_parser import ExcelParser, ExcelParseResult
-from .powerpoint_parser import PowerPointParser, PowerPointParseResult
-from .docling_parser import DoclingParser, DoclingParseResult
+from .parse_options import ParseOptions, TEXT_ONLY, METADATA_ONLY
+
+# 各解析器模块依赖PyMuPDF、python-docx、openpyxl、python-pptx或Docling，
+# 在首次创建对应解析器时才导入，仅做格式检测的调用方无需加载这些库
+if TYPE_CHECKING:
+    from .pdf_parser import PDFParser, PDFParseResult
+    from .word_parser import WordParser, WordParseResult
+    from .excel_parser import ExcelParser, ExcelParseResult
+    from .powerpoint_parser import PowerPointParser, PowerPointParseResult
+    from .docling_parser import DoclingParser, DoclingParseResult
 
 
 class DocumentType(Enum):
@@ -50,7 +63,7 @@ class DocumentType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedParseResult:
     """统一解析结果数据类"""
     document_type: DocumentType
@@ -58,7 +71,136 @@ class UnifiedParseResult:
     metadata: Dict[str, Any]
     structured_data: Dict[str, Any]  # 包含表格、图像等结构化数据
     structure_info: Dict[str, Any]
-    original_result: Union[PDFParseResult, WordParseResult, ExcelParseResult, PowerPointParseResult, DoclingParseResult]
+    original_result: Union['PDFParseResult', 'WordParseResult', 'ExcelParseResult',
+                           'PowerPointParseResult', 'DoclingParseResult']
+
+
+# 解析器所在模块、类名及其配置键
+_PARSER_FACTORIES = MappingProxyType({
+    DocumentType.PDF: ('.pdf_parser', 'PDFParser', 'pdf_config'),
+    DocumentType.WORD: ('.word_parser', 'WordParser', 'word_config'),
+    DocumentType.EXCEL: ('.excel_parser', 'ExcelParser', 'excel_config'),
+    DocumentType.POWERPOINT: ('.powerpoint_parser', 'PowerPointParser', 'powerpoint_config'),
+    DocumentType.DOCLING: ('.docling_parser', 'DoclingParser', 'docling_config'),
+})
+
+# 传统解析器支持的文件格式（Docling支持的格式在启用时从docling_parser读取）
+_PARSER_FORMATS = MappingProxyType({
+    DocumentType.PDF: ('.pdf',),
+    DocumentType.WORD: ('.docx', '.doc'),
+    DocumentType.EXCEL: ('.xlsx', '.xlsm', '.xltx', '.xltm'),
+    DocumentType.POWERPOINT: ('.pptx', '.ppt'),
+})
+
+
+# 只能由Docling解析的格式
+_DOCLING_ONLY_FORMATS = frozenset({'.html', '.htm', '.csv', '.md', '.markdown', '.txt',
+                                   '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif'})
+
+# 传统解析器与Docling共同支持的格式，可通过配置选择Docling
+_COMMON_FORMATS = frozenset({'.pdf', '.docx', '.doc', '.xlsx', '.xls', '.pptx', '.ppt'})
+
+
+# 文件头签名：(偏移, 签名字节, 文档类型)；文档类型为None的签名需进一步检查内容
+_MAGIC_TABLE = (
+    (0, b'%PDF-', DocumentType.PDF),
+    (0, b'PK\x03\x04', None),  # Office Open XML（zip容器）
+)
+
+# Office Open XML包内目录到文档类型的映射
+_OOXML_PREFIXES = (
+    ('word/', DocumentType.WORD),
+    ('xl/', DocumentType.EXCEL),
+    ('ppt/', DocumentType.POWERPOINT),
+)
+
+# 读取的文件头长度
+_MAGIC_READ_SIZE = 512
+
+# 批量解析时每个工作进程的在途任务数，限制已提交但未产出的结果数量
+_BATCH_TASKS_PER_WORKER = 2
+
+
+@lru_cache(maxsize=4096)
+def _sniff_magic_cached(file_path: str, mtime_ns: int, file_size: int) -> Optional[DocumentType]:
+    """
+    根据文件头签名检测文档类型（按路径、修改时间和大小缓存）
+
+    Args:
+        file_path (str): 文件路径
+        mtime_ns (int): 文件修改时间，仅作为缓存键
+        file_size (int): 文件大小，仅作为缓存键
+
+    Returns:
+        DocumentType: 检测到的文档类型，无法识别时为None
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(_MAGIC_READ_SIZE)
+
+    for offset, signature, doc_type in _MAGIC_TABLE:
+        if head[offset:offset + len(signature)] != signature:
+            continue
+        if doc_type is not None:
+            return doc_type
+
+        # zip容器按包内目录区分Word、Excel和PowerPoint
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                names = archive.namelist()
+        except zipfile.BadZipFile:
+            return None
+        for prefix, ooxml_type in _OOXML_PREFIXES:
+            if any(name.startswith(prefix) for name in names):
+                return ooxml_type
+        return None
+
+    return None
+
+
+def _sniff_magic(file_path: str) -> Optional[DocumentType]:
+    """
+    根据文件头签名检测文档类型，文件无法读取时返回None
+
+    Args:
+        file_path (str): 文件路径
+
+    Returns:
+        DocumentType: 检测到的文档类型，无法识别时为None
+    """
+    try:
+        stat = os.stat(file_path)
+        return _sniff_magic_cached(os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def _lower_ext(file_path: Union[str, Path]) -> str:
+    """
+    获取小写的文件扩展名，只需扩展名时避免构造Path对象
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        str: 小写的文件扩展名，无扩展名时为空字符串
+    """
+    return os.path.splitext(file_path)[1].lower()
+
+
+def _stat_or_none(file_path: Union[str, Path]) -> Optional[int]:
+    """
+    单次stat同时完成存在性检查和文件大小读取
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        int: 文件大小（字节），文件不存在时为None
+    """
+    try:
+        return os.stat(file_path).st_size
+    except FileNotFoundError:
+        return None
 
 
 class DocumentProcessor:
@@ -95,7 +237,7 @@ class DocumentProcessor:
                 self.performance_monitor = get_performance_monitor()
                 self.logger.info("性能监控已启用")
             except Exception as e:
-                self.logger.warning(f"性能监控初始化失败: {e}")
+                self.logger.warning("性能监控初始化失败: %s", e)
 
         # 从配置管理器加载配置（如果可用）
         if CONFIG_MANAGER_AVAILABLE and not config:
@@ -104,27 +246,22 @@ class DocumentProcessor:
                 self.config = config_manager.get_document_processor_config()
                 self.logger.info("从配置管理器加载配置")
             except Exception as e:
-                self.logger.warning(f"配置管理器加载失败: {e}")
+                self.logger.warning("配置管理器加载失败: %s", e)
         
-        # 初始化各类型解析器
-        self.pdf_parser = PDFParser(self.config.get('pdf_config', {}))
-        self.word_parser = WordParser(self.config.get('word_config', {}))
-        self.excel_parser = ExcelParser(self.config.get('excel_config', {}))
-        self.powerpoint_parser = PowerPointParser(self.config.get('powerpoint_config', {}))
-
-        # 初始化Docling解析器（如果可用）
-        self.docling_parser = None
+        # 各类型解析器在首次使用时创建
+        self._parsers: Dict[DocumentType, Any] = {}
+
+        # Docling解析器（如果可用）同样延迟创建，此处只检查依赖；
+        # 未启用Docling时不导入docling_parser
         self.use_docling = self.config.get('use_docling', False)
+        self._docling_formats = ()
         if self.use_docling:
-            try:
-                self.docling_parser = DoclingParser(self.config.get('docling_config', {}))
-                self.logger.info("Docling解析器初始化成功")
-            except ImportError:
+            from .docling_parser import DOCLING_AVAILABLE, _SUPPORTED_FORMATS
+            if DOCLING_AVAILABLE:
+                self._docling_formats = tuple(_SUPPORTED_FORMATS)
+            else:
                 self.logger.warning("Docling库未安装，将使用传统解析器")
                 self.use_docling = False
-            except Exception as e:
-                self.logger.error(f"Docling解析器初始化失败: {e}")
-                self.use_docling = False
         
         # 文件扩展名到文档类型的映射
         self.extension_mapping = {
@@ -140,7 +277,7 @@ class DocumentProcessor:
         }
 
         # 如果启用Docling，添加额外支持的格式
-        if self.use_docling and self.docling_parser:
+        if self.use_docling:
             docling_formats = {
                 '.html': DocumentType.DOCLING,
                 '.htm': DocumentType.DOCLING,
@@ -157,25 +294,104 @@ class DocumentProcessor:
                 '.tif': DocumentType.DOCLING,
             }
             self.extension_mapping.update(docling_formats)
-        
-        # 解析器映射
-        self.parser_mapping = {
-            DocumentType.PDF: self.pdf_parser,
-            DocumentType.WORD: self.word_parser,
-            DocumentType.EXCEL: self.excel_parser,
-            DocumentType.POWERPOINT: self.powerpoint_parser
-        }
 
-        # 如果启用Docling，添加到解析器映射
-        if self.use_docling and self.docling_parser:
-            self.parser_mapping[DocumentType.DOCLING] = self.docling_parser
+        # 映射初始化后不再变化，冻结为只读视图
+        self.extension_mapping = MappingProxyType(self.extension_mapping)
+
+        # 支持的文件格式只依赖是否启用Docling，使用静态格式表一次性计算
+        supported_formats = {}
+        for formats in _PARSER_FORMATS.values():
+            supported_formats.update(dict.fromkeys(formats))
+        supported_formats.update(dict.fromkeys(self._docling_formats))
+        self.supported_formats = tuple(supported_formats)
+
+        # 路由表：扩展名直接对应最终使用的文档类型（已合并Docling偏好），
+        # 解析时只需一次查表。候选扩展名包含should_use_docling可能接受的全部格式
+        # （如.xls只能通过Docling解析，不在extension_mapping中）
+        candidate_exts = dict.fromkeys(self.extension_mapping)
+        for formats in (self._docling_formats, _DOCLING_ONLY_FORMATS, _COMMON_FORMATS):
+            candidate_exts.update(dict.fromkeys(formats))
+
+        routes = {}
+        for ext in candidate_exts:
+            if self._should_use_docling_ext(ext):
+                routes[ext] = DocumentType.DOCLING
+            elif ext in self.extension_mapping:
+                routes[ext] = self.extension_mapping[ext]
+        self._routes = MappingProxyType(routes)
+
+        # 扩展名到(文档类型, 解析器)的统一表，解析器延迟创建，首次遇到该扩展名时填充
+        self._ext_to_parser: Dict[str, tuple] = {}
+
+    def _get_parser(self, doc_type: DocumentType) -> Any:
+        """
+        获取文档类型对应的解析器，首次使用时创建
+
+        Args:
+            doc_type (DocumentType): 文档类型
+
+        Returns:
+            解析器实例
+
+        Raises:
+            ValueError: 没有对应的解析器
+        """
+        parser = self._parsers.get(doc_type)
+        if parser is not None:
+            return parser
+
+        factory = _PARSER_FACTORIES.get(doc_type)
+        if factory is None or (doc_type == DocumentType.DOCLING and not self.use_docling):
+            raise ValueError(f"没有可用的{doc_type.value}解析器")
+
+        module_name, class_name, config_key = factory
+        try:
+            parser_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            parser = parser_class(self.config.get(config_key, {}))
+        except Exception as e:
+            self.logger.error("%s解析器初始化失败: %s", doc_type.value, e)
+            raise
+        if doc_type == DocumentType.DOCLING:
+            self.logger.info("Docling解析器初始化成功")
+
+        self._parsers[doc_type] = parser
+        return parser
+
+    @property
+    def pdf_parser(self) -> 'PDFParser':
+        """PDF解析器（首次访问时创建）"""
+        return self._get_parser(DocumentType.PDF)
+
+    @property
+    def word_parser(self) -> 'WordParser':
+        """Word解析器（首次访问时创建）"""
+        return self._get_parser(DocumentType.WORD)
+
+    @property
+    def excel_parser(self) -> 'ExcelParser':
+        """Excel解析器（首次访问时创建）"""
+        return self._get_parser(DocumentType.EXCEL)
+
+    @property
+    def powerpoint_parser(self) -> 'PowerPointParser':
+        """PowerPoint解析器（首次访问时创建）"""
+        return self._get_parser(DocumentType.POWERPOINT)
+
+    @property
+    def docling_parser(self) -> Optional['DoclingParser']:
+        """Docling解析器（首次访问时创建），未启用时为None"""
+        if not self.use_docling:
+            return None
+        return self._get_parser(DocumentType.DOCLING)
     
-    def parse(self, file_path: str) -> UnifiedParseResult:
+    def parse(self, file_path: str, options: Optional[ParseOptions] = None) -> UnifiedParseResult:
         """
         解析文档
         
         Args:
             file_path (str): 文档文件路径
+            options (ParseOptions, optional): 解析选项，默认完整解析
+                （Docling解析器按需延迟计算，不使用该选项）
             
         Returns:
             UnifiedParseResult: 统一解析结果
@@ -186,50 +402,86 @@ class DocumentProcessor:
             Exception: 解析过程中的其他错误
         """
         try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                raise FileNotFoundError(f"文档文件不存在: {file_path}")
-
-            # 获取文件信息用于监控
-            file_size = file_path.stat().st_size
-            file_extension = file_path.suffix.lower()
-
-            # 检测文档类型和选择解析器
-            if self.should_use_docling(str(file_path)):
-                doc_type = DocumentType.DOCLING
-                parser = self.docling_parser
-                parser_type = "docling"
-                self.logger.info(f"使用Docling解析器处理文档: {file_path}")
+            path_str = os.fspath(file_path)
+
+            # 获取文件信息用于监控（单次stat同时检查存在性）
+            file_size = _stat_or_none(path_str)
+            if file_size is None:
+                raise FileNotFoundError(f"文档文件不存在: {path_str}")
+            file_extension = _lower_ext(path_str)
+
+            # 检测文档类型和选择解析器（单次查表）
+            entry = self._ext_to_parser.get(file_extension)
+            if entry is None:
+                entry = self._resolve_route(file_extension, path_str)
+            doc_type, parser = entry
+            parser_type = doc_type.value
+            if doc_type == DocumentType.DOCLING:
+                self.logger.info("使用Docling解析器处理文档: %s", path_str)
             else:
-                doc_type = self.detect_document_type(str(file_path))
-                if doc_type == DocumentType.UNKNOWN:
-                    raise ValueError(f"不支持的文件格式: {file_path.suffix}")
-                parser = self.parser_mapping[doc_type]
-                parser_type = doc_type.value
-                self.logger.info(f"开始解析{doc_type.value}文档: {file_path}")
+                self.logger.info("开始解析%s文档: %s", doc_type.value, path_str)
 
             # 使用性能监控上下文（如果可用）
             if PERFORMANCE_MONITORING_AVAILABLE and self.performance_monitor:
-                with ProcessingContext(str(file_path), file_size, file_extension, parser_type):
+                with ProcessingContext(path_str, file_size, file_extension, parser_type):
                     # 执行解析
-                    original_result = parser.parse(str(file_path))
+                    original_result = self._run_parser(parser, doc_type, path_str, options)
 
                     # 转换为统一格式
                     unified_result = self._convert_to_unified_result(doc_type, original_result)
             else:
                 # 执行解析（无监控）
-                original_result = parser.parse(str(file_path))
+                original_result = self._run_parser(parser, doc_type, path_str, options)
 
                 # 转换为统一格式
                 unified_result = self._convert_to_unified_result(doc_type, original_result)
 
-            self.logger.info(f"文档解析完成: {doc_type.value}")
+            self.logger.info("文档解析完成: %s", doc_type.value)
             return unified_result
 
         except Exception as e:
-            self.logger.error(f"文档解析失败: {e}")
+            self.logger.error("文档解析失败: %s", e)
             raise
     
+    def _resolve_route(self, file_extension: str, path_str: str) -> tuple:
+        """
+        解析扩展名对应的文档类型和解析器，并写入统一表
+
+        Args:
+            file_extension (str): 小写的文件扩展名
+            path_str (str): 文档文件路径，用于错误信息
+
+        Returns:
+            tuple: (文档类型, 解析器实例)
+
+        Raises:
+            ValueError: 不支持的文件格式
+        """
+        doc_type = self._routes.get(file_extension)
+        if doc_type is None:
+            raise ValueError(f"不支持的文件格式: {os.path.splitext(path_str)[1]}")
+        entry = (doc_type, self._get_parser(doc_type))
+        self._ext_to_parser[file_extension] = entry
+        return entry
+
+    def _run_parser(self, parser: Any, doc_type: DocumentType, file_path: str,
+                    options: Optional[ParseOptions]) -> Any:
+        """
+        调用具体解析器，传统解析器按解析选项跳过不需要的部分
+
+        Args:
+            parser: 解析器实例
+            doc_type (DocumentType): 文档类型
+            file_path (str): 文档文件路径
+            options (ParseOptions, optional): 解析选项
+
+        Returns:
+            原始解析结果
+        """
+        if options is None or doc_type == DocumentType.DOCLING:
+            return parser.parse(file_path)
+        return parser.parse(file_path, options=options)
+
     def detect_document_type(self, file_path: str) -> DocumentType:
         """
         检测文档类型
@@ -240,19 +492,29 @@ class DocumentProcessor:
         Returns:
             DocumentType: 检测到的文档类型
         """
-        try:
-            file_path = Path(file_path)
-            extension = file_path.suffix.lower()
-            
-            return self.extension_mapping.get(extension, DocumentType.UNKNOWN)
-            
-        except Exception as e:
-            self.logger.error(f"文档类型检测失败: {e}")
-            return DocumentType.UNKNOWN
+        doc_type = self._detect_by_ext(_lower_ext(file_path))
+        if doc_type != DocumentType.UNKNOWN:
+            return doc_type
+
+        # 扩展名无法识别时读取文件头判断
+        return _sniff_magic(file_path) or DocumentType.UNKNOWN
+
+    def _detect_by_ext(self, file_extension: str) -> DocumentType:
+        """
+        按小写扩展名检测文档类型
+
+        Args:
+            file_extension (str): 小写的文件扩展名
+
+        Returns:
+            DocumentType: 检测到的文档类型
+        """
+        return self.extension_mapping.get(file_extension, DocumentType.UNKNOWN)
     
     def _convert_to_unified_result(self, doc_type: DocumentType,
-                                 original_result: Union[PDFParseResult, WordParseResult,
-                                                      ExcelParseResult, PowerPointParseResult, DoclingParseResult]) -> UnifiedParseResult:
+                                 original_result: Union['PDFParseResult', 'WordParseResult',
+                                                      'ExcelParseResult', 'PowerPointParseResult',
+                                                      'DoclingParseResult']) -> UnifiedParseResult:
         """
         将原始解析结果转换为统一格式
         
@@ -263,52 +525,15 @@ class DocumentProcessor:
         Returns:
             UnifiedParseResult: 统一解析结果
         """
-        try:
-            # 提取通用字段
-            text_content = original_result.text_content
-            metadata = original_result.metadata
-            structure_info = original_result.structure_info
-            
-            # 构建结构化数据
-            structured_data = {}
-            
-            if doc_type == DocumentType.PDF:
-                structured_data = {
-                    'tables': original_result.tables,
-                    'images': original_result.images,
-                    'page_count': original_result.page_count
-                }
-            elif doc_type == DocumentType.WORD:
-                structured_data = {
-                    'tables': original_result.tables,
-                    'paragraphs': original_result.paragraphs
-                }
-            elif doc_type == DocumentType.EXCEL:
-                structured_data = {
-                    'worksheets': original_result.worksheets,
-                    'tables': original_result.tables
-                }
-            elif doc_type == DocumentType.POWERPOINT:
-                structured_data = {
-                    'slides': original_result.slides,
-                    'notes': original_result.notes
-                }
-            elif doc_type == DocumentType.DOCLING:
-                # Docling已经提供了统一的结构化数据格式
-                structured_data = original_result.structured_data
-            
-            return UnifiedParseResult(
-                document_type=doc_type,
-                text_content=text_content,
-                metadata=metadata,
-                structured_data=structured_data,
-                structure_info=structure_info,
-                original_result=original_result
-            )
-            
-        except Exception as e:
-            self.logger.error(f"结果转换失败: {e}")
-            raise
+        # 结构化数据由各解析结果自行构建；转换异常由parse统一记录
+        return UnifiedParseResult(
+            document_type=doc_type,
+            text_content=original_result.text_content,
+            metadata=original_result.metadata,
+            structured_data=original_result.to_structured_data(),
+            structure_info=original_result.structure_info,
+            original_result=original_result
+        )
     
     def get_supported_formats(self) -> List[str]:
         """
@@ -317,10 +542,7 @@ class DocumentProcessor:
         Returns:
             list: 支持的文件扩展名列表
         """
-        all_formats = []
-        for parser in self.parser_mapping.values():
-            all_formats.extend(parser.get_supported_formats())
-        return list(set(all_formats))
+        return list(self.supported_formats)
     
     def is_supported_format(self, file_path: str) -> bool:
         """
@@ -332,31 +554,117 @@ class DocumentProcessor:
         Returns:
             bool: 是否支持该格式
         """
-        return self.detect_document_type(file_path) != DocumentType.UNKNOWN
+        return self._detect_by_ext(_lower_ext(file_path)) != DocumentType.UNKNOWN
     
-    def parse_batch(self, file_paths: List[str]) -> List[UnifiedParseResult]:
+    def parse_batch(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[UnifiedParseResult]:
         """
         批量解析文档
+
+        多个文件时使用进程池并行解析，每个工作进程按当前配置构建自己的文档处理器。
         
         Args:
             file_paths (list): 文件路径列表
+            max_workers (int, optional): 工作进程数，默认min(CPU核数, 文件数)
             
         Returns:
-            list: 解析结果列表
+            list: 解析结果列表，按输入顺序排列，解析失败的文件被跳过
         """
-        results = []
-        
-        for file_path in file_paths:
-            try:
-                result = self.parse(file_path)
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"文件{file_path}解析失败: {e}")
-                # 可以选择跳过失败的文件或添加错误信息
-                continue
-        
-        return results
+        return list(self.iter_parse_batch(file_paths, max_workers))
+
+    def iter_parse_batch(self, file_paths: List[str],
+                         max_workers: Optional[int] = None) -> Iterator[UnifiedParseResult]:
+        """
+        批量解析文档，逐个产出解析结果
+
+        调用方处理完一个结果即可释放，不需要同时持有全部解析结果。
+
+        Args:
+            file_paths (list): 文件路径列表
+            max_workers (int, optional): 工作进程数，默认min(CPU核数, 文件数)
+
+        Yields:
+            UnifiedParseResult: 解析结果，按输入顺序产出，解析失败的文件被跳过
+        """
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, len(file_paths))
+
+        # 单进程或单文件时直接在当前进程解析，避免进程启动开销
+        if max_workers <= 1 or len(file_paths) <= 1:
+            for file_path in file_paths:
+                try:
+                    yield self.parse(file_path)
+                except Exception as e:
+                    self.logger.error("文件%s解析失败: %s", file_path, e)
+                    # 跳过失败的文件
+                    continue
+            return
+
+        self.logger.info("开始并行解析%s个文档，进程数: %s", len(file_paths), max_workers)
+
+        # 只保持有限数量的在途任务，消费一个结果再提交下一个文件，
+        # 避免executor.map一次提交全部文件并在内存中堆积已完成的结果
+        window_size = max_workers * _BATCH_TASKS_PER_WORKER
+        remaining = iter(file_paths)
+        window = deque()
+        # 进程池损坏时受影响的文件，逐个单独重试以找出导致工作进程退出的文件
+        suspects = deque()
+        executor = self._create_batch_executor(max_workers)
+        try:
+            while True:
+                if suspects:
+                    file_path = suspects.popleft()
+                    try:
+                        result = _submit_parse(executor, file_path).result()
+                    except BrokenProcessPool as e:
+                        # 单独解析时仍使工作进程退出，确定为该文件导致，跳过
+                        self.logger.error("文件%s解析失败，工作进程异常退出: %s", file_path, e)
+                        executor.shutdown(cancel_futures=True)
+                        executor = self._create_batch_executor(max_workers)
+                        continue
+                    if result is not None:
+                        yield result
+                    continue
+
+                for file_path in remaining:
+                    window.append((file_path, _submit_parse(executor, file_path)))
+                    if len(window) >= window_size:
+                        break
+                if not window:
+                    break
+                # 按提交顺序等待，结果按输入顺序产出
+                file_path, future = window.popleft()
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    # 工作进程异常退出（如崩溃或被系统终止）会使所有未完成任务失败，
+                    # 无法判断是哪个文件导致，重建进程池后逐个重试窗口内的全部文件
+                    suspects.append(file_path)
+                    suspects.extend(path for path, _ in window)
+                    window.clear()
+                    self.logger.warning("工作进程异常退出，逐个重试%s个受影响的文件", len(suspects))
+                    executor.shutdown(cancel_futures=True)
+                    executor = self._create_batch_executor(max_workers)
+                    continue
+                if result is not None:
+                    yield result
+        finally:
+            # 调用方提前关闭生成器（GeneratorExit）或出错时取消尚未开始的任务
+            executor.shutdown(cancel_futures=True)
     
+    def _create_batch_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        """
+        创建批量解析使用的进程池
+
+        Args:
+            max_workers (int): 工作进程数
+
+        Returns:
+            ProcessPoolExecutor: 已按当前配置初始化工作进程的进程池
+        """
+        return ProcessPoolExecutor(max_workers=max_workers,
+                                   initializer=_init_batch_worker,
+                                   initargs=(self.config,))
+
     def extract_text_only(self, file_path: str) -> str:
         """
         仅提取文档的文本内容
@@ -368,10 +676,10 @@ class DocumentProcessor:
             str: 提取的文本内容
         """
         try:
-            result = self.parse(file_path)
+            result = self.parse(file_path, options=TEXT_ONLY)
             return result.text_content
         except Exception as e:
-            self.logger.error(f"文本提取失败: {e}")
+            self.logger.error("文本提取失败: %s", e)
             return ""
     
     def extract_metadata_only(self, file_path: str) -> Dict[str, Any]:
@@ -385,10 +693,10 @@ class DocumentProcessor:
             dict: 提取的元数据
         """
         try:
-            result = self.parse(file_path)
+            result = self.parse(file_path, options=METADATA_ONLY)
             return result.metadata
         except Exception as e:
-            self.logger.error(f"元数据提取失败: {e}")
+            self.logger.error("元数据提取失败: %s", e)
             return {}
     
     def get_document_info(self, file_path: str) -> Dict[str, Any]:
@@ -401,25 +709,29 @@ class DocumentProcessor:
         Returns:
             dict: 文档基本信息
         """
+        file_path = Path(file_path)
+        file_extension = file_path.suffix.lower()
+        doc_type = self._detect_by_ext(file_extension)
+        path_str = str(file_path)
+
+        # 只有读取文件信息可能失败（文件不存在或无权限）
         try:
-            file_path = Path(file_path)
-            doc_type = self.detect_document_type(str(file_path))
-            
-            info = {
-                'file_path': str(file_path),
-                'file_name': file_path.name,
-                'file_size': file_path.stat().st_size if file_path.exists() else 0,
-                'file_extension': file_path.suffix.lower(),
-                'document_type': doc_type.value,
-                'is_supported': doc_type != DocumentType.UNKNOWN,
-                'parser_available': doc_type in self.parser_mapping
-            }
-            
-            return info
-            
-        except Exception as e:
-            self.logger.error(f"文档信息获取失败: {e}")
-            return {'error': str(e)}
+            file_size = os.stat(path_str).st_size
+        except OSError as e:
+            self.logger.debug("文件信息读取失败: %s", e)
+            file_size = 0
+        
+        info = {
+            'file_path': path_str,
+            'file_name': file_path.name,
+            'file_size': file_size,
+            'file_extension': file_extension,
+            'document_type': doc_type.value,
+            'is_supported': doc_type != DocumentType.UNKNOWN,
+            'parser_available': doc_type != DocumentType.UNKNOWN
+        }
+        
+        return info
 
     def should_use_docling(self, file_path: str) -> bool:
         """
@@ -431,24 +743,28 @@ class DocumentProcessor:
         Returns:
             bool: 是否使用Docling
         """
-        if not self.use_docling or not self.docling_parser:
-            return False
+        return self._should_use_docling_ext(_lower_ext(file_path))
 
-        file_extension = Path(file_path).suffix.lower()
+    def _should_use_docling_ext(self, file_extension: str) -> bool:
+        """
+        按小写扩展名判断是否应该使用Docling解析器
 
-        # Docling独有的格式
-        docling_only_formats = {'.html', '.htm', '.csv', '.md', '.markdown', '.txt',
-                               '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif'}
+        Args:
+            file_extension (str): 小写的文件扩展名
+
+        Returns:
+            bool: 是否使用Docling
+        """
+        if not self.use_docling:
+            return False
 
-        if file_extension in docling_only_formats:
+        # Docling独有的格式
+        if file_extension in _DOCLING_ONLY_FORMATS:
             return True
 
         # 对于共同支持的格式，可以通过配置选择
-        prefer_docling = self.config.get('prefer_docling_for_common_formats', False)
-        common_formats = {'.pdf', '.docx', '.doc', '.xlsx', '.xls', '.pptx', '.ppt'}
-
-        if file_extension in common_formats and prefer_docling:
-            return True
+        if file_extension in _COMMON_FORMATS:
+            return bool(self.config.get('prefer_docling_for_common_formats', False))
 
         return False
 
@@ -460,14 +776,16 @@ class DocumentProcessor:
             dict: Docling信息
         """
         info = {
-            'available': self.use_docling and self.docling_parser is not None,
+            'available': self.use_docling,
             'enabled': self.use_docling,
             'supported_formats': [],
             'dependencies': {}
         }
 
-        if self.docling_parser:
-            info['supported_formats'] = self.docling_parser.get_supported_formats()
+        # 格式和依赖信息均为静态数据，无需创建Docling解析器
+        if self.use_docling:
+            from .docling_parser import DoclingParser
+            info['supported_formats'] = list(self._docling_formats)
             info['dependencies'] = DoclingParser.check_dependencies()
 
         return info
@@ -494,3 +812,59 @@ class DocumentProcessor:
             self.logger.info("性能统计信息已重置")
         else:
             self.logger.warning("性能监控不可用，无法重置统计信息")
+
+
+# 工作进程内的文档处理器实例
+_worker_processor: Optional[DocumentProcessor] = None
+
+
+def _init_batch_worker(config: Dict[str, Any]):
+    """
+    初始化批量解析工作进程
+
+    Args:
+        config (dict): 文档处理器配置
+    """
+    global _worker_processor
+    # 工作进程的临时目录随进程退出删除，图片保留在文档对象中而不写入临时文件
+    docling_config = {**config.get('docling_config', {}), 'stream_images': False}
+    _worker_processor = DocumentProcessor({**config, 'docling_config': docling_config})
+
+
+def _parse_one(file_path: str) -> Optional[UnifiedParseResult]:
+    """
+    在工作进程中解析单个文档
+
+    Args:
+        file_path (str): 文档文件路径
+
+    Returns:
+        UnifiedParseResult: 解析结果，失败时为None
+    """
+    try:
+        return _worker_processor.parse(file_path)
+    except Exception as e:
+        _worker_processor.logger.error("文件%s解析失败: %s", file_path, e)
+        return None
+
+
+def _submit_parse(executor: ProcessPoolExecutor, file_path: str) -> Future:
+    """
+    向进程池提交单个文档的解析任务
+
+    进程池已损坏时不直接抛出，而是返回携带该异常的Future，
+    由调用方在按顺序取结果时统一处理。
+
+    Args:
+        executor (ProcessPoolExecutor): 进程池
+        file_path (str): 文档文件路径
+
+    Returns:
+        Future: 解析任务
+    """
+    try:
+        return executor.submit(_parse_one, file_path)
+    except BrokenProcessPool as e:
+        future = Future()
+        future.set_exception(e)
+        return future
@@ -9,9 +9,14 @@
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 from dataclasses import dataclass
+import hashlib
+import os
+import pickle
+import tempfile
 from openpyxl import load_workbook
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.utils.cell import range_boundaries
 
 # 导入统一日志管理器
 try:
@@ -23,9 +28,13 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 from ..extractors.metadata_extractor import MetadataExtractor
+from .parse_options import ParseOptions, FULL_PARSE
 
+# 缓存文件格式版本，解析结果结构变化时递增以使旧缓存失效
+_CACHE_FORMAT_VERSION = 1
 
-@dataclass
+
+@dataclass(slots=True)
 class ExcelParseResult:
     """Excel解析结果数据类"""
     text_content: str
@@ -34,6 +43,18 @@ class ExcelParseResult:
     tables: List[Dict[str, Any]]
     structure_info: Dict[str, Any]
 
+    def to_structured_data(self) -> Dict[str, Any]:
+        """
+        构建统一解析结果使用的结构化数据
+
+        Returns:
+            dict: 结构化数据
+        """
+        return {
+            'worksheets': self.worksheets,
+            'tables': self.tables
+        }
+
 
 class ExcelParser:
     """
@@ -58,6 +79,8 @@ class ExcelParser:
                 - extract_formulas (bool): 是否提取公式，默认False
                 - max_rows (int): 最大读取行数，默认None
                 - max_cols (int): 最大读取列数，默认None
+                - cache_dir (str): 解析结果缓存目录，默认None（不缓存）；缓存以pickle格式存储，
+                  读取时会执行其中的对象构造逻辑，只能指向受信任、其他用户不可写的目录
         """
         self.config = config or {}
         self.logger = logger
@@ -71,13 +94,18 @@ class ExcelParser:
         self.extract_formulas = self.config.get('extract_formulas', False)
         self.max_rows = self.config.get('max_rows', None)
         self.max_cols = self.config.get('max_cols', None)
+
+        # 按文件内容缓存解析结果，未配置目录时不启用
+        cache_dir = self.config.get('cache_dir')
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         
-    def parse(self, file_path: str) -> ExcelParseResult:
+    def parse(self, file_path: str, options: Optional[ParseOptions] = None) -> ExcelParseResult:
         """
         解析Excel文档
         
         Args:
             file_path (str): Excel文件路径
+            options (ParseOptions, optional): 解析选项，默认完整解析
             
         Returns:
             ExcelParseResult: 解析结果
@@ -95,30 +123,44 @@ class ExcelParser:
             if file_path.suffix.lower() not in ['.xlsx', '.xlsm', '.xltx', '.xltm']:
                 raise ValueError(f"不支持的文件格式: {file_path.suffix}")
                 
+            options = options or FULL_PARSE
+
+            # 文件内容未变化时直接返回缓存的解析结果，跳过load_workbook
+            cache_path = self._get_cache_path(file_path, options) if self.cache_dir else None
+            if cache_path is not None:
+                cached_result = self._load_cached_result(cache_path)
+                if cached_result is not None:
+                    self.logger.info(f"使用缓存的Excel解析结果: {file_path}")
+                    return cached_result
+
             self.logger.info(f"开始解析Excel文档: {file_path}")
             
             # 打开工作簿
             wb = load_workbook(
                 filename=str(file_path),
                 read_only=self.read_only,
-                data_only=self.data_only
+                data_only=self.data_only,
+                keep_vba=False,
+                keep_links=False
             )
             
             try:
                 # 提取元数据
-                metadata = self._extract_metadata(wb, file_path)
+                metadata = self._extract_metadata(wb, file_path) if options.want_metadata else {}
                 
-                # 提取工作表数据
-                worksheets = self._extract_worksheets(wb)
+                # 提取工作表数据（文本和结构分析都依赖工作表数据）
+                worksheets = []
+                if options.want_text or options.want_structure:
+                    worksheets = self._extract_worksheets(wb)
                 
                 # 提取表格数据
-                tables = self._extract_tables(wb)
+                tables = self._extract_tables(wb) if options.want_tables else []
                 
                 # 生成文本内容
-                text_content = self._generate_text_content(worksheets)
+                text_content = self._generate_text_content(worksheets) if options.want_text else ""
                 
                 # 分析文档结构
-                structure_info = self._analyze_structure(wb, worksheets)
+                structure_info = self._analyze_structure(wb, worksheets) if options.want_structure else {}
                 
                 result = ExcelParseResult(
                     text_content=text_content,
@@ -129,6 +171,9 @@ class ExcelParser:
                 )
                 
                 self.logger.info(f"Excel解析完成: {len(worksheets)}个工作表, {len(tables)}个表格")
+
+                if cache_path is not None:
+                    self._store_cached_result(cache_path, result)
                 return result
                 
             finally:
@@ -139,6 +184,73 @@ class ExcelParser:
             self.logger.error(f"Excel解析失败: {e}")
             raise
     
+    def _get_cache_path(self, file_path: Path, options: ParseOptions) -> Path:
+        """
+        计算解析结果的缓存文件路径
+
+        缓存键由文件内容的SHA-256摘要、文件的绝对路径和影响解析结果的选项组成，
+        文件被修改后摘要变化，旧缓存自然失效；元数据包含文件路径等信息，
+        内容相同的不同文件不共享缓存。
+
+        Args:
+            file_path: Excel文件路径
+            options: 解析选项
+
+        Returns:
+            Path: 缓存文件路径
+        """
+        with open(file_path, 'rb') as f:
+            content_digest = hashlib.file_digest(f, 'sha256').hexdigest()
+
+        settings = (_CACHE_FORMAT_VERSION, str(file_path.resolve()), options, self.read_only,
+                    self.data_only, self.extract_formulas, self.max_rows, self.max_cols)
+        settings_digest = hashlib.sha256(repr(settings).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{content_digest}-{settings_digest}.pkl"
+
+    def _load_cached_result(self, cache_path: Path) -> Optional[ExcelParseResult]:
+        """
+        读取缓存的解析结果
+
+        pickle.load可执行任意代码，缓存目录必须受信任（见cache_dir配置说明）。
+
+        Args:
+            cache_path: 缓存文件路径
+
+        Returns:
+            ExcelParseResult: 缓存的解析结果，缓存不存在或不可用时返回None
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"解析结果缓存读取失败: {e}")
+            return None
+
+        return result if isinstance(result, ExcelParseResult) else None
+
+    def _store_cached_result(self, cache_path: Path, result: ExcelParseResult):
+        """
+        写入解析结果缓存，先写临时文件再替换，避免并发读取到不完整的缓存
+
+        Args:
+            cache_path: 缓存文件路径
+            result: 解析结果
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logger.warning(f"解析结果缓存写入失败: {e}")
+
     def _extract_metadata(self, wb: Workbook, file_path: Path) -> Dict[str, Any]:
         """
         提取工作簿元数据
@@ -153,6 +265,12 @@ class ExcelParser:
         try:
             props = wb.properties
             
+            # 单次stat读取文件大小，文件不可访问时为0
+            try:
+                file_size = file_path.stat().st_size
+            except OSError:
+                file_size = 0
+
             metadata = {
                 'title': props.title or '',
                 'creator': props.creator or '',
@@ -166,7 +284,7 @@ class ExcelParser:
                 'last_modified_by': props.lastModifiedBy or '',
                 'version': props.version or '',
                 'file_path': str(file_path),
-                'file_size': file_path.stat().st_size if file_path.exists() else 0,
+                'file_size': file_size,
                 'file_extension': file_path.suffix.lower(),
                 'worksheet_count': len(wb.worksheets),
                 'worksheet_names': wb.sheetnames,
@@ -220,29 +338,28 @@ class ExcelParser:
             dict: 工作表信息，如果工作表为空则返回None
         """
         try:
-            # 确定数据范围
-            if ws.max_row == 1 and ws.max_column == 1:
-                # 检查是否真的为空
-                if not ws.cell(1, 1).value:
-                    return None
+            # 确定数据范围（只读模式下max_row/max_column每次访问都会重新计算，只读取一次）
+            ws_max_row = ws.max_row
+            ws_max_col = ws.max_column
+            max_row = min(ws_max_row, self.max_rows) if self.max_rows else ws_max_row
+            max_col = min(ws_max_col, self.max_cols) if self.max_cols else ws_max_col
             
-            max_row = min(ws.max_row, self.max_rows) if self.max_rows else ws.max_row
-            max_col = min(ws.max_column, self.max_cols) if self.max_cols else ws.max_column
-            
-            # 提取数据
+            # 提取数据，转换时同步跳过完全空白的行（拼接后去空白为空即整行空白）
             data = []
             for row in ws.iter_rows(min_row=1, max_row=max_row, 
                                   min_col=1, max_col=max_col, 
                                   values_only=True):
                 # 转换None为空字符串，其他值转为字符串
-                row_data = [str(cell) if cell is not None else '' for cell in row]
-                data.append(row_data)
-            
-            # 移除完全空白的行
-            data = [row for row in data if any(cell.strip() for cell in row)]
+                row_data = ['' if cell is None else str(cell) for cell in row]
+                if ''.join(row_data).strip():
+                    data.append(row_data)
             
+            # 空工作表在此返回None
             if not data:
                 return None
+
+            # 只读模式的工作表不加载表格定义
+            tables = getattr(ws, 'tables', None) or {}
             
             ws_info = {
                 'index': ws_idx,
@@ -250,10 +367,10 @@ class ExcelParser:
                 'data': data,
                 'rows': len(data),
                 'columns': len(data[0]) if data else 0,
-                'max_row': ws.max_row,
-                'max_column': ws.max_column,
-                'has_tables': len(ws.tables) > 0,
-                'table_names': [table.name for table in ws.tables]
+                'max_row': ws_max_row,
+                'max_column': ws_max_col,
+                'has_tables': len(tables) > 0,
+                'table_names': list(tables)
             }
             
             return ws_info
@@ -276,16 +393,23 @@ class ExcelParser:
             all_tables = []
             
             for ws in wb.worksheets:
-                for table in ws.tables.values():
+                # 只读模式的工作表不加载表格定义
+                tables = getattr(ws, 'tables', None)
+                if not tables:
+                    continue
+
+                for table in tables.values():
                     try:
                         # 获取表格范围
                         table_range = table.ref
+                        min_col, min_row, max_col, max_row = range_boundaries(table_range)
                         
-                        # 提取表格数据
+                        # 提取表格数据，只读取单元格值，不构造Cell对象
                         table_data = []
-                        for row in ws[table_range]:
-                            row_data = [str(cell.value) if cell.value is not None else '' 
-                                      for cell in row]
+                        for row in ws.iter_rows(min_row=min_row, max_row=max_row,
+                                                min_col=min_col, max_col=max_col,
+                                                values_only=True):
+                            row_data = [str(value) if value is not None else '' for value in row]
                             table_data.append(row_data)
                         
                         if table_data:
@@ -326,11 +450,9 @@ class ExcelParser:
             for ws in worksheets:
                 ws_text = [f"=== 工作表: {ws['name']} ==="]
                 
-                for row_idx, row in enumerate(ws['data']):
-                    # 跳过完全空白的行
-                    if any(cell.strip() for cell in row):
-                        row_text = '\t'.join(row)
-                        ws_text.append(f"第{row_idx + 1}行: {row_text}")
+                # 完全空白的行在提取工作表数据时已经移除，无需再次检查
+                ws_text.extend(f"第{row_idx}行: " + '\t'.join(row)
+                               for row_idx, row in enumerate(ws['data'], 1))
                 
                 text_parts.append('\n'.join(ws_text))
             
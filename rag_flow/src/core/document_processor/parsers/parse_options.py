@@ -0,0 +1,34 @@
+"""
+模块名称: parse_options
+功能描述: 解析选项，声明调用方需要的解析结果部分，供各解析器跳过不需要的提取步骤
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ParseOptions:
+    """
+    解析选项数据类
+
+    各字段默认均为True（完整解析）。设为False的部分由解析器跳过，
+    对应的结果字段返回空值（空字符串、空字典或空列表）。
+    """
+    want_text: bool = True
+    want_metadata: bool = True
+    want_tables: bool = True
+    want_images: bool = True
+    want_structure: bool = True
+
+
+# 完整解析
+FULL_PARSE = ParseOptions()
+
+# 仅提取文本内容
+TEXT_ONLY = ParseOptions(want_metadata=False, want_tables=False, want_images=False, want_structure=False)
+
+# 仅提取元数据
+METADATA_ONLY = ParseOptions(want_text=False, want_tables=False, want_images=False, want_structure=False)
@@ -9,6 +9,7 @@
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 import pymupdf
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 # 导入统一日志管理器
@@ -23,9 +24,13 @@ except ImportError:
 from ..extractors.metadata_extractor import MetadataExtractor
 from ..extractors.table_extractor import TableExtractor
 from ..extractors.image_extractor import ImageExtractor
+from .parse_options import ParseOptions, FULL_PARSE
 
+# 并行解析时每个工作进程至少处理的页数，页数较少时进程启动开销大于收益
+_MIN_PAGES_PER_WORKER = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class PDFParseResult:
     """PDF解析结果数据类"""
     text_content: str
@@ -35,6 +40,19 @@ class PDFParseResult:
     page_count: int
     structure_info: Dict[str, Any]
 
+    def to_structured_data(self) -> Dict[str, Any]:
+        """
+        构建统一解析结果使用的结构化数据
+
+        Returns:
+            dict: 结构化数据
+        """
+        return {
+            'tables': self.tables,
+            'images': self.images,
+            'page_count': self.page_count
+        }
+
 
 class PDFParser:
     """
@@ -58,6 +76,7 @@ class PDFParser:
                 - extract_tables (bool): 是否提取表格，默认True
                 - preserve_layout (bool): 是否保持布局，默认True
                 - ocr_enabled (bool): 是否启用OCR，默认False
+                - page_workers (int): 逐页处理使用的工作进程数，默认1（在当前进程串行处理）
         """
         self.config = config or {}
         self.logger = logger
@@ -72,13 +91,15 @@ class PDFParser:
         self.extract_tables = self.config.get('extract_tables', True)
         self.preserve_layout = self.config.get('preserve_layout', True)
         self.ocr_enabled = self.config.get('ocr_enabled', False)
+        self.page_workers = self.config.get('page_workers', 1)
         
-    def parse(self, file_path: str) -> PDFParseResult:
+    def parse(self, file_path: str, options: Optional[ParseOptions] = None) -> PDFParseResult:
         """
         解析PDF文档
         
         Args:
             file_path (str): PDF文件路径
+            options (ParseOptions, optional): 解析选项，默认完整解析
             
         Returns:
             PDFParseResult: 解析结果
@@ -96,28 +117,30 @@ class PDFParser:
             if file_path.suffix.lower() != '.pdf':
                 raise ValueError(f"不支持的文件格式: {file_path.suffix}")
                 
+            options = options or FULL_PARSE
             self.logger.info(f"开始解析PDF文档: {file_path}")
             
             with pymupdf.open(str(file_path)) as doc:
                 # 提取基本信息
                 page_count = len(doc)
-                metadata = self._extract_metadata(doc)
+                metadata = self._extract_metadata(doc) if options.want_metadata else {}
                 
-                # 提取文本内容
-                text_content = self._extract_text(doc)
+                # 文本、表格、图像和页面结构在一次逐页遍历中提取
+                pages = []
+                if (options.want_text or options.want_structure
+                        or (self.extract_tables and options.want_tables)
+                        or (self.extract_images and options.want_images)):
+                    pages = self._process_pages(doc, str(file_path), options)
                 
-                # 提取表格
-                tables = []
-                if self.extract_tables:
-                    tables = self._extract_tables(doc)
+                # 合并文本内容
+                text_content = self._join_page_texts(pages) if options.want_text else ""
                 
-                # 提取图像
-                images = []
-                if self.extract_images:
-                    images = self._extract_images(doc)
+                # 合并表格和图像
+                tables = [table for page in pages for table in page['tables']]
+                images = [image for page in pages for image in page['images']]
                 
                 # 分析文档结构
-                structure_info = self._analyze_structure(doc)
+                structure_info = self._analyze_structure(doc, pages) if options.want_structure else {}
                 
                 result = PDFParseResult(
                     text_content=text_content,
@@ -135,39 +158,161 @@ class PDFParser:
             self.logger.error(f"PDF解析失败: {e}")
             raise
     
-    def _extract_text(self, doc: pymupdf.Document) -> str:
+    def _process_pages(self, doc: pymupdf.Document, file_path: str,
+                       options: ParseOptions) -> List[Dict[str, Any]]:
         """
-        提取文档文本内容
-        
+        逐页提取文本、表格、图像和页面结构
+
+        配置page_workers大于1且页数足够时，按连续页范围分给多个工作进程，
+        每个进程打开自己的文档句柄（PyMuPDF文档对象不能跨线程共享，且页面处理不释放GIL）。
+
         Args:
             doc: PyMuPDF文档对象
+            file_path: PDF文件路径，供工作进程重新打开文档
+            options: 解析选项
+
+        Returns:
+            list: 按页序排列的逐页提取结果
+        """
+        page_count = len(doc)
+        workers = min(self.page_workers, page_count // _MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            return [self._process_page(page, options) for page in doc]
+
+        # 连续页范围，合并时按范围顺序拼接即保持页序
+        step = -(-page_count // workers)
+        page_ranges = [range(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+        self.logger.info(f"并行处理{page_count}页，进程数: {len(page_ranges)}")
+        pages = []
+        with ProcessPoolExecutor(max_workers=len(page_ranges),
+                                 initializer=_init_page_worker,
+                                 initargs=(self.config,)) as executor:
+            for range_pages in executor.map(_process_page_range, [file_path] * len(page_ranges),
+                                            page_ranges, [options] * len(page_ranges)):
+                pages.extend(range_pages)
+        return pages
+
+    def _process_page(self, page: pymupdf.Page, options: ParseOptions) -> Dict[str, Any]:
+        """
+        提取单页的文本、表格、图像和页面结构
+
+        Args:
+            page: PyMuPDF页面对象
+            options: 解析选项
+
+        Returns:
+            dict: 单页提取结果
+        """
+        page_info = {'text': '', 'tables': [], 'images': [], 'page_size': None, 'text_blocks': 0}
+        want_images = self.extract_images and options.want_images
+
+        # 文本、图像和文本块统计共用同一个TextPage，页面内容流只解析一次；
+        # 不需要图像时不在TextPage中保留图像数据
+        textpage = None
+        if options.want_text or want_images or options.want_structure:
+            textpage = self._get_page_textpage(page, want_images)
+
+        if options.want_text:
+            page_info['text'] = self._extract_page_text(page, textpage)
+
+        if self.extract_tables and options.want_tables:
+            page_info['tables'] = self._extract_page_tables(page)
+
+        if want_images or options.want_structure:
+            blocks = self._get_page_blocks(page, textpage)
+
+            if want_images:
+                page_info['images'] = self._extract_page_images(page, blocks)
+
+            if options.want_structure:
+                page_info['page_size'] = {
+                    'width': page.rect.width,
+                    'height': page.rect.height
+                }
+                page_info['text_blocks'] = sum(1 for b in blocks if b.get("type") == 0)
+
+        return page_info
+
+    def _get_page_textpage(self, page: pymupdf.Page, with_images: bool) -> Optional[pymupdf.TextPage]:
+        """
+        创建单页的TextPage，供文本和字典提取共用
+
+        Args:
+            page: PyMuPDF页面对象
+            with_images: 是否保留图像块
+
+        Returns:
+            TextPage: 页面TextPage，创建失败时返回None（各提取步骤单独解析页面）
+        """
+        try:
+            flags = pymupdf.TEXTFLAGS_DICT if with_images else pymupdf.TEXTFLAGS_TEXT
+            return page.get_textpage(flags=flags)
+        except Exception as e:
+            self.logger.warning(f"第{page.number + 1}页TextPage创建失败: {e}")
+            return None
+
+    def _get_page_blocks(self, page: pymupdf.Page, textpage: Optional[pymupdf.TextPage]) -> List[Dict[str, Any]]:
+        """
+        获取单页的文本和图像块
+
+        Args:
+            page: PyMuPDF页面对象
+            textpage: 共用的TextPage，为None时单独解析页面
+
+        Returns:
+            list: 页面块列表
+        """
+        try:
+            if textpage is None:
+                return page.get_text("dict", flags=pymupdf.TEXTFLAGS_DICT)["blocks"]
+            return page.get_text("dict", textpage=textpage)["blocks"]
+        except Exception as e:
+            self.logger.error(f"第{page.number + 1}页内容块提取失败: {e}")
+            return []
+
+    def _extract_page_text(self, page: pymupdf.Page, textpage: Optional[pymupdf.TextPage] = None) -> str:
+        """
+        提取单页文本内容
+        
+        Args:
+            page: PyMuPDF页面对象
+            textpage: 共用的TextPage，保持布局提取时使用
             
         Returns:
             str: 提取的文本内容
         """
         try:
-            text_parts = []
-            
-            for page_num, page in enumerate(doc):
-                if self.ocr_enabled:
-                    # 使用OCR提取文本
-                    tp = page.get_textpage_ocr()
-                    page_text = page.get_text(textpage=tp)
-                else:
-                    # 直接提取文本
-                    if self.preserve_layout:
-                        page_text = page.get_text("text")
-                    else:
-                        page_text = page.get_text("text", flags=pymupdf.TEXT_INHIBIT_SPACES)
-                
-                if page_text.strip():
-                    text_parts.append(f"=== 第{page_num + 1}页 ===\n{page_text}")
-            
-            return "\n\n".join(text_parts)
+            if self.ocr_enabled:
+                # 使用OCR提取文本
+                tp = page.get_textpage_ocr()
+                return page.get_text(textpage=tp)
+
+            # 直接提取文本
+            if self.preserve_layout:
+                return page.get_text("text", textpage=textpage)
+            return page.get_text("text", flags=pymupdf.TEXT_INHIBIT_SPACES)
             
         except Exception as e:
-            self.logger.error(f"文本提取失败: {e}")
+            self.logger.error(f"第{page.number + 1}页文本提取失败: {e}")
             return ""
+
+    @staticmethod
+    def _join_page_texts(pages: List[Dict[str, Any]]) -> str:
+        """
+        合并逐页文本，跳过空白页
+
+        Args:
+            pages: 逐页提取结果
+
+        Returns:
+            str: 文档文本内容
+        """
+        return "\n\n".join(
+            f"=== 第{page_num + 1}页 ===\n{page['text']}"
+            for page_num, page in enumerate(pages)
+            if page['text'].strip()
+        )
     
     def _extract_metadata(self, doc: pymupdf.Document) -> Dict[str, Any]:
         """
@@ -204,96 +349,95 @@ class PDFParser:
             self.logger.error(f"元数据提取失败: {e}")
             return {}
     
-    def _extract_tables(self, doc: pymupdf.Document) -> List[Dict[str, Any]]:
+    def _extract_page_tables(self, page: pymupdf.Page) -> List[Dict[str, Any]]:
         """
-        提取文档中的表格
+        提取单页中的表格
         
         Args:
-            doc: PyMuPDF文档对象
+            page: PyMuPDF页面对象
             
         Returns:
             list: 表格数据列表
         """
+        page_num = page.number
         try:
-            all_tables = []
+            page_tables = []
             
-            for page_num, page in enumerate(doc):
-                # 查找页面中的表格
-                tabs = page.find_tables()
-                
-                for table_idx, table in enumerate(tabs.tables):
-                    try:
-                        # 提取表格数据
-                        table_data = table.extract()
+            # 查找页面中的表格
+            tabs = page.find_tables()
+            
+            for table_idx, table in enumerate(tabs.tables):
+                try:
+                    # 提取表格数据
+                    table_data = table.extract()
+                    
+                    if table_data:
+                        table_info = {
+                            'page_number': page_num + 1,
+                            'table_index': table_idx,
+                            'data': table_data,
+                            'bbox': table.bbox,  # 表格边界框
+                            'rows': len(table_data),
+                            'columns': len(table_data[0]) if table_data else 0
+                        }
+                        page_tables.append(table_info)
                         
-                        if table_data:
-                            table_info = {
-                                'page_number': page_num + 1,
-                                'table_index': table_idx,
-                                'data': table_data,
-                                'bbox': table.bbox,  # 表格边界框
-                                'rows': len(table_data),
-                                'columns': len(table_data[0]) if table_data else 0
-                            }
-                            all_tables.append(table_info)
-                            
-                    except Exception as e:
-                        self.logger.warning(f"第{page_num + 1}页表格{table_idx}提取失败: {e}")
-                        continue
+                except Exception as e:
+                    self.logger.warning(f"第{page_num + 1}页表格{table_idx}提取失败: {e}")
+                    continue
             
-            return all_tables
+            return page_tables
             
         except Exception as e:
-            self.logger.error(f"表格提取失败: {e}")
+            self.logger.error(f"第{page_num + 1}页表格提取失败: {e}")
             return []
     
-    def _extract_images(self, doc: pymupdf.Document) -> List[Dict[str, Any]]:
+    def _extract_page_images(self, page: pymupdf.Page, blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        提取文档中的图像
+        提取单页中的图像
         
         Args:
-            doc: PyMuPDF文档对象
+            page: PyMuPDF页面对象
+            blocks: 页面块列表
             
         Returns:
             list: 图像信息列表
         """
+        page_num = page.number
         try:
-            all_images = []
+            page_images = []
             
-            for page_num, page in enumerate(doc):
-                # 获取页面中的图像块
-                image_blocks = page.get_text("dict", flags=pymupdf.TEXTFLAGS_DICT)["blocks"]
-                
-                for block in image_blocks:
-                    if block.get("type") == 1:  # 图像块
-                        try:
-                            image_info = {
-                                'page_number': page_num + 1,
-                                'bbox': block.get("bbox"),
-                                'width': block.get("width"),
-                                'height': block.get("height"),
-                                'ext': block.get("ext"),
-                                'size': block.get("size"),
-                                'image_data': block.get("image")  # 二进制图像数据
-                            }
-                            all_images.append(image_info)
-                            
-                        except Exception as e:
-                            self.logger.warning(f"第{page_num + 1}页图像提取失败: {e}")
-                            continue
+            for block in blocks:
+                if block.get("type") == 1:  # 图像块
+                    try:
+                        image_info = {
+                            'page_number': page_num + 1,
+                            'bbox': block.get("bbox"),
+                            'width': block.get("width"),
+                            'height': block.get("height"),
+                            'ext': block.get("ext"),
+                            'size': block.get("size"),
+                            'image_data': block.get("image")  # 二进制图像数据
+                        }
+                        page_images.append(image_info)
+                        
+                    except Exception as e:
+                        self.logger.warning(f"第{page_num + 1}页图像提取失败: {e}")
+                        continue
             
-            return all_images
+            return page_images
             
         except Exception as e:
-            self.logger.error(f"图像提取失败: {e}")
+            self.logger.error(f"第{page_num + 1}页图像提取失败: {e}")
             return []
-    
-    def _analyze_structure(self, doc: pymupdf.Document) -> Dict[str, Any]:
+
+    def _analyze_structure(self, doc: pymupdf.Document, pages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         分析文档结构
         
         Args:
             doc: PyMuPDF文档对象
+            pages: 逐页提取结果（包含页面尺寸和文本块数量）
             
         Returns:
             dict: 结构分析信息
@@ -302,8 +446,8 @@ class PDFParser:
             structure = {
                 'has_toc': False,
                 'toc_items': [],
-                'page_sizes': [],
-                'text_blocks_per_page': [],
+                'page_sizes': [page['page_size'] for page in pages],
+                'text_blocks_per_page': [page['text_blocks'] for page in pages],
                 'font_info': {}
             }
             
@@ -313,19 +457,6 @@ class PDFParser:
                 structure['has_toc'] = True
                 structure['toc_items'] = toc
             
-            # 分析每页结构
-            for page in doc:
-                # 页面尺寸
-                structure['page_sizes'].append({
-                    'width': page.rect.width,
-                    'height': page.rect.height
-                })
-                
-                # 文本块数量
-                blocks = page.get_text("dict")["blocks"]
-                text_blocks = [b for b in blocks if b.get("type") == 0]
-                structure['text_blocks_per_page'].append(len(text_blocks))
-            
             return structure
             
         except Exception as e:
@@ -366,3 +497,34 @@ class PDFParser:
             list: 支持的文件扩展名列表
         """
         return ['.pdf']
+
+
+# 工作进程内的解析器实例
+_worker_parser: Optional[PDFParser] = None
+
+
+def _init_page_worker(config: Dict[str, Any]):
+    """
+    初始化逐页处理工作进程
+
+    Args:
+        config (dict): 解析器配置
+    """
+    global _worker_parser
+    _worker_parser = PDFParser(config)
+
+
+def _process_page_range(file_path: str, page_range: range, options: ParseOptions) -> List[Dict[str, Any]]:
+    """
+    在工作进程中处理一段连续页
+
+    Args:
+        file_path (str): PDF文件路径
+        page_range (range): 页码范围（从0开始）
+        options (ParseOptions): 解析选项
+
+    Returns:
+        list: 按页序排列的逐页提取结果
+    """
+    with pymupdf.open(file_path) as doc:
+        return [_worker_parser._process_page(doc[page_num], options) for page_num in page_range]
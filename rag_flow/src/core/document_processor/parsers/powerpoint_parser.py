@@ -23,9 +23,10 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 from ..extractors.metadata_extractor import MetadataExtractor
+from .parse_options import ParseOptions, FULL_PARSE
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerPointParseResult:
     """PowerPoint解析结果数据类"""
     text_content: str
@@ -34,6 +35,18 @@ class PowerPointParseResult:
     notes: List[Dict[str, Any]]
     structure_info: Dict[str, Any]
 
+    def to_structured_data(self) -> Dict[str, Any]:
+        """
+        构建统一解析结果使用的结构化数据
+
+        Returns:
+            dict: 结构化数据
+        """
+        return {
+            'slides': self.slides,
+            'notes': self.notes
+        }
+
 
 class PowerPointParser:
     """
@@ -68,12 +81,13 @@ class PowerPointParser:
         self.extract_shapes = self.config.get('extract_shapes', True)
         self.preserve_slide_structure = self.config.get('preserve_slide_structure', True)
         
-    def parse(self, file_path: str) -> PowerPointParseResult:
+    def parse(self, file_path: str, options: Optional[ParseOptions] = None) -> PowerPointParseResult:
         """
         解析PowerPoint文档
         
         Args:
             file_path (str): PowerPoint文件路径
+            options (ParseOptions, optional): 解析选项，默认完整解析
             
         Returns:
             PowerPointParseResult: 解析结果
@@ -91,27 +105,30 @@ class PowerPointParser:
             if file_path.suffix.lower() not in ['.pptx', '.ppt']:
                 raise ValueError(f"不支持的文件格式: {file_path.suffix}")
                 
+            options = options or FULL_PARSE
             self.logger.info(f"开始解析PowerPoint文档: {file_path}")
             
             # 打开演示文稿
             prs = Presentation(str(file_path))
             
             # 提取元数据
-            metadata = self._extract_metadata(prs, file_path)
+            metadata = self._extract_metadata(prs, file_path) if options.want_metadata else {}
             
-            # 提取幻灯片内容
-            slides = self._extract_slides(prs)
+            # 提取幻灯片内容（文本和结构分析都依赖幻灯片内容）
+            slides = []
+            if options.want_text or options.want_structure:
+                slides = self._extract_slides(prs)
             
             # 提取备注
             notes = []
-            if self.extract_notes:
+            if self.extract_notes and options.want_text:
                 notes = self._extract_notes(prs)
             
             # 生成文本内容
-            text_content = self._generate_text_content(slides, notes)
+            text_content = self._generate_text_content(slides, notes) if options.want_text else ""
             
             # 分析文档结构
-            structure_info = self._analyze_structure(prs, slides)
+            structure_info = self._analyze_structure(prs, slides) if options.want_structure else {}
             
             result = PowerPointParseResult(
                 text_content=text_content,
@@ -142,6 +159,12 @@ class PowerPointParser:
         try:
             core_props = prs.core_properties
             
+            # 单次stat读取文件大小，文件不可访问时为0
+            try:
+                file_size = file_path.stat().st_size
+            except OSError:
+                file_size = 0
+
             metadata = {
                 'title': core_props.title or '',
                 'author': core_props.author or '',
@@ -155,7 +178,7 @@ class PowerPointParser:
                 'revision': core_props.revision,
                 'version': core_props.version or '',
                 'file_path': str(file_path),
-                'file_size': file_path.stat().st_size if file_path.exists() else 0,
+                'file_size': file_size,
                 'file_extension': file_path.suffix.lower(),
                 'slide_count': len(prs.slides),
                 'slide_layouts_count': len(prs.slide_layouts),
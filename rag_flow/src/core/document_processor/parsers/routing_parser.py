@@ -0,0 +1,183 @@
+"""
+模块名称: routing_parser
+功能描述: 路由解析器，按文档复杂度分派解析器：文本型PDF使用PyMuPDF快速解析，复杂文档交由Docling处理
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+from typing import Dict, List, Optional, Any
+from pathlib import Path
+from io import BytesIO
+
+import pymupdf
+
+# 导入统一日志管理器
+try:
+    from src.utils.logger import SZ_LoggerManager
+    logger = SZ_LoggerManager.setup_logger(__name__)
+except ImportError:
+    # 回退到标准logging
+    import logging
+    logger = logging.getLogger(__name__)
+
+from .pdf_parser import PDFParser
+from .docling_parser import DoclingParser, DoclingParseResult, _SUPPORTED_FORMATS
+
+
+class RoutingParser:
+    """
+    路由解析器
+
+    对每个输入文档做轻量检查：PDF的抽样页均含有嵌入文本且没有图片和疑似表格时，
+    使用PyMuPDF快速解析；其余文档（扫描件、含表格或图片的PDF以及其他格式）交由Docling解析。
+    两条路径均返回DoclingParseResult，Docling解析器在首次需要时才创建。
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        初始化路由解析器
+
+        Args:
+            config (dict, optional): 配置参数
+                - docling_config (dict): Docling解析器配置，默认{}
+                - route_sample_pages (int): 抽样检查的页数，默认3
+                - route_min_chars_per_page (int): 抽样页最少文本字符数，默认200
+                - route_max_images (int): 抽样页允许的最多图片数，默认0
+                - route_max_drawings (int): 单页允许的最多矢量绘图数（超过视为疑似表格），默认20
+        """
+        self.config = config or {}
+        self.logger = logger
+
+        self.docling_config = self.config.get('docling_config', {})
+        self.route_sample_pages = self.config.get('route_sample_pages', 3)
+        self.route_min_chars_per_page = self.config.get('route_min_chars_per_page', 200)
+        self.route_max_images = self.config.get('route_max_images', 0)
+        self.route_max_drawings = self.config.get('route_max_drawings', 20)
+
+        # 快速路径只需要文本，跳过表格和图像提取
+        self.fast_parser = PDFParser({'extract_tables': False, 'extract_images': False})
+        self._docling_parser = None
+
+    @property
+    def docling_parser(self) -> DoclingParser:
+        """Docling解析器（首次访问时创建）"""
+        if self._docling_parser is None:
+            self._docling_parser = DoclingParser(self.docling_config)
+        return self._docling_parser
+
+    def parse(self, file_path: str) -> DoclingParseResult:
+        """
+        解析文档
+
+        Args:
+            file_path (str): 文档文件路径
+
+        Returns:
+            DoclingParseResult: 解析结果
+        """
+        file_path = Path(file_path)
+
+        if file_path.suffix.lower() == '.pdf' and self._is_simple_pdf(file_path):
+            self.logger.info(f"路由决策: {file_path.name} -> PyMuPDF快速解析")
+            try:
+                return self._parse_fast(file_path)
+            except Exception as e:
+                self.logger.warning(f"快速解析失败，回退到Docling: {e}")
+
+        self.logger.info(f"路由决策: {file_path.name} -> Docling")
+        return self.docling_parser.parse(str(file_path))
+
+    def parse_stream(self, stream: BytesIO, filename: str) -> DoclingParseResult:
+        """
+        解析文档流（直接交由Docling处理）
+
+        Args:
+            stream (BytesIO): 文档数据流
+            filename (str): 文件名（用于确定格式）
+
+        Returns:
+            DoclingParseResult: 解析结果
+        """
+        return self.docling_parser.parse_stream(stream, filename)
+
+    def _is_simple_pdf(self, file_path: Path) -> bool:
+        """
+        抽样检查PDF是否为可直接提取文本的简单文档
+
+        Args:
+            file_path (Path): PDF文件路径
+
+        Returns:
+            bool: 抽样页均有足够嵌入文本且无图片、无疑似表格时为True
+        """
+        try:
+            with pymupdf.open(str(file_path)) as doc:
+                sample_pages = min(doc.page_count, self.route_sample_pages)
+                if sample_pages == 0:
+                    return False
+
+                for page_index in range(sample_pages):
+                    page = doc[page_index]
+                    if len(page.get_text().strip()) < self.route_min_chars_per_page:
+                        return False
+                    if len(page.get_images()) > self.route_max_images:
+                        return False
+                    if len(page.get_drawings()) > self.route_max_drawings:
+                        return False
+
+            return True
+
+        except Exception as e:
+            self.logger.debug(f"PDF路由检查失败: {e}")
+            return False
+
+    def _parse_fast(self, file_path: Path) -> DoclingParseResult:
+        """
+        使用PyMuPDF解析PDF，并转换为DoclingParseResult格式
+
+        Args:
+            file_path (Path): PDF文件路径
+
+        Returns:
+            DoclingParseResult: 解析结果
+        """
+        pdf_result = self.fast_parser.parse(str(file_path))
+
+        metadata = dict(pdf_result.metadata)
+        metadata.update({
+            'file_name': file_path.name,
+            'file_path': str(file_path),
+            'file_extension': '.pdf',
+            'file_size': file_path.stat().st_size,
+            'parser_type': 'pymupdf',
+            'page_count': pdf_result.page_count,
+            'routed': True,
+        })
+
+        structured_data = {
+            'tables': [],
+            'images': [],
+            'headings': [],
+            'lists': [],
+            'code_blocks': [],
+            'formulas': []
+        }
+
+        return DoclingParseResult(
+            text_content=pdf_result.text_content,
+            metadata=metadata,
+            structured_data=structured_data,
+            structure_info=pdf_result.structure_info,
+            original_format='.pdf'
+        )
+
+    def get_supported_formats(self) -> List[str]:
+        """
+        获取支持的文件格式
+
+        Returns:
+            list: 支持的文件扩展名列表
+        """
+        # 直接读取模块级格式表，不为此创建Docling解析器
+        return list(_SUPPORTED_FORMATS)
@@ -25,9 +25,10 @@ except ImportError:
 
 from ..extractors.metadata_extractor import MetadataExtractor
 from ..extractors.table_extractor import TableExtractor
+from .parse_options import ParseOptions, FULL_PARSE
 
 
-@dataclass
+@dataclass(slots=True)
 class WordParseResult:
     """Word解析结果数据类"""
     text_content: str
@@ -36,6 +37,18 @@ class WordParseResult:
     paragraphs: List[Dict[str, Any]]
     structure_info: Dict[str, Any]
 
+    def to_structured_data(self) -> Dict[str, Any]:
+        """
+        构建统一解析结果使用的结构化数据
+
+        Returns:
+            dict: 结构化数据
+        """
+        return {
+            'tables': self.tables,
+            'paragraphs': self.paragraphs
+        }
+
 
 class WordParser:
     """
@@ -71,12 +84,13 @@ class WordParser:
         self.extract_tables = self.config.get('extract_tables', True)
         self.extract_headers_footers = self.config.get('extract_headers_footers', False)
         
-    def parse(self, file_path: str) -> WordParseResult:
+    def parse(self, file_path: str, options: Optional[ParseOptions] = None) -> WordParseResult:
         """
         解析Word文档
         
         Args:
             file_path (str): Word文件路径
+            options (ParseOptions, optional): 解析选项，默认完整解析
             
         Returns:
             WordParseResult: 解析结果
@@ -94,27 +108,30 @@ class WordParser:
             if file_path.suffix.lower() not in ['.docx', '.doc']:
                 raise ValueError(f"不支持的文件格式: {file_path.suffix}")
                 
+            options = options or FULL_PARSE
             self.logger.info(f"开始解析Word文档: {file_path}")
             
             # 打开文档
             doc = Document(str(file_path))
             
             # 提取元数据
-            metadata = self._extract_metadata(doc, file_path)
+            metadata = self._extract_metadata(doc, file_path) if options.want_metadata else {}
             
-            # 提取段落内容
-            paragraphs = self._extract_paragraphs(doc)
+            # 提取段落内容（文本和结构分析都依赖段落）
+            paragraphs = []
+            if options.want_text or options.want_structure:
+                paragraphs = self._extract_paragraphs(doc)
             
             # 提取文本内容
-            text_content = self._extract_text(paragraphs)
+            text_content = self._extract_text(paragraphs) if options.want_text else ""
             
             # 提取表格
             tables = []
-            if self.extract_tables:
+            if self.extract_tables and options.want_tables:
                 tables = self._extract_tables(doc)
             
             # 分析文档结构
-            structure_info = self._analyze_structure(doc, paragraphs)
+            structure_info = self._analyze_structure(doc, paragraphs) if options.want_structure else {}
             
             result = WordParseResult(
                 text_content=text_content,
@@ -145,6 +162,12 @@ class WordParser:
         try:
             core_props = doc.core_properties
             
+            # 单次stat读取文件大小，文件不可访问时为0
+            try:
+                file_size = file_path.stat().st_size
+            except OSError:
+                file_size = 0
+
             metadata = {
                 'title': core_props.title or '',
                 'author': core_props.author or '',
@@ -158,7 +181,7 @@ class WordParser:
                 'revision': core_props.revision,
                 'version': core_props.version or '',
                 'file_path': str(file_path),
-                'file_size': file_path.stat().st_size if file_path.exists() else 0,
+                'file_size': file_size,
                 'file_extension': file_path.suffix.lower(),
                 'is_word_document': True
             }
@@ -17,7 +17,7 @@ import os
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
-from parsers.docling_parser import DoclingParser, DoclingParseResult, DOCLING_AVAILABLE
+from parsers.docling_parser import DoclingParser, DoclingParseResult, DOCLING_AVAILABLE, _build_converter
 
 
 class TestDoclingParser(unittest.TestCase):
@@ -25,6 +25,9 @@ class TestDoclingParser(unittest.TestCase):
     
     def setUp(self):
         """测试前准备"""
+        # 清空转换器缓存，避免模拟的转换器在用例间复用
+        _build_converter.cache_clear()
+
         self.test_config = {
             'enable_ocr': True,
             'enable_table_structure': True,
@@ -285,7 +288,8 @@ class TestDoclingParser(unittest.TestCase):
         mock_document.iterate_items.return_value = []
         
         mock_conversion_result.document = mock_document
-        mock_converter.convert.return_value = mock_conversion_result
+        mock_converter.convert_all.side_effect = (
+            lambda sources, **kwargs: (mock_conversion_result for _ in sources))
         
         # 执行测试
         parser = DoclingParser()
@@ -302,6 +306,9 @@ class TestDoclingParser(unittest.TestCase):
         for result in results:
             self.assertIsInstance(result, DoclingParseResult)
             self.assertEqual(result.text_content, "Batch converted content")
+        
+        # 两个文件通过一次convert_all调用提交
+        mock_converter.convert_all.assert_called_once()
 
 
 class TestDoclingParserIntegration(unittest.TestCase):
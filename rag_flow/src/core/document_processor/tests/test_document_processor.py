@@ -0,0 +1,246 @@
+"""
+模块名称: test_document_processor
+功能描述: 统一文档处理器单元测试
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+from pathlib import Path
+import types
+import tempfile
+import shutil
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+# 导入被测试的模块（按包导入，解析器模块使用相对导入）
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from document_processor.parsers import document_processor as document_processor_module
+from document_processor.parsers.document_processor import DocumentProcessor, DocumentType
+
+
+def _stub_docling_module(supported_formats):
+    """
+    构建替代docling_parser的桩模块
+
+    Args:
+        supported_formats: Docling支持的扩展名
+
+    Returns:
+        tuple: (桩模块, 模拟的DoclingParser实例)
+    """
+    parser = Mock()
+    parser.parse.return_value = Mock(
+        text_content='docling text',
+        metadata={},
+        structure_info={},
+        to_structured_data=Mock(return_value={})
+    )
+    module = types.ModuleType('docling_parser')
+    module.DOCLING_AVAILABLE = True
+    module._SUPPORTED_FORMATS = dict.fromkeys(supported_formats)
+    module.DoclingParser = Mock(return_value=parser)
+    return module, parser
+
+
+class TestDocumentProcessorRouting(unittest.TestCase):
+    """文档处理器路由测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.docling_module, self.docling_parser = _stub_docling_module(
+            ['.pdf', '.docx', '.doc', '.xlsx', '.xls', '.html', '.md'])
+        patcher = patch.dict(sys.modules, {
+            'document_processor.parsers.docling_parser': self.docling_module
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_file(self, name: str) -> str:
+        """创建测试文件"""
+        file_path = os.path.join(self.temp_dir, name)
+        with open(file_path, 'wb') as f:
+            f.write(b'content')
+        return file_path
+
+    def test_xls_routed_to_docling_when_preferred(self):
+        """测试优先Docling时.xls（仅Docling支持）可以解析"""
+        processor = DocumentProcessor({
+            'use_docling': True,
+            'prefer_docling_for_common_formats': True
+        })
+
+        self.assertTrue(processor.should_use_docling('a.xls'))
+        self.assertIn('.xls', processor.get_supported_formats())
+
+        result = processor.parse(self._make_file('x.xls'))
+
+        self.assertEqual(result.document_type, DocumentType.DOCLING)
+        self.docling_parser.parse.assert_called_once()
+
+    def test_docling_only_format_routed_to_docling(self):
+        """测试Docling独有格式路由到Docling"""
+        processor = DocumentProcessor({'use_docling': True})
+
+        result = processor.parse(self._make_file('page.html'))
+
+        self.assertEqual(result.document_type, DocumentType.DOCLING)
+
+    def test_xls_rejected_without_docling_preference(self):
+        """测试未优先Docling时.xls不被接受"""
+        processor = DocumentProcessor({'use_docling': True})
+
+        self.assertFalse(processor.should_use_docling('a.xls'))
+        with self.assertRaises(ValueError):
+            processor.parse(self._make_file('x.xls'))
+
+    def test_unknown_format_rejected(self):
+        """测试不支持的格式"""
+        processor = DocumentProcessor({'use_docling': False})
+
+        with self.assertRaises(ValueError):
+            processor.parse(self._make_file('x.xyz'))
+
+    def test_missing_file(self):
+        """测试文件不存在"""
+        processor = DocumentProcessor({'use_docling': False})
+
+        with self.assertRaises(FileNotFoundError):
+            processor.parse(os.path.join(self.temp_dir, 'missing.pdf'))
+
+
+
+class _LazyFuture(Future):
+    """取结果时才由执行器按提交顺序执行任务的Future"""
+
+    def __init__(self, executor):
+        super().__init__()
+        self._executor = executor
+
+    def result(self, timeout=None):
+        self._executor.run_until(self)
+        return super().result(timeout)
+
+
+class _RecordingExecutor:
+    """
+    在当前进程中执行任务并记录提交和关闭情况的执行器
+
+    与真实进程池一致：任务崩溃时所有未完成的任务都以BrokenProcessPool失败，
+    之后的提交也会失败。
+    """
+
+    instances = []
+    # 解析时使工作进程异常退出的文件
+    crashing = set()
+
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        self.submitted = []
+        self.shutdown_calls = []
+        self.max_workers = max_workers
+        self.pending = []
+        self.broken = False
+        _RecordingExecutor.instances.append(self)
+
+    def submit(self, fn, file_path):
+        if self.broken:
+            raise BrokenProcessPool('pool is broken')
+        self.submitted.append(file_path)
+        future = _LazyFuture(self)
+        self.pending.append((file_path, future))
+        return future
+
+    def run_until(self, target):
+        """
+        按提交顺序每次并发执行max_workers个任务，直到目标任务完成或进程池损坏
+
+        同一轮中任一任务崩溃时，该轮其他任务及之后的全部任务均失败。
+        """
+        while self.pending and not target.done():
+            batch = self.pending[:self.max_workers]
+            if any(file_path in _RecordingExecutor.crashing for file_path, _ in batch):
+                self.broken = True
+                error = BrokenProcessPool('worker died')
+                for _, future in self.pending:
+                    future.set_exception(error)
+                self.pending = []
+                return
+            del self.pending[:self.max_workers]
+            for file_path, future in batch:
+                future.set_result(file_path)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdown_calls.append(cancel_futures)
+
+
+class TestIterParseBatch(unittest.TestCase):
+    """批量流式解析测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        _RecordingExecutor.instances = []
+        _RecordingExecutor.crashing = set()
+        patcher = patch.object(document_processor_module, 'ProcessPoolExecutor', _RecordingExecutor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.processor = DocumentProcessor({'use_docling': False})
+        self.file_paths = [f'doc_{i}.pdf' for i in range(20)]
+
+    def test_submits_in_bounded_window(self):
+        """测试只按窗口大小提交任务，而不是一次提交全部文件"""
+        results = self.processor.iter_parse_batch(self.file_paths, max_workers=2)
+
+        self.assertEqual(next(results), 'doc_0.pdf')
+        executor = _RecordingExecutor.instances[0]
+        self.assertEqual(len(executor.submitted), 2 * document_processor_module._BATCH_TASKS_PER_WORKER)
+
+        self.assertEqual(list(results), self.file_paths[1:])
+        self.assertEqual(executor.submitted, self.file_paths)
+
+    def test_close_cancels_pending_work(self):
+        """测试提前关闭生成器时取消尚未开始的任务"""
+        results = self.processor.iter_parse_batch(self.file_paths, max_workers=2)
+        next(results)
+        results.close()
+
+        executor = _RecordingExecutor.instances[0]
+        self.assertEqual(executor.shutdown_calls, [True])
+        self.assertLess(len(executor.submitted), len(self.file_paths))
+
+    def test_broken_pool_skips_only_crashing_file(self):
+        """测试工作进程异常退出时只跳过导致退出的文件，其余文件按顺序全部产出"""
+        _RecordingExecutor.crashing = {'doc_3.pdf'}
+
+        with self.assertLogs(self.processor.logger, level='ERROR') as logs:
+            results = list(self.processor.iter_parse_batch(self.file_paths, max_workers=2))
+
+        self.assertEqual(results, [path for path in self.file_paths if path != 'doc_3.pdf'])
+        errors = [record for record in logs.records if record.levelname == 'ERROR']
+        self.assertEqual(len(errors), 1)
+        self.assertIn('doc_3.pdf', errors[0].getMessage())
+        for executor in _RecordingExecutor.instances:
+            self.assertIn(True, executor.shutdown_calls)
+
+    def test_broken_pool_with_several_crashing_files(self):
+        """测试同一窗口内多个文件导致退出时逐个识别"""
+        _RecordingExecutor.crashing = {'doc_1.pdf', 'doc_2.pdf', 'doc_19.pdf'}
+
+        with self.assertLogs(self.processor.logger, level='ERROR'):
+            results = list(self.processor.iter_parse_batch(self.file_paths, max_workers=2))
+
+        self.assertEqual(results, [path for path in self.file_paths
+                                   if path not in _RecordingExecutor.crashing])
+
+
+if __name__ == '__main__':
+    unittest.main()
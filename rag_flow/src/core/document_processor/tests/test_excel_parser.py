@@ -0,0 +1,105 @@
+"""
+模块名称: test_excel_parser
+功能描述: Excel解析器解析结果缓存单元测试
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import tempfile
+import shutil
+import os
+
+# 导入被测试的模块（按包导入，解析器模块使用相对导入）
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from openpyxl import Workbook, load_workbook
+from document_processor.parsers import excel_parser
+from document_processor.parsers.excel_parser import ExcelParser
+
+
+class TestExcelParserCache(unittest.TestCase):
+    """Excel解析结果缓存测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.file_path = os.path.join(self.temp_dir, 'test.xlsx')
+        self._write_workbook('原始内容')
+
+        patcher = patch.object(excel_parser, 'load_workbook', wraps=load_workbook)
+        self.load_workbook = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_workbook(self, value: str):
+        """写入测试工作簿"""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'Sheet1'
+        ws['A1'] = '标题'
+        ws['A2'] = value
+        wb.save(self.file_path)
+
+    def _make_parser(self, **config) -> ExcelParser:
+        """创建启用缓存的解析器"""
+        return ExcelParser({'cache_dir': self.cache_dir, **config})
+
+    def test_cache_hit(self):
+        """测试文件和设置未变化时命中缓存"""
+        first = self._make_parser().parse(self.file_path)
+        second = self._make_parser().parse(self.file_path)
+
+        self.assertEqual(self.load_workbook.call_count, 1)
+        self.assertEqual(second.text_content, first.text_content)
+        self.assertIn('原始内容', second.text_content)
+
+    def test_cache_miss_after_file_change(self):
+        """测试文件内容变化后缓存失效"""
+        self._make_parser().parse(self.file_path)
+        self._write_workbook('修改后内容')
+
+        result = self._make_parser().parse(self.file_path)
+
+        self.assertEqual(self.load_workbook.call_count, 2)
+        self.assertIn('修改后内容', result.text_content)
+        self.assertNotIn('原始内容', result.text_content)
+
+    def test_cache_miss_after_setting_change(self):
+        """测试影响解析结果的设置变化后缓存失效"""
+        self._make_parser(read_only=True).parse(self.file_path)
+
+        self._make_parser(read_only=False).parse(self.file_path)
+        self.assertEqual(self.load_workbook.call_count, 2)
+
+        self._make_parser(read_only=False, data_only=False).parse(self.file_path)
+        self.assertEqual(self.load_workbook.call_count, 3)
+
+        self._make_parser(read_only=False, data_only=False, extract_formulas=True).parse(self.file_path)
+        self.assertEqual(self.load_workbook.call_count, 4)
+
+        self._make_parser(read_only=False, data_only=False, extract_formulas=True).parse(self.file_path)
+        self.assertEqual(self.load_workbook.call_count, 4)
+
+    def test_identical_copy_not_served_from_cache(self):
+        """测试内容相同的另一文件不复用缓存中的元数据"""
+        copy_path = os.path.join(self.temp_dir, 'copy.xlsx')
+        shutil.copyfile(self.file_path, copy_path)
+
+        self._make_parser().parse(self.file_path)
+        result = self._make_parser().parse(copy_path)
+
+        self.assertEqual(self.load_workbook.call_count, 2)
+        self.assertEqual(Path(result.metadata['file_path']).name, 'copy.xlsx')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+模块名称: test_image_extractor
+功能描述: 图像提取器感知哈希去重单元测试
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+import unittest
+from unittest.mock import Mock
+from pathlib import Path
+import io
+
+# 导入被测试的模块（按包导入，解析器模块使用相对导入）
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from document_processor.extractors.image_extractor import ImageExtractor
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+def _png(pattern: str, marker: bool = False) -> bytes:
+    """
+    生成测试用PNG图像
+
+    Args:
+        pattern: 'ascending'（左暗右亮）、'descending'（左亮右暗）或'stripes'（竖条纹），
+            三者的差值哈希（比较水平相邻像素）两两相差至少32位
+        marker: 是否在角落加一个小标记，得到字节不同但感知哈希相近的图像
+
+    Returns:
+        bytes: PNG数据
+    """
+    image = Image.new('L', (90, 80))
+    for x in range(90):
+        for y in range(80):
+            if pattern == 'ascending':
+                value = x * 2
+            elif pattern == 'descending':
+                value = 255 - x * 2
+            else:
+                value = 255 if (x // 10) % 2 else 0
+            image.putpixel((x, y), value)
+    if marker:
+        image.putpixel((1, 1), 255)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@unittest.skipUnless(PIL_AVAILABLE, "需要安装Pillow")
+class TestPhashDedup(unittest.TestCase):
+    """感知哈希去重测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.extractor = self._make_extractor()
+
+    def _make_extractor(self, **config) -> ImageExtractor:
+        """创建启用去重、单线程处理并模拟OCR的提取器"""
+        extractor = ImageExtractor({'enable_phash_dedup': True, 'max_workers': 1, **config})
+        extractor.extract_text_from_images = True
+        extractor.ocr_available = True
+        extractor._extract_text_from_image = Mock(side_effect=lambda data: f'ocr-{len(data)}')
+        return extractor
+
+    def _process(self, extractor: ImageExtractor, *images: bytes):
+        """按一批处理图像"""
+        return extractor.process_images([(data, {'ext': 'png'}, None) for data in images])
+
+    def test_identical_image_reuses_result(self):
+        """测试字节完全相同的图像复用已处理结果和OCR文本"""
+        image = _png('ascending')
+        first, second = self._process(self.extractor, image, image)
+
+        self.assertNotIn('duplicate_of', first.metadata)
+        self.assertEqual(second.metadata['duplicate_of'], first.info.image_id)
+        self.assertEqual(second.extracted_text, first.extracted_text)
+        self.assertEqual(self.extractor._extract_text_from_image.call_count, 1)
+
+    def test_near_duplicate_runs_own_ocr(self):
+        """测试感知哈希相近但字节不同的图像不复用OCR文本"""
+        original = _png('ascending')
+        near = _png('ascending', marker=True)
+        self.assertNotEqual(original, near)
+
+        first, second = self._process(self.extractor, original, near)
+
+        self.assertEqual(second.metadata['duplicate_of'], first.info.image_id)
+        self.assertEqual(self.extractor._extract_text_from_image.call_count, 2)
+        self.assertEqual(second.extracted_text, f'ocr-{len(near)}')
+
+    def test_different_images_not_deduplicated(self):
+        """测试内容不同的图像分别处理"""
+        results = self._process(self.extractor, _png('ascending'), _png('descending'), _png('stripes'))
+
+        self.assertTrue(all('duplicate_of' not in result.metadata for result in results))
+        self.assertEqual(self.extractor._extract_text_from_image.call_count, 3)
+
+    def test_cache_cleared_per_batch(self):
+        """测试每批图像开始时清空缓存，不跨文档复用"""
+        image = _png('ascending')
+        self._process(self.extractor, image)
+        (result,) = self._process(self.extractor, image)
+
+        self.assertNotIn('duplicate_of', result.metadata)
+        self.assertEqual(self.extractor._extract_text_from_image.call_count, 2)
+
+    def test_cache_size_bounded(self):
+        """测试缓存按LRU淘汰，超过上限后最早的图像不再命中"""
+        extractor = self._make_extractor(phash_cache_size=2)
+        ascending = _png('ascending')
+        results = self._process(extractor, ascending, _png('descending'), _png('stripes'), ascending)
+
+        self.assertEqual(len(extractor._phash_cache), 2)
+        self.assertNotIn('duplicate_of', results[-1].metadata)
+
+    def test_cache_hit_refreshes_entry(self):
+        """测试命中的条目移到最近使用位置，不被优先淘汰"""
+        extractor = self._make_extractor(phash_cache_size=2)
+        ascending = _png('ascending')
+        results = self._process(extractor, ascending, _png('descending'), ascending,
+                                _png('stripes'), ascending)
+
+        self.assertIn('duplicate_of', results[2].metadata)
+        self.assertIn('duplicate_of', results[-1].metadata)
+
+    def test_dedup_disabled_by_default(self):
+        """测试默认不启用去重"""
+        extractor = ImageExtractor({'max_workers': 1})
+        image = _png('ascending')
+        results = self._process(extractor, image, image)
+
+        self.assertTrue(all('duplicate_of' not in result.metadata for result in results))
+        self.assertEqual(len(extractor._phash_cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+模块名称: test_metadata_extractor
+功能描述: 元数据提取器内容统计单元测试
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+import unittest
+from pathlib import Path
+
+# 导入被测试的模块（按包导入，解析器模块使用相对导入）
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from document_processor.extractors.metadata_extractor import MetadataExtractor
+
+
+class TestContentStatistics(unittest.TestCase):
+    """内容统计测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.extractor = MetadataExtractor()
+
+    def test_lone_surrogate(self):
+        """测试含孤立代理项的文本（常见于PDF提取结果）仍能统计"""
+        stats = self.extractor.extract_content_statistics('中文\ud800 abc')
+
+        self.assertEqual(stats['chinese_character_count'], 2)
+        self.assertEqual(stats['word_count'], 2)
+        self.assertEqual(stats['english_word_count'], 1)
+
+    def test_stream_matches_whole_text(self):
+        """测试流式统计与完整文本统计结果一致，包括跨块的单词、换行和段落"""
+        text = '第一段 hello wor\r\nld\n\n\n第二段  中文内容\n\n  \n\nlast paragraph'
+        expected = self.extractor.extract_content_statistics(text)
+
+        for size in (1, 2, 3, 7, len(text)):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            with self.subTest(chunk_size=size):
+                self.assertEqual(self.extractor.extract_content_statistics_stream(chunks), expected)
+
+    def test_stream_empty(self):
+        """测试空输入"""
+        self.assertEqual(self.extractor.extract_content_statistics_stream(['', '']), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
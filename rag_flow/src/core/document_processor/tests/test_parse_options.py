@@ -0,0 +1,84 @@
+"""
+模块名称: test_parse_options
+功能描述: 解析选项单元测试
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+import unittest
+from dataclasses import FrozenInstanceError, astuple
+from pathlib import Path
+import tempfile
+import shutil
+import os
+
+# 导入被测试的模块（按包导入，解析器模块使用相对导入）
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from openpyxl import Workbook
+from document_processor.parsers.parse_options import ParseOptions, FULL_PARSE, TEXT_ONLY, METADATA_ONLY
+from document_processor.parsers.excel_parser import ExcelParser
+
+
+class TestParseOptions(unittest.TestCase):
+    """解析选项测试类"""
+
+    def test_presets(self):
+        """测试预置选项"""
+        self.assertTrue(all(astuple(FULL_PARSE)))
+        self.assertEqual(FULL_PARSE, ParseOptions())
+
+        self.assertTrue(TEXT_ONLY.want_text)
+        self.assertEqual(sum(astuple(TEXT_ONLY)), 1)
+
+        self.assertTrue(METADATA_ONLY.want_metadata)
+        self.assertEqual(sum(astuple(METADATA_ONLY)), 1)
+
+    def test_frozen_and_hashable(self):
+        """测试选项不可修改且可作为缓存键"""
+        with self.assertRaises(FrozenInstanceError):
+            FULL_PARSE.want_text = False
+
+        self.assertEqual(hash(TEXT_ONLY), hash(ParseOptions(
+            want_metadata=False, want_tables=False, want_images=False, want_structure=False)))
+        self.assertNotEqual(TEXT_ONLY, METADATA_ONLY)
+
+
+class TestParseOptionsInExcelParser(unittest.TestCase):
+    """解析器按选项跳过提取步骤的测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, 'test.xlsx')
+        wb = Workbook()
+        wb.active['A1'] = '内容'
+        wb.save(self.file_path)
+        self.parser = ExcelParser()
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_text_only(self):
+        """测试仅提取文本时跳过元数据、表格和结构分析"""
+        result = self.parser.parse(self.file_path, TEXT_ONLY)
+
+        self.assertIn('内容', result.text_content)
+        self.assertEqual(result.metadata, {})
+        self.assertEqual(result.tables, [])
+        self.assertEqual(result.structure_info, {})
+
+    def test_metadata_only(self):
+        """测试仅提取元数据时不生成文本和工作表数据"""
+        result = self.parser.parse(self.file_path, METADATA_ONLY)
+
+        self.assertEqual(result.text_content, '')
+        self.assertEqual(result.worksheets, [])
+        self.assertTrue(result.metadata)
+
+
+if __name__ == '__main__':
+    unittest.main()
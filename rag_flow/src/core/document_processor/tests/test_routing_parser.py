@@ -0,0 +1,147 @@
+"""
+模块名称: test_routing_parser
+功能描述: 路由解析器单元测试
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+from pathlib import Path
+import tempfile
+import shutil
+import os
+
+# 导入被测试的模块（按包导入，解析器模块使用相对导入）
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+try:
+    import pymupdf  # noqa: F401
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+if PYMUPDF_AVAILABLE:
+    from document_processor.parsers import routing_parser
+    from document_processor.parsers.routing_parser import RoutingParser
+    from document_processor.parsers.docling_parser import _SUPPORTED_FORMATS
+
+
+def _mock_pdf(pages):
+    """
+    构建模拟的pymupdf文档对象
+
+    Args:
+        pages: (文本, 图片数, 矢量绘图数) 元组列表
+
+    Returns:
+        MagicMock: 支持上下文管理器、page_count和按索引取页的文档对象
+    """
+    page_mocks = []
+    for text, images, drawings in pages:
+        page = Mock()
+        page.get_text.return_value = text
+        page.get_images.return_value = [object()] * images
+        page.get_drawings.return_value = [object()] * drawings
+        page_mocks.append(page)
+
+    doc = MagicMock()
+    doc.__enter__.return_value = doc
+    doc.page_count = len(page_mocks)
+    doc.__getitem__.side_effect = page_mocks.__getitem__
+    return doc
+
+
+@unittest.skipUnless(PYMUPDF_AVAILABLE, "需要安装pymupdf")
+class TestRoutingParser(unittest.TestCase):
+    """路由解析器测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_path = os.path.join(self.temp_dir, 'test.pdf')
+        with open(self.pdf_path, 'wb') as f:
+            f.write(b'%PDF-1.4')
+
+        self.parser = RoutingParser({'route_sample_pages': 2, 'route_min_chars_per_page': 10})
+        self.parser._docling_parser = Mock()
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _is_simple(self, pages) -> bool:
+        """以模拟的页面内容执行简单PDF检查"""
+        with patch.object(routing_parser.pymupdf, 'open', return_value=_mock_pdf(pages)):
+            return self.parser._is_simple_pdf(Path(self.pdf_path))
+
+    def test_text_pdf_is_simple(self):
+        """测试抽样页文本充足且无图片和表格时走快速路径"""
+        self.assertTrue(self._is_simple([('x' * 10, 0, 0), ('y' * 10, 0, 20)]))
+
+    def test_only_sample_pages_checked(self):
+        """测试只检查抽样页，后续页不影响判断"""
+        self.assertTrue(self._is_simple([('x' * 10, 0, 0), ('y' * 10, 0, 0), ('', 5, 100)]))
+
+    def test_thresholds(self):
+        """测试文本、图片和矢量绘图阈值"""
+        self.assertFalse(self._is_simple([('x' * 10, 0, 0), ('short', 0, 0)]))
+        self.assertFalse(self._is_simple([('   ' + 'x' * 9 + '   ', 0, 0)]))
+        self.assertFalse(self._is_simple([('x' * 10, 1, 0)]))
+        self.assertFalse(self._is_simple([('x' * 10, 0, 21)]))
+
+    def test_empty_or_unreadable_pdf_not_simple(self):
+        """测试空文档或无法打开的文档交由Docling处理"""
+        self.assertFalse(self._is_simple([]))
+        with patch.object(routing_parser.pymupdf, 'open', side_effect=RuntimeError('broken')):
+            self.assertFalse(self.parser._is_simple_pdf(Path(self.pdf_path)))
+
+    def test_simple_pdf_uses_fast_path(self):
+        """测试简单PDF使用PyMuPDF快速解析"""
+        self.parser.fast_parser = Mock()
+        self.parser.fast_parser.parse.return_value = Mock(
+            text_content='fast text', metadata={}, page_count=1, structure_info={})
+
+        with patch.object(routing_parser.pymupdf, 'open', return_value=_mock_pdf([('x' * 10, 0, 0)])):
+            result = self.parser.parse(self.pdf_path)
+
+        self.assertEqual(result.text_content, 'fast text')
+        self.assertEqual(result.metadata['parser_type'], 'pymupdf')
+        self.parser._docling_parser.parse.assert_not_called()
+
+    def test_fast_path_failure_falls_back_to_docling(self):
+        """测试快速解析失败时回退到Docling"""
+        self.parser.fast_parser = Mock()
+        self.parser.fast_parser.parse.side_effect = RuntimeError('fast parse failed')
+
+        with patch.object(routing_parser.pymupdf, 'open', return_value=_mock_pdf([('x' * 10, 0, 0)])):
+            result = self.parser.parse(self.pdf_path)
+
+        self.parser._docling_parser.parse.assert_called_once_with(self.pdf_path)
+        self.assertIs(result, self.parser._docling_parser.parse.return_value)
+
+    def test_complex_pdf_routed_to_docling(self):
+        """测试复杂PDF直接交由Docling解析"""
+        self.parser.fast_parser = Mock()
+
+        with patch.object(routing_parser.pymupdf, 'open', return_value=_mock_pdf([('x' * 10, 3, 0)])):
+            self.parser.parse(self.pdf_path)
+
+        self.parser.fast_parser.parse.assert_not_called()
+        self.parser._docling_parser.parse.assert_called_once_with(self.pdf_path)
+
+    def test_get_supported_formats_does_not_build_docling(self):
+        """测试获取支持格式时不创建Docling解析器"""
+        parser = RoutingParser()
+
+        with patch.object(routing_parser, 'DoclingParser') as docling_cls:
+            formats = parser.get_supported_formats()
+
+        docling_cls.assert_not_called()
+        self.assertEqual(formats, list(_SUPPORTED_FORMATS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+模块名称: test_table_extractor
+功能描述: 表格提取器单元测试，固定重写前实现的输出结果
+创建日期: 2024-12-20
+作者: Sniperz
+版本: v1.0.0
+"""
+
+import unittest
+from unittest.mock import patch
+from dataclasses import astuple
+from pathlib import Path
+
+# 导入被测试的模块（按包导入，解析器模块使用相对导入）
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from document_processor.extractors import table_extractor
+from document_processor.extractors.table_extractor import TableExtractor, _classify
+
+
+def _large_cell(i: int, j: int) -> str:
+    """生成大表格的单元格：列按5种类型轮换，每10行在非数字列留空"""
+    kind = j % 5
+    if i % 10 == 9 and kind != 0:
+        return ''
+    if kind == 0:
+        return str(i)
+    if kind == 1:
+        return f'{i}.5%'
+    if kind == 2:
+        return f'2024-01-{i % 28 + 1:02d}'
+    if kind == 3:
+        return f'item {i % 7}'
+    return 'n/a' if i % 2 else str(i)
+
+
+# 120行数据加表头，共12100个单元格，超过_NUMBA_MIN_CELLS，走类型编码矩阵统计路径
+LARGE_TABLE = [[f'H{j}' for j in range(100)]] + [[_large_cell(i, j) for j in range(100)] for i in range(120)]
+
+MIXED_TABLE = [
+    ['Name', 'Age', 'Score', 'Joined'],
+    ['Alice', '30', '95.5%', '2024-01-15'],
+    ['Bob', '25', '88%', '2023/12/01'],
+    ['', '', '', ''],
+    ['Carol ', ' 41', '=SUM(A1)', '01/02/2024'],
+]
+
+
+class TestTableExtractor(unittest.TestCase):
+    """表格提取器测试类（期望值取自重写前的逐单元格实现）"""
+
+    def test_classify(self):
+        """测试单元格数据类型分类"""
+        cases = {
+            '': 'empty', '12': 'number', '-3.5': 'number', '3.': 'number', '45%': 'percentage',
+            '-1.5%': 'percentage', '2024-01-15': 'date', '01/02/2024': 'date', '2023/12/01': 'text',
+            '=SUM(A1)': 'formula', '12a': 'text', '1.2.3': 'text', 'x' * 100: 'text', '1' * 100: 'number',
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value[:10]):
+                self.assertEqual(_classify(value), expected)
+
+    def test_long_values_not_cached(self):
+        """测试只缓存短值的分类结果"""
+        table_extractor._classify_short.cache_clear()
+        _classify('x' * table_extractor._INTERN_MAX_LENGTH)
+        _classify('short')
+        self.assertEqual(table_extractor._classify_short.cache_info().currsize, 1)
+
+    def test_mixed_table(self):
+        """测试清洗、表头检测、类型统计、质量评分和文本格式化"""
+        result = TableExtractor().process_table(MIXED_TABLE)
+
+        self.assertEqual(result.metadata, {
+            'total_cells': 16,
+            'non_empty_cells': 16,
+            'data_types': {'text': 8, 'number': 3, 'percentage': 2, 'date': 2, 'formula': 1},
+            'column_stats': [
+                {'column_index': 0, 'total_values': 4, 'non_empty_values': 4, 'empty_ratio': 0.0,
+                 'dominant_type': 'text', 'unique_values': 4},
+                {'column_index': 1, 'total_values': 4, 'non_empty_values': 4, 'empty_ratio': 0.0,
+                 'dominant_type': 'number', 'unique_values': 4},
+                {'column_index': 2, 'total_values': 4, 'non_empty_values': 4, 'empty_ratio': 0.0,
+                 'dominant_type': 'percentage', 'unique_values': 4},
+                {'column_index': 3, 'total_values': 4, 'non_empty_values': 4, 'empty_ratio': 0.0,
+                 'dominant_type': 'text', 'unique_values': 4},
+            ]
+        })
+        self.assertEqual(result.quality_score, 0.79)
+        self.assertEqual(result.formatted_text,
+                         'Name | Age | Score | Joined\n'
+                         '---------------------------\n'
+                         'Alice | 30 | 95.5% | 2024-01-15\n'
+                         'Bob | 25 | 88% | 2023/12/01\n'
+                         'Carol | 41 | =SUM(A1) | 01/02/2024')
+
+        structure = result.structure
+        self.assertEqual((structure.rows, structure.columns, structure.has_header), (4, 4, True))
+        self.assertEqual(structure.header_row, ['Name', 'Age', 'Score', 'Joined'])
+        self.assertEqual(structure.data_rows[-1], ['Carol', '41', '=SUM(A1)', '01/02/2024'])
+
+    def test_empty_lines_removed(self):
+        """测试移除空行和空列并压缩单元格内空白（NumPy向量化路径与纯Python路径）"""
+        table = [['a', '', ' b'], ['', ' ', ''], ['1', '', '2'], ['3', '', 'x\t y']]
+        for numpy_available in sorted({table_extractor.NUMPY_AVAILABLE, False}):
+            with self.subTest(numpy_available=numpy_available), \
+                    patch.object(table_extractor, 'NUMPY_AVAILABLE', numpy_available):
+                result = TableExtractor().process_table(table)
+
+                self.assertEqual(result.formatted_text, 'a | b\n-----\n1 | 2\n3 | x y')
+                self.assertEqual(result.metadata['data_types'], {'text': 3, 'number': 3})
+                self.assertEqual([c['dominant_type'] for c in result.metadata['column_stats']],
+                                 ['number', 'text'])
+                self.assertEqual(result.quality_score, 0.75)
+
+    def test_cells_emitted_only_on_request(self):
+        """测试默认不生成单元格集合，启用emit_cells时与逐单元格结果一致"""
+        self.assertIsNone(TableExtractor().process_table(MIXED_TABLE).structure.cells)
+
+        cells = TableExtractor({'emit_cells': True}).process_table(MIXED_TABLE).structure.cells
+        self.assertEqual(len(cells), 16)
+        self.assertEqual(astuple(cells[0]), ('Name', 0, 0, True, False, 'text'))
+        self.assertEqual(astuple(cells[11]), ('2023/12/01', 2, 3, False, False, 'text'))
+        self.assertEqual(astuple(cells[-2]), ('=SUM(A1)', 3, 2, False, False, 'formula'))
+        self.assertEqual([cell.data_type for cell in cells][4:8], ['text', 'number', 'percentage', 'date'])
+
+    def _assert_large_table(self):
+        """校验大表格的统计结果"""
+        result = TableExtractor().process_table(LARGE_TABLE)
+        metadata = result.metadata
+
+        self.assertEqual(metadata['total_cells'], 12100)
+        self.assertEqual(metadata['non_empty_cells'], 11140)
+        self.assertEqual(metadata['data_types'], {
+            'text': 3220, 'number': 3600, 'percentage': 2160, 'date': 2160, 'empty': 960})
+        self.assertEqual(metadata['column_stats'][:5], [
+            {'column_index': 0, 'total_values': 121, 'non_empty_values': 121, 'empty_ratio': 0.0,
+             'dominant_type': 'number', 'unique_values': 121},
+            {'column_index': 1, 'total_values': 121, 'non_empty_values': 109,
+             'empty_ratio': 0.09917355371900827, 'dominant_type': 'percentage', 'unique_values': 109},
+            {'column_index': 2, 'total_values': 121, 'non_empty_values': 109,
+             'empty_ratio': 0.09917355371900827, 'dominant_type': 'date', 'unique_values': 29},
+            {'column_index': 3, 'total_values': 121, 'non_empty_values': 109,
+             'empty_ratio': 0.09917355371900827, 'dominant_type': 'text', 'unique_values': 8},
+            {'column_index': 4, 'total_values': 121, 'non_empty_values': 109,
+             'empty_ratio': 0.09917355371900827, 'dominant_type': 'number', 'unique_values': 62},
+        ])
+        for stats in metadata['column_stats']:
+            self.assertEqual(stats, dict(metadata['column_stats'][stats['column_index'] % 5],
+                                         column_index=stats['column_index']))
+        self.assertEqual(result.quality_score, 0.954)
+        self.assertTrue(result.structure.has_header)
+
+    def test_large_table(self):
+        """测试大表格（默认统计路径，Numba可用时使用编译内核）"""
+        self._assert_large_table()
+
+    @unittest.skipUnless(table_extractor.NUMPY_AVAILABLE, "需要安装numpy")
+    def test_large_table_numpy_fallback(self):
+        """测试Numba不可用时NumPy统计路径的结果一致"""
+        with patch.object(table_extractor, '_column_type_kernel', False):
+            self._assert_large_table()
+
+    def test_large_table_without_numpy(self):
+        """测试NumPy不可用时纯Python路径的结果一致"""
+        with patch.object(table_extractor, 'NUMPY_AVAILABLE', False):
+            self._assert_large_table()
+
+
+if __name__ == '__main__':
+    unittest.main()